@@ -1,5 +1,10 @@
+import multiprocessing
+
 from shortdeck_cli.cli import cli_main
 
 
 if __name__ == "__main__":
+    # The Windows exe is frozen with PyInstaller: worker processes spawned by
+    # --workers re-run this script and must become pool workers, not the CLI.
+    multiprocessing.freeze_support()
     cli_main()
@@ -0,0 +1,90 @@
+"""Incremental parsing of the table's action log across OCR frames.
+
+The action log scrolls: each frame shows the latest lines, most of them
+already seen in the previous frame. ``ActionLogTracker`` lines the new frame
+up against the previous one (the longest run of previous trailing lines that
+starts the new frame) and parses only the lines after it, appending their
+actions to a per-hand timeline. A new hero hand starts a new timeline; log
+lines left over from the previous hand are not counted in it.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from shortdeck_cli.rules import ACTIONS, POSITIONS
+
+ACTION_LINE_RE = re.compile(r"\b(utg|mp1|mp2|hj|co|btn)\s+(fold|limp|all-in)\b")
+
+
+@dataclass(frozen=True)
+class LoggedAction:
+    position: str
+    action: str
+
+
+def normalize_log_lines(text: str) -> list[str]:
+    lines = []
+    for raw_line in text.splitlines():
+        line = re.sub(r"\s+", " ", raw_line.lower().replace("all in", "all-in")).strip()
+        if line:
+            lines.append(line)
+    return lines
+
+
+def parse_log_line(line: str) -> list[LoggedAction]:
+    return [
+        LoggedAction(position=position.upper(), action=action)
+        for position, action in ACTION_LINE_RE.findall(line)
+        if action in ACTIONS
+    ]
+
+
+def _new_line_start(previous: list[str], current: list[str]) -> int:
+    """Index of the first line of ``current`` not already shown in ``previous``.
+
+    Only the tail of ``previous`` that reappears at the head of ``current``
+    counts as already shown; any other line is new, even when its text
+    repeats an earlier action.
+    """
+    for overlap in range(min(len(previous), len(current)), 0, -1):
+        if previous[-overlap:] == current[:overlap]:
+            return overlap
+    return 0
+
+
+class ActionLogTracker:
+    """Per-hand timeline of every action read from the action log."""
+
+    def __init__(self):
+        self.hero_hand: str | None = None
+        self.timeline: list[LoggedAction] = []
+        self._lines: list[str] = []
+
+    def reset(self, hero_hand: str | None = None) -> None:
+        self.hero_hand = hero_hand
+        self.timeline = []
+        self._lines = []
+
+    def update(self, hero_hand: str | None, action_text: str) -> list[LoggedAction]:
+        """Consume one frame of action-log OCR text; returns the actions on lines not seen before."""
+        if hero_hand is not None and hero_hand != self.hero_hand:
+            # New hand, new timeline. Lines still visible from the last hand
+            # stay aligned against, so they are not replayed into this one.
+            self.hero_hand = hero_hand
+            self.timeline = []
+        lines = normalize_log_lines(action_text)
+        start = _new_line_start(self._lines, lines)
+        self._lines = lines
+        new_actions = [action for line in lines[start:] for action in parse_log_line(line)]
+        self.timeline.extend(new_actions)
+        return new_actions
+
+    def villain_action(self, hero_position: str) -> tuple[str, str] | None:
+        """Latest action this hand by a position that acts before the hero."""
+        valid_villains = POSITIONS[:POSITIONS.index(hero_position)]
+        for logged in reversed(self.timeline):
+            if logged.position in valid_villains:
+                return logged.position, logged.action
+        return None
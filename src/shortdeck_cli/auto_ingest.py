@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, replace
 from json import JSONDecodeError, loads
 from pathlib import Path
-from typing import Protocol
+from typing import BinaryIO, Protocol
+
+from shortdeck_cli.file_watch import InotifyWaiter, StatPollWaiter, file_waiter
+
+# Observations buffered per source before a multi-source reader pauses it.
+DEFAULT_QUEUE_SIZE = 8
 
 
 @dataclass(frozen=True)
@@ -16,15 +24,94 @@ class Observation:
     villain_action: str | None = None
     confidence: float | None = None
     source: str | None = None
+    game_format: str | None = None
+    stack_depth: int | None = None
+    # Unix time the observation was made (capture time, or when it was read).
+    observed_at: float | None = None
 
 
 class ObservationSource(Protocol):
+    """Sources may also define ``wait(timeout)`` to block until new data may be
+    available; auto mode then uses it instead of sleeping a fixed interval."""
+
     def next_observation(self) -> Observation | None:
         """Return a new observation when available, else None."""
 
 
+def parse_observation_line(line: str) -> Observation | None:
+    """Parse one JSONL line into an observation; ``None`` for blank or invalid lines."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        payload = loads(line)
+    except JSONDecodeError:
+        return None
+    return _observation_from_payload(payload)
+
+
+def _observation_from_payload(payload) -> Observation | None:
+    if not isinstance(payload, dict):
+        return None
+
+    hero_hand = payload.get("hero_hand")
+    hero_position = payload.get("hero_position")
+    if not isinstance(hero_hand, str) or not isinstance(hero_position, str):
+        return None
+
+    villain_position = payload.get("villain_position")
+    villain_action = payload.get("villain_action")
+    confidence = payload.get("confidence")
+    source = payload.get("source")
+    game_format = payload.get("game_format")
+    stack_depth = payload.get("stack_depth")
+    observed_at = payload.get("observed_at")
+
+    if villain_position is not None and not isinstance(villain_position, str):
+        villain_position = None
+    if villain_action is not None and not isinstance(villain_action, str):
+        villain_action = None
+    if confidence is not None:
+        try:
+            confidence = float(confidence)
+        except (TypeError, ValueError):
+            confidence = None
+    if source is not None and not isinstance(source, str):
+        source = None
+    if game_format is not None and not isinstance(game_format, str):
+        game_format = None
+    if stack_depth is not None:
+        try:
+            stack_depth = int(stack_depth)
+        except (TypeError, ValueError):
+            stack_depth = None
+    if observed_at is not None:
+        try:
+            observed_at = float(observed_at)
+        except (TypeError, ValueError):
+            observed_at = None
+
+    return Observation(
+        hero_hand=hero_hand,
+        hero_position=hero_position,
+        villain_position=villain_position,
+        villain_action=villain_action,
+        confidence=confidence,
+        source=source,
+        game_format=game_format,
+        stack_depth=stack_depth,
+        observed_at=observed_at,
+    )
+
+
+def _stamped(observation: Observation | None) -> Observation | None:
+    if observation is None or observation.observed_at is not None:
+        return observation
+    return replace(observation, observed_at=time.time())
+
+
 class JsonlObservationSource:
-    """Poll observations from a JSON Lines file.
+    """Follow a JSON Lines file like ``tail -F``.
 
     Each line must be a JSON object with at least:
     - hero_hand
@@ -34,62 +121,110 @@ class JsonlObservationSource:
     - villain_action
     - confidence
     - source
+    - game_format (e.g. "5max-50a")
+    - stack_depth (big blinds)
+    - observed_at (Unix time; defaults to when the line is read)
+
+    The file stays open and each poll reads only the bytes appended since the
+    last one, so polling cost does not grow with the file. A trailing line
+    without a newline is held back until it is complete (or parses as a whole
+    JSON object). A smaller file means it was truncated and is re-read from
+    the start; a new inode means it was rotated, so the rest of the old file
+    is drained before the new one is opened.
+
+    ``wait`` blocks until the file changes (inotify on Linux, see
+    ``file_watch``), so auto mode reacts to appends without a poll delay.
     """
 
     def __init__(self, file_path: str | Path):
         self.file_path = Path(file_path)
-        self._line_index = 0
+        self._waiter: InotifyWaiter | StatPollWaiter | None = None
+        self._handle: BinaryIO | None = None
+        self._inode: int | None = None
+        self._offset = 0
+        self._partial = b""
+        self._lines: deque[bytes] = deque()
 
     def next_observation(self) -> Observation | None:
-        if not self.file_path.exists():
-            return None
+        while True:
+            while self._lines:
+                observation = self._parse(self._lines.popleft())
+                if observation is not None:
+                    return observation
+            if not self._read_appended():
+                break
+
+        if self._partial:
+            try:
+                payload = loads(self._partial)
+            except (JSONDecodeError, UnicodeDecodeError):
+                return None
+            self._partial = b""
+            return _stamped(_observation_from_payload(payload))
+        return None
 
-        lines = self.file_path.read_text(encoding="utf-8").splitlines()
-        if self._line_index >= len(lines):
+    def wait(self, timeout: float) -> bool:
+        """Block until the file may have new data; ``False`` when ``timeout`` passed quietly."""
+        if self._waiter is None:
+            # Anything appended before the watch existed would not wake it,
+            # so report a change once and let the caller read again.
+            self._waiter = file_waiter(self.file_path)
+            return True
+        return self._waiter.wait(timeout)
+
+    def close(self) -> None:
+        if self._waiter is not None:
+            self._waiter.close()
+            self._waiter = None
+        self._close_handle()
+
+    def _close_handle(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+        self._handle = None
+        self._inode = None
+        self._offset = 0
+        self._partial = b""
+
+    @staticmethod
+    def _parse(raw_line: bytes) -> Observation | None:
+        try:
+            return _stamped(parse_observation_line(raw_line.decode("utf-8")))
+        except UnicodeDecodeError:
             return None
 
-        while self._line_index < len(lines):
-            line = lines[self._line_index].strip()
-            self._line_index += 1
-            if not line:
-                continue
+    def _read_appended(self) -> bool:
+        """Read new bytes into the line queue; ``True`` when complete lines were added."""
+        self._sync_handle()
+        if self._handle is None:
+            return False
+        chunk = self._handle.read()
+        if not chunk:
+            return False
+        self._offset += len(chunk)
+        *complete, self._partial = (self._partial + chunk).split(b"\n")
+        self._lines.extend(complete)
+        return bool(complete)
+
+    def _sync_handle(self) -> None:
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            self._close_handle()
+            return
+
+        if self._handle is not None and stat.st_ino != self._inode:
+            # Rotated: whatever the old file still held is its final content.
+            self._lines.extend((self._partial + self._handle.read()).split(b"\n"))
+            self._close_handle()
+        elif self._handle is not None and stat.st_size < self._offset:
+            self._handle.seek(0)
+            self._offset = 0
+            self._partial = b""
+
+        if self._handle is None:
             try:
-                payload = loads(line)
-            except JSONDecodeError:
-                continue
-
-            if not isinstance(payload, dict):
-                continue
-
-            hero_hand = payload.get("hero_hand")
-            hero_position = payload.get("hero_position")
-            if not isinstance(hero_hand, str) or not isinstance(hero_position, str):
-                continue
-
-            villain_position = payload.get("villain_position")
-            villain_action = payload.get("villain_action")
-            confidence = payload.get("confidence")
-            source = payload.get("source")
-
-            if villain_position is not None and not isinstance(villain_position, str):
-                villain_position = None
-            if villain_action is not None and not isinstance(villain_action, str):
-                villain_action = None
-            if confidence is not None:
-                try:
-                    confidence = float(confidence)
-                except (TypeError, ValueError):
-                    confidence = None
-            if source is not None and not isinstance(source, str):
-                source = None
-
-            return Observation(
-                hero_hand=hero_hand,
-                hero_position=hero_position,
-                villain_position=villain_position,
-                villain_action=villain_action,
-                confidence=confidence,
-                source=source,
-            )
-
-        return None
+                self._handle = self.file_path.open("rb")
+            except OSError:
+                return
+            self._inode = os.fstat(self._handle.fileno()).st_ino
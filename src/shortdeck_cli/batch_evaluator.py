@@ -0,0 +1,88 @@
+"""Vectorized NumPy hand evaluation for scoring many boards per call.
+
+Uses the same card encoding and score integers as ``hand_evaluator``. A batch
+of hands is reduced to per-row rank keys (summed base-5 rank histograms) and
+OR-ed 36-bit suit masks; the four 9-bit suit lanes of each mask are looked up
+in the flush table, so no per-hand Python code runs.
+
+NumPy is optional: install the ``fast`` extra (``pip install -e .[fast]``).
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from shortdeck_cli.hand_evaluator import CARD_RANK_KEY, CARD_SUIT_BIT, RANK_MASK, RANK_ORDER, lookup_tables
+
+
+@lru_cache(maxsize=1)
+def _numpy():
+    try:
+        import numpy  # type: ignore
+    except ImportError:
+        return None
+    return numpy
+
+
+def batch_available() -> bool:
+    return _numpy() is not None
+
+
+def require_numpy(feature: str = "batch evaluation"):
+    np = _numpy()
+    if np is None:
+        raise RuntimeError(f"numpy is required for {feature} (pip install -e .[fast])")
+    return np
+
+
+@lru_cache(maxsize=1)
+def _dense_tables():
+    np = require_numpy()
+    by_rank_key, by_flush_mask = lookup_tables()
+
+    rank_table = np.zeros(5 ** len(RANK_ORDER), dtype=np.int32)
+    rank_table[np.fromiter(by_rank_key.keys(), dtype=np.int64)] = np.fromiter(by_rank_key.values(), dtype=np.int32)
+    flush_table = np.asarray(by_flush_mask, dtype=np.int32)
+    card_rank_key = np.asarray(CARD_RANK_KEY, dtype=np.int64)
+    card_suit_bit = np.asarray(CARD_SUIT_BIT, dtype=np.int64)
+    return rank_table, flush_table, card_rank_key, card_suit_bit
+
+
+def hand_states(cards):
+    """Return ``(rank_keys, suit_bits)`` for an ``(..., k)`` array of card indexes."""
+    np = require_numpy()
+    _, _, card_rank_key, card_suit_bit = _dense_tables()
+    cards = np.asarray(cards, dtype=np.intp)
+    return card_rank_key[cards].sum(axis=-1), np.bitwise_or.reduce(card_suit_bit[cards], axis=-1)
+
+
+def score_states(rank_keys, suit_bits):
+    """Score accumulated hand states element-wise (any matching shapes)."""
+    np = require_numpy()
+    rank_table, flush_table, _, _ = _dense_tables()
+    suit_bits = np.asarray(suit_bits, dtype=np.int64)
+    scores = rank_table[np.asarray(rank_keys, dtype=np.int64)]
+    for shift in (0, 9, 18, 27):
+        np.maximum(scores, flush_table[(suit_bits >> shift) & RANK_MASK], out=scores)
+    return scores
+
+
+def evaluate_batch(hole, boards):
+    """Score hole cards against an ``(N, k)`` array of boards, 3 <= k <= 5.
+
+    ``hole`` is either a single ``(2,)`` hand shared by every board or an
+    ``(N, 2)`` array with one hand per board. Returns an ``(N,)`` int array of
+    scores comparable with ``hand_evaluator.evaluate``.
+    """
+    np = require_numpy()
+    boards = np.asarray(boards, dtype=np.intp)
+    hole = np.asarray(hole, dtype=np.intp)
+    if boards.ndim != 2:
+        raise ValueError("boards must be a 2-D array of card indexes")
+    if hole.ndim == 1:
+        hole = np.broadcast_to(hole, (boards.shape[0], hole.shape[0]))
+    if hole.shape[0] != boards.shape[0]:
+        raise ValueError("hole and boards must have the same number of rows")
+    if not 5 <= hole.shape[1] + boards.shape[1] <= 7:
+        raise ValueError("each hand must contain between 5 and 7 cards")
+    return score_states(*hand_states(np.concatenate((hole, boards), axis=1)))
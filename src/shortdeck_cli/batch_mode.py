@@ -0,0 +1,179 @@
+"""Re-score a JSONL archive of observations in bulk.
+
+The input is read in chunks of lines and every chunk is scored
+independently, in-process or on a process pool that keeps only a few chunks
+in flight, so memory stays flat for archives of millions of hands. Results are
+written in input order as JSONL or CSV, one record per non-blank input line.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+import concurrent.futures
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from typing import TextIO
+
+from shortdeck_cli.auto_ingest import parse_observation_line
+from shortdeck_cli.evaluator import load_strategy_file, recommend_action
+from shortdeck_cli.parser import normalize_observation
+from shortdeck_cli.strategy_index import StrategyIndex
+from shortdeck_cli.strategy_registry import StrategyRegistry
+
+DEFAULT_CHUNK_SIZE = 5000
+OUTPUT_FORMATS = ("jsonl", "csv")
+RESULT_FIELDS = (
+    "line",
+    "hero_hand",
+    "hero_position",
+    "villain_position",
+    "villain_action",
+    "strategy_hand",
+    "scenario_key",
+    "recommendation",
+    "error",
+)
+
+# (first line number, raw lines)
+Chunk = tuple[int, list[str]]
+
+
+@dataclass(frozen=True)
+class BatchConfig:
+    strategy_path: str | None = None
+    strategy_dir: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchSummary:
+    records: int
+    errors: int
+
+
+@lru_cache(maxsize=4)
+def _strategy(config: BatchConfig) -> tuple[StrategyIndex | None, StrategyRegistry | None]:
+    index = load_strategy_file(config.strategy_path) if config.strategy_path else None
+    registry = StrategyRegistry.from_directory(config.strategy_dir) if config.strategy_dir else None
+    return index, registry
+
+
+def score_chunk(chunk: Chunk, config: BatchConfig = BatchConfig()) -> list[dict]:
+    """Score one chunk of raw JSONL lines; blank lines produce no record."""
+    first_line, lines = chunk
+    index, registry = _strategy(config)
+    results: list[dict] = []
+    for line_number, line in enumerate(lines, start=first_line):
+        if not line.strip():
+            continue
+        record = dict.fromkeys(RESULT_FIELDS, "")
+        record["line"] = line_number
+        observation = parse_observation_line(line)
+        if observation is None:
+            record["error"] = "not a valid observation object"
+            results.append(record)
+            continue
+        try:
+            spot = normalize_observation(observation)
+        except ValueError as error:
+            record["hero_hand"] = observation.hero_hand
+            record["hero_position"] = observation.hero_position
+            record["error"] = str(error)
+            results.append(record)
+            continue
+
+        strategy = index
+        if registry is not None:
+            key = registry.resolve(observation.game_format, observation.stack_depth)
+            if key is not None:
+                strategy = registry.select(*key)
+        scenario_key, recommendation = recommend_action(
+            hero_hand=spot.strategy_hand,
+            hero_position=spot.hero_position,
+            villain_position=spot.villain_position,
+            villain_action=spot.villain_action,
+            strategy=strategy,
+        )
+        record.update(
+            hero_hand=spot.hero_hand,
+            hero_position=spot.hero_position,
+            villain_position=spot.villain_position,
+            villain_action=spot.villain_action,
+            strategy_hand=spot.strategy_hand,
+            scenario_key=scenario_key,
+            recommendation=recommendation,
+        )
+        results.append(record)
+    return results
+
+
+def read_chunks(lines: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Chunk]:
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    lines = iter(lines)
+    first_line = 1
+    while chunk := list(islice(lines, chunk_size)):
+        yield first_line, chunk
+        first_line += len(chunk)
+
+
+def _pool_results(chunks: Iterator[Chunk], config: BatchConfig, workers: int) -> Iterator[list[dict]]:
+    # Executor.map would submit (and so read) the whole input up front; keep a
+    # bounded window of chunks in flight and yield them in input order.
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[concurrent.futures.Future] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(score_chunk, chunk, config))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class _ResultWriter:
+    def __init__(self, output: TextIO, output_format: str):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Output format must be one of: {', '.join(OUTPUT_FORMATS)}")
+        self._output = output
+        self._csv = None
+        if output_format == "csv":
+            self._csv = csv.DictWriter(output, fieldnames=RESULT_FIELDS, lineterminator="\n")
+            self._csv.writeheader()
+
+    def write(self, records: list[dict]) -> None:
+        if self._csv is not None:
+            self._csv.writerows(records)
+        else:
+            self._output.write("".join(json.dumps(record) + "\n" for record in records))
+
+
+def run_batch(
+    source: TextIO,
+    output: TextIO,
+    output_format: str = "jsonl",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int | None = 1,
+    config: BatchConfig = BatchConfig(),
+) -> BatchSummary:
+    """Score every observation line of ``source`` and write one result per line to ``output``.
+
+    ``workers=None`` uses every CPU; ``workers=1`` scores in-process.
+    """
+    writer = _ResultWriter(output, output_format)
+    workers = workers or os.cpu_count() or 1
+    chunks = read_chunks(source, chunk_size)
+    if workers == 1:
+        results = (score_chunk(chunk, config) for chunk in chunks)
+    else:
+        results = _pool_results(chunks, config, workers)
+
+    records = errors = 0
+    for chunk_results in results:
+        writer.write(chunk_results)
+        records += len(chunk_results)
+        errors += sum(1 for record in chunk_results if record["error"])
+    return BatchSummary(records=records, errors=errors)
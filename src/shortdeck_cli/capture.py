@@ -0,0 +1,342 @@
+"""Screen capture backends for the OCR observation source.
+
+The OCR source only needs the configured ROIs, so it grabs the bounding box
+of their union rather than the whole window. Backends locate the window and
+grab screen rectangles:
+
+- ``GdiCaptureBackend`` (Windows) copies the screen with ``BitBlt`` into a
+  DIB section created once per size and decodes it into a small ring of
+  preallocated Pillow images, so steady-state polling allocates no frames.
+- ``ImageGrabBackend`` uses ``PIL.ImageGrab`` (new image per grab); it is
+  the fallback when GDI is unavailable.
+- ``FileCaptureBackend`` replays saved frames as a fake window, one frame
+  per ``window_rect()`` call, so the capture path runs in tests on Linux.
+
+Images returned by ``grab`` may share memory with later grabs of the same
+size: each stays valid until ``BUFFER_RING_SIZE`` more grabs of that size
+were made. That covers one frame being recognized while the next one is
+prefetched.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import platform
+from abc import ABC, abstractmethod
+from ctypes import wintypes
+from dataclasses import dataclass
+from pathlib import Path
+
+BUFFER_RING_SIZE = 2
+MAX_BUFFER_SIZES = 4
+
+# (left, top, right, bottom) in pixels.
+Bbox = tuple[int, int, int, int]
+
+
+@dataclass(frozen=True)
+class RoiRect:
+    left: float
+    top: float
+    right: float
+    bottom: float
+    normalized: bool
+
+
+@dataclass(frozen=True)
+class WindowRect:
+    left: int
+    top: int
+    right: int
+    bottom: int
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.right - self.left, self.bottom - self.top
+
+
+def roi_box(roi: RoiRect, width: int, height: int) -> Bbox:
+    """Pixel box of ``roi`` inside a ``width`` x ``height`` image, clamped to at least one pixel."""
+    if roi.normalized:
+        left = int(roi.left * width)
+        top = int(roi.top * height)
+        right = int(roi.right * width)
+        bottom = int(roi.bottom * height)
+    else:
+        left = int(roi.left)
+        top = int(roi.top)
+        right = int(roi.right)
+        bottom = int(roi.bottom)
+
+    left = max(0, min(left, width - 1))
+    top = max(0, min(top, height - 1))
+    right = max(left + 1, min(right, width))
+    bottom = max(top + 1, min(bottom, height))
+    return left, top, right, bottom
+
+
+def roi_union(regions: dict[str, RoiRect], width: int, height: int) -> tuple[Bbox, dict[str, RoiRect]]:
+    """Bounding box of all ROIs in a window, and the ROIs in pixels relative to that box.
+
+    Without ROIs the box is the whole window.
+    """
+    if not regions:
+        return (0, 0, width, height), {}
+    boxes = {name: roi_box(roi, width, height) for name, roi in regions.items()}
+    left = min(box[0] for box in boxes.values())
+    top = min(box[1] for box in boxes.values())
+    right = max(box[2] for box in boxes.values())
+    bottom = max(box[3] for box in boxes.values())
+    relative = {
+        name: RoiRect(box[0] - left, box[1] - top, box[2] - left, box[3] - top, normalized=False)
+        for name, box in boxes.items()
+    }
+    return (left, top, right, bottom), relative
+
+
+def _find_window_rect(title_contains: str) -> WindowRect | None:
+    if platform.system() != "Windows":
+        return None
+
+    user32 = ctypes.windll.user32
+    wnd_enum_proc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    enum_windows = user32.EnumWindows
+    enum_windows.argtypes = [wnd_enum_proc, wintypes.LPARAM]
+    enum_windows.restype = wintypes.BOOL
+
+    get_window_text_length = user32.GetWindowTextLengthW
+    get_window_text = user32.GetWindowTextW
+    is_window_visible = user32.IsWindowVisible
+    get_window_rect = user32.GetWindowRect
+
+    wanted = title_contains.lower().strip()
+    found: list[WindowRect] = []
+
+    @wnd_enum_proc
+    def _callback(hwnd, _lparam):
+        if not is_window_visible(hwnd):
+            return True
+        length = get_window_text_length(hwnd)
+        if length <= 0:
+            return True
+        buffer = ctypes.create_unicode_buffer(length + 1)
+        get_window_text(hwnd, buffer, length + 1)
+        title = buffer.value.strip()
+        if not title:
+            return True
+        if wanted not in title.lower():
+            return True
+
+        rect = wintypes.RECT()
+        if not get_window_rect(hwnd, ctypes.byref(rect)):
+            return True
+        found.append(WindowRect(rect.left, rect.top, rect.right, rect.bottom))
+        return False
+
+    enum_windows(_callback, 0)
+    if not found:
+        return None
+    return found[0]
+
+
+class FrameBuffers:
+    """Ring of preallocated RGB images per size."""
+
+    def __init__(self, ring_size: int = BUFFER_RING_SIZE):
+        from PIL import Image  # type: ignore
+
+        self._new_image = Image.new
+        self.ring_size = ring_size
+        self.allocated = 0
+        self._rings: dict[tuple[int, int], tuple[list, int]] = {}
+
+    def next(self, size: tuple[int, int]):
+        ring, position = self._rings.get(size, ([], 0))
+        if len(ring) < self.ring_size:
+            if size not in self._rings and len(self._rings) >= MAX_BUFFER_SIZES:
+                # The window was resized several times; drop the old sizes.
+                self._rings.clear()
+            ring.append(self._new_image("RGB", size))
+            self.allocated += 1
+        image = ring[position % len(ring)]
+        self._rings[size] = (ring, position + 1)
+        return image
+
+
+class CaptureBackend(ABC):
+    @abstractmethod
+    def window_rect(self) -> WindowRect | None:
+        """Locate the table window in screen coordinates; ``None`` when it is not visible."""
+
+    @abstractmethod
+    def grab(self, bbox: Bbox):
+        """Capture the screen rectangle ``bbox`` as an RGB Pillow image."""
+
+    def close(self) -> None:
+        pass
+
+
+class ImageGrabBackend(CaptureBackend):
+    def __init__(self, window_title_contains: str = "PokerStars"):
+        try:
+            from PIL import ImageGrab  # type: ignore
+        except ImportError as error:
+            raise RuntimeError("Pillow is required for --auto-source pokerstars") from error
+        self._image_grab = ImageGrab
+        self.window_title_contains = window_title_contains
+
+    def window_rect(self) -> WindowRect | None:
+        return _find_window_rect(self.window_title_contains)
+
+    def grab(self, bbox: Bbox):
+        return self._image_grab.grab(bbox=bbox, all_screens=True)
+
+
+class _BitmapInfoHeader(ctypes.Structure):
+    _fields_ = [
+        ("biSize", wintypes.DWORD),
+        ("biWidth", wintypes.LONG),
+        ("biHeight", wintypes.LONG),
+        ("biPlanes", wintypes.WORD),
+        ("biBitCount", wintypes.WORD),
+        ("biCompression", wintypes.DWORD),
+        ("biSizeImage", wintypes.DWORD),
+        ("biXPelsPerMeter", wintypes.LONG),
+        ("biYPelsPerMeter", wintypes.LONG),
+        ("biClrUsed", wintypes.DWORD),
+        ("biClrImportant", wintypes.DWORD),
+    ]
+
+
+class _BitmapInfo(ctypes.Structure):
+    _fields_ = [("bmiHeader", _BitmapInfoHeader), ("bmiColors", wintypes.DWORD * 3)]
+
+
+_SRCCOPY = 0x00CC0020
+_CAPTUREBLT = 0x40000000
+_DIB_RGB_COLORS = 0
+_BI_RGB = 0
+
+
+class GdiCaptureBackend(CaptureBackend):
+    """Windows ``BitBlt`` capture into a reused DIB section and reused Pillow images."""
+
+    def __init__(self, window_title_contains: str = "PokerStars"):
+        if platform.system() != "Windows":
+            raise RuntimeError("GDI capture is only available on Windows.")
+        self.window_title_contains = window_title_contains
+        self._user32 = ctypes.windll.user32
+        self._gdi32 = ctypes.windll.gdi32
+        self._gdi32.CreateDIBSection.restype = wintypes.HBITMAP
+        self._gdi32.CreateCompatibleDC.restype = wintypes.HDC
+        self._gdi32.SelectObject.restype = wintypes.HGDIOBJ
+        self._user32.GetDC.restype = wintypes.HDC
+        self._screen_dc = self._user32.GetDC(None)
+        self._memory_dc = self._gdi32.CreateCompatibleDC(self._screen_dc)
+        if not self._screen_dc or not self._memory_dc:
+            raise RuntimeError("Could not create GDI device contexts.")
+        self._buffers = FrameBuffers()
+        self._bitmap = None
+        self._bitmap_size: tuple[int, int] | None = None
+        self._bits = None
+
+    def window_rect(self) -> WindowRect | None:
+        return _find_window_rect(self.window_title_contains)
+
+    def _select_bitmap(self, size: tuple[int, int]) -> None:
+        if self._bitmap_size == size:
+            return
+        width, height = size
+        info = _BitmapInfo()
+        info.bmiHeader.biSize = ctypes.sizeof(_BitmapInfoHeader)
+        info.bmiHeader.biWidth = width
+        info.bmiHeader.biHeight = -height  # top-down rows
+        info.bmiHeader.biPlanes = 1
+        info.bmiHeader.biBitCount = 32
+        info.bmiHeader.biCompression = _BI_RGB
+        bits = ctypes.c_void_p()
+        bitmap = self._gdi32.CreateDIBSection(
+            self._memory_dc, ctypes.byref(info), _DIB_RGB_COLORS, ctypes.byref(bits), None, 0
+        )
+        if not bitmap or not bits.value:
+            raise RuntimeError("CreateDIBSection failed.")
+        self._gdi32.SelectObject(self._memory_dc, bitmap)
+        if self._bitmap:
+            self._gdi32.DeleteObject(self._bitmap)
+        self._bitmap = bitmap
+        self._bitmap_size = size
+        self._bits = (ctypes.c_ubyte * (width * height * 4)).from_address(bits.value)
+
+    def grab(self, bbox: Bbox):
+        left, top, right, bottom = bbox
+        size = (right - left, bottom - top)
+        self._select_bitmap(size)
+        if not self._gdi32.BitBlt(
+            self._memory_dc, 0, 0, size[0], size[1], self._screen_dc, left, top, _SRCCOPY | _CAPTUREBLT
+        ):
+            raise RuntimeError("BitBlt failed.")
+        image = self._buffers.next(size)
+        image.frombytes(self._bits, "raw", "BGRX")
+        return image
+
+    def close(self) -> None:
+        if self._bitmap:
+            self._gdi32.DeleteObject(self._bitmap)
+            self._bitmap = None
+        if self._memory_dc:
+            self._gdi32.DeleteDC(self._memory_dc)
+            self._memory_dc = None
+        if self._screen_dc:
+            self._user32.ReleaseDC(None, self._screen_dc)
+            self._screen_dc = None
+
+
+class FileCaptureBackend(CaptureBackend):
+    """Replays saved frames (e.g. full-window ``--auto-debug-dir`` PNGs) as the captured window.
+
+    Each ``window_rect()`` call advances to the next frame; ``grab`` copies the
+    requested rectangle into a reused buffer. ``grabs`` records every bbox.
+    """
+
+    def __init__(self, frame_paths: list[str | Path], loop: bool = False):
+        if not frame_paths:
+            raise ValueError("FileCaptureBackend needs at least one frame.")
+        from PIL import Image  # type: ignore
+
+        self._open = Image.open
+        self.frame_paths = [Path(path) for path in frame_paths]
+        self.loop = loop
+        self.grabs: list[Bbox] = []
+        self.buffers = FrameBuffers()
+        self._position = 0
+        self._frame = None
+
+    def window_rect(self) -> WindowRect | None:
+        if self._position >= len(self.frame_paths):
+            if not self.loop:
+                self._frame = None
+                return None
+            self._position = 0
+        with self._open(self.frame_paths[self._position]) as frame:
+            self._frame = frame.convert("RGB")
+        self._position += 1
+        width, height = self._frame.size
+        return WindowRect(0, 0, width, height)
+
+    def grab(self, bbox: Bbox):
+        if self._frame is None:
+            raise RuntimeError("No frame to grab; call window_rect() first.")
+        self.grabs.append(bbox)
+        left, top, right, bottom = bbox
+        image = self.buffers.next((right - left, bottom - top))
+        image.paste(self._frame.crop(bbox), (0, 0))
+        return image
+
+
+def default_capture_backend(window_title_contains: str) -> CaptureBackend:
+    if platform.system() == "Windows":
+        try:
+            return GdiCaptureBackend(window_title_contains)
+        except (AttributeError, OSError, RuntimeError):
+            pass
+    return ImageGrabBackend(window_title_contains)
@@ -0,0 +1,192 @@
+"""Recognize the hero cards by matching rank and suit glyph templates.
+
+The hero_hand ROI shows two cards; a layout gives, per card, the boxes of
+its rank glyph and suit symbol (fractions of the ROI). Each box is reduced
+to a small thumbnail — grayscale for ranks, colour for suits, so four-colour
+decks separate suits by colour alone — and normalized to zero mean and unit
+length. Matching is then a dot product (normalized cross-correlation)
+against one averaged template per rank and suit, which ignores brightness
+and contrast changes. Templates are calibrated once from hero_hand crops
+labeled with their explicit hand (e.g. ``AsKd``, cards left to right) and
+stored as JSON. No external process is involved.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from shortdeck_cli.hand_evaluator import SUITS
+from shortdeck_cli.rules import RANKS
+
+TEMPLATE_VERSION = 1
+RANK_SIZE = (12, 16)
+SUIT_SIZE = (10, 10)
+DEFAULT_MIN_SCORE = 0.6
+
+# (left, top, right, bottom) as fractions of the hero_hand crop.
+Box = tuple[float, float, float, float]
+
+
+@dataclass(frozen=True)
+class CardSlot:
+    rank: Box
+    suit: Box
+
+
+# Two cards side by side, rank in the top-left corner and the suit below it.
+DEFAULT_CARD_LAYOUT = (
+    CardSlot(rank=(0.0, 0.0, 0.25, 0.5), suit=(0.0, 0.5, 0.25, 1.0)),
+    CardSlot(rank=(0.5, 0.0, 0.75, 0.5), suit=(0.5, 0.5, 0.75, 1.0)),
+)
+
+
+def _crop_box(image, box: Box):
+    width, height = image.size
+    left = min(int(box[0] * width), width - 1)
+    top = min(int(box[1] * height), height - 1)
+    right = max(left + 1, min(int(box[2] * width), width))
+    bottom = max(top + 1, min(int(box[3] * height), height))
+    return image.crop((left, top, right, bottom))
+
+
+def _normalized(values: Iterable[float]) -> tuple[float, ...]:
+    values = list(values)
+    mean = sum(values) / len(values)
+    centered = [value - mean for value in values]
+    norm = math.sqrt(sum(value * value for value in centered))
+    if norm == 0:
+        return tuple(0.0 for _ in centered)
+    return tuple(value / norm for value in centered)
+
+
+def glyph_vector(image, box: Box, size: tuple[int, int], mode: str) -> tuple[float, ...]:
+    """Zero-mean, unit-length pixels of ``box`` resized to ``size`` in PIL ``mode``."""
+    return _normalized(_crop_box(image, box).convert(mode).resize(size).tobytes())
+
+
+def _best_match(vector: tuple[float, ...], templates: dict[str, tuple[float, ...]]) -> tuple[str | None, float]:
+    best_label, best_score = None, -1.0
+    for label, template in templates.items():
+        score = sum(left * right for left, right in zip(vector, template))
+        if score > best_score:
+            best_label, best_score = label, score
+    return best_label, best_score
+
+
+def _parse_box(raw) -> Box:
+    if not isinstance(raw, (list, tuple)) or len(raw) != 4:
+        raise ValueError("Card layout boxes must be [left, top, right, bottom].")
+    left, top, right, bottom = (float(value) for value in raw)
+    if not (0 <= left < right <= 1 and 0 <= top < bottom <= 1):
+        raise ValueError("Card layout boxes must be fractions with left < right and top < bottom.")
+    return left, top, right, bottom
+
+
+def parse_card_layout(raw) -> tuple[CardSlot, ...]:
+    if not isinstance(raw, list) or not raw:
+        raise ValueError("Card layout must be a non-empty list of {rank, suit} boxes.")
+    try:
+        return tuple(CardSlot(rank=_parse_box(slot["rank"]), suit=_parse_box(slot["suit"])) for slot in raw)
+    except (KeyError, TypeError) as error:
+        raise ValueError("Every card layout entry needs 'rank' and 'suit' boxes.") from error
+
+
+@dataclass(frozen=True)
+class CardTemplates:
+    layout: tuple[CardSlot, ...]
+    ranks: dict[str, tuple[float, ...]]
+    suits: dict[str, tuple[float, ...]]
+    min_score: float = DEFAULT_MIN_SCORE
+
+    def recognize(self, image) -> str | None:
+        """Return the cards in ``image`` (e.g. ``AsKd``), or ``None`` when any glyph matches poorly."""
+        cards: list[str] = []
+        for slot in self.layout:
+            rank, rank_score = _best_match(glyph_vector(image, slot.rank, RANK_SIZE, "L"), self.ranks)
+            suit, suit_score = _best_match(glyph_vector(image, slot.suit, SUIT_SIZE, "RGB"), self.suits)
+            if rank is None or suit is None or min(rank_score, suit_score) < self.min_score:
+                return None
+            cards.append(f"{rank}{suit}")
+        if len(set(cards)) != len(cards):
+            return None
+        return "".join(cards)
+
+    def __call__(self, image) -> str:
+        # Text-reader interface for FrameOcr: an empty string means "no hand".
+        return self.recognize(image) or ""
+
+    def to_json(self) -> dict:
+        return {
+            "version": TEMPLATE_VERSION,
+            "min_score": self.min_score,
+            "layout": [{"rank": list(slot.rank), "suit": list(slot.suit)} for slot in self.layout],
+            "ranks": {rank: [round(value, 6) for value in vector] for rank, vector in self.ranks.items()},
+            "suits": {suit: [round(value, 6) for value in vector] for suit, vector in self.suits.items()},
+        }
+
+    def save(self, file_path: str | Path) -> Path:
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_json()), encoding="utf-8")
+        return path
+
+
+def _parse_templates(raw, labels: str, length: int, kind: str) -> dict[str, tuple[float, ...]]:
+    if not isinstance(raw, dict) or not raw:
+        raise ValueError(f"Card templates need {kind} templates.")
+    templates: dict[str, tuple[float, ...]] = {}
+    for label, vector in raw.items():
+        if label not in labels or not isinstance(vector, list) or len(vector) != length:
+            raise ValueError(f"Invalid {kind} template: {label!r}")
+        templates[label] = tuple(float(value) for value in vector)
+    return templates
+
+
+def load_card_templates(file_path: str | Path) -> CardTemplates:
+    payload = json.loads(Path(file_path).read_text(encoding="utf-8"))
+    if not isinstance(payload, dict) or payload.get("version") != TEMPLATE_VERSION:
+        raise ValueError(f"Unsupported card template file: {file_path}")
+    return CardTemplates(
+        layout=parse_card_layout(payload.get("layout")),
+        ranks=_parse_templates(payload.get("ranks"), RANKS, RANK_SIZE[0] * RANK_SIZE[1], "rank"),
+        suits=_parse_templates(payload.get("suits"), SUITS, SUIT_SIZE[0] * SUIT_SIZE[1] * 3, "suit"),
+        min_score=float(payload.get("min_score", DEFAULT_MIN_SCORE)),
+    )
+
+
+def _split_hand(hand: str, card_count: int) -> list[tuple[str, str]]:
+    if len(hand) != 2 * card_count:
+        raise ValueError(f"Calibration labels need {card_count} explicit cards (example: AsKd), got {hand!r}.")
+    cards = [(hand[index].upper(), hand[index + 1].lower()) for index in range(0, len(hand), 2)]
+    for rank, suit in cards:
+        if rank not in RANKS or suit not in SUITS:
+            raise ValueError(f"Invalid card in calibration label {hand!r}.")
+    return cards
+
+
+def _averaged(vectors: dict[str, list[tuple[float, ...]]]) -> dict[str, tuple[float, ...]]:
+    return {
+        label: _normalized(sum(column) / len(column) for column in zip(*samples))
+        for label, samples in vectors.items()
+    }
+
+
+def calibrate_card_templates(
+    samples: Iterable[tuple[object, str]],
+    layout: tuple[CardSlot, ...] = DEFAULT_CARD_LAYOUT,
+    min_score: float = DEFAULT_MIN_SCORE,
+) -> CardTemplates:
+    """Average the glyphs of labeled hero_hand crops, given as ``(image, "AsKd")`` pairs."""
+    rank_vectors: dict[str, list[tuple[float, ...]]] = {}
+    suit_vectors: dict[str, list[tuple[float, ...]]] = {}
+    for image, hand in samples:
+        for slot, (rank, suit) in zip(layout, _split_hand(hand, len(layout))):
+            rank_vectors.setdefault(rank, []).append(glyph_vector(image, slot.rank, RANK_SIZE, "L"))
+            suit_vectors.setdefault(suit, []).append(glyph_vector(image, slot.suit, SUIT_SIZE, "RGB"))
+    if not rank_vectors:
+        raise ValueError("Calibration needs at least one labeled frame.")
+    return CardTemplates(layout=layout, ranks=_averaged(rank_vectors), suits=_averaged(suit_vectors), min_score=min_score)
@@ -1,15 +1,49 @@
-"""Interactive CLI flow for the Short Deck test app."""
+"""Interactive CLI flow for the Short Deck test app.
+
+Modules only needed by one mode (asyncio multi-table ingestion, the server,
+frame replay, strategy queries) are imported when that mode starts, so the
+interactive prompt does not pay for them.
+"""
+
+from __future__ import annotations
 
 import argparse
+import sys
 import time
-
-from shortdeck_cli.auto_ingest import JsonlObservationSource, Observation, ObservationSource
-from shortdeck_cli.evaluator import recommend_action
-from shortdeck_cli.parser import parse_action, parse_flop_cards, parse_hand, parse_position, parse_turn_card
+from contextlib import ExitStack
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from shortdeck_cli.auto_ingest import DEFAULT_QUEUE_SIZE, JsonlObservationSource, Observation, ObservationSource
+from shortdeck_cli.batch_mode import DEFAULT_CHUNK_SIZE, OUTPUT_FORMATS, BatchConfig, run_batch
+from shortdeck_cli.card_templates import load_card_templates
+from shortdeck_cli.equity import equity_vs_range, parse_range, range_from_scenario
+from shortdeck_cli.equity_runner import DEFAULT_MAX_TRIALS, DEFAULT_TOLERANCE, run_monte_carlo_equity
+from shortdeck_cli.evaluator import default_strategy_path, load_strategy_index, recommend_action, strategy_source_path
+from shortdeck_cli.frame_diff import DEFAULT_PIXEL_THRESHOLD
+from shortdeck_cli.parser import (
+    NormalizedObservation,
+    normalize_observation,
+    parse_action,
+    parse_board_cards,
+    parse_flop_cards,
+    parse_hand,
+    parse_position,
+    parse_turn_card,
+    strategy_hand,
+)
 from shortdeck_cli.pokerstars_capture import PokerStarsWindowOcrSource
+from shortdeck_cli.preflop_equity import all_in_equity
 from shortdeck_cli.postflop import analyze_flop, analyze_turn
 from shortdeck_cli.rules import ACTIONS, POSITIONS, previous_positions
+from shortdeck_cli.strategy_registry import StrategyRegistry
+from shortdeck_cli.strategy_reload import DEFAULT_RELOAD_INTERVAL, StrategyReloader
 
+if TYPE_CHECKING:
+    import socketserver
+
+
+DEFAULT_SERVE_ADDRESS = "127.0.0.1:8765"
 
 ANSI_RESET = "\033[0m"
 ANSI_BOLD = "\033[1m"
@@ -18,9 +52,6 @@ ANSI_GREEN = "\033[32m"
 ANSI_YELLOW = "\033[33m"
 ANSI_RED = "\033[31m"
 
-RANK_ORDER = "AKQJT9876"
-
-
 def _color_for_recommendation(recommendation: str) -> str:
     lowered = recommendation.lower()
     if "confidence: high" in lowered:
@@ -156,119 +187,234 @@ def _ask_optional_turn(hole_cards: list[str], flop_cards: list[str]) -> str | No
             print(f"Invalid input: {error}")
 
 
-def _strategy_hand_from_explicit(hero_hand: str) -> str:
-    first = hero_hand[:2]
-    second = hero_hand[2:]
-    rank_one, suit_one = first[0], first[1]
-    rank_two, suit_two = second[0], second[1]
-
-    if rank_one == rank_two:
-        return f"{rank_one}{rank_two}"
-
-    ordered = sorted([rank_one, rank_two], key=lambda rank: RANK_ORDER.index(rank))
-    suitedness = "s" if suit_one == suit_two else "o"
-    return f"{ordered[0]}{ordered[1]}{suitedness}"
-
-
-def _normalize_observation(observation: Observation) -> tuple[str, str, str, str] | None:
+def _normalize_observation(observation: Observation, emit=print) -> NormalizedObservation | None:
     try:
-        hero_hand = parse_hand(observation.hero_hand)
-        hero_position = parse_position(observation.hero_position)
+        return normalize_observation(observation)
     except ValueError as error:
-        print(f"Skipping observation: {error}")
+        emit(f"Skipping observation: {error}")
         return None
 
-    if hero_position == "UTG":
-        villain_position = "UTG"
-        villain_action = "fold"
-    else:
-        if observation.villain_position is None or observation.villain_action is None:
-            print("Skipping observation: villain_position and villain_action are required when hero is not UTG.")
-            return None
-        try:
-            villain_position = parse_position(observation.villain_position, allowed_positions=previous_positions(hero_position))
-            villain_action = parse_action(observation.villain_action)
-        except ValueError as error:
-            print(f"Skipping observation: {error}")
-            return None
-
-    strategy_hand = hero_hand
-    explicit_hole = len(hero_hand) == 4 and hero_hand[1].islower() and hero_hand[3].islower()
-    if explicit_hole:
-        strategy_hand = _strategy_hand_from_explicit(hero_hand)
 
-    return strategy_hand, hero_hand, hero_position, villain_position, villain_action
-
-
-def _print_recommendation(hero_hand: str, hero_position: str, villain_position: str, villain_action: str, recommendation: str, scenario_key: str) -> None:
-    print("\n--- Scenario ---")
-    print(f"Hero: {hero_hand} @ {hero_position}")
+def _print_recommendation(
+    hero_hand: str,
+    hero_position: str,
+    villain_position: str,
+    villain_action: str,
+    recommendation: str,
+    scenario_key: str,
+    strategy_revision: int | None = None,
+    emit=print,
+) -> None:
+    emit("\n--- Scenario ---")
+    emit(f"Hero: {hero_hand} @ {hero_position}")
     if hero_position == "UTG":
-        print("Villain: N/A (UTG open spot)")
+        emit("Villain: N/A (UTG open spot)")
     else:
-        print(f"Villain: {villain_position} did {villain_action}")
-    print(f"Scenario key: {scenario_key}")
-    print("\n>>> RECOMMENDATION <<<")
+        emit(f"Villain: {villain_position} did {villain_action}")
+    emit(f"Scenario key: {scenario_key}")
+    if strategy_revision is not None:
+        emit(f"Strategy revision: {strategy_revision}")
+    emit("\n>>> RECOMMENDATION <<<")
     rec_color = _color_for_recommendation(recommendation)
-    print(f"{ANSI_BOLD}{rec_color}{recommendation}{ANSI_RESET}")
-    print(">>>>>>>>>>>>>>>>>>>>>>")
-    print("(When data is set from TBD to real actions, this becomes data-driven.)")
+    emit(f"{ANSI_BOLD}{rec_color}{recommendation}{ANSI_RESET}")
+    emit(">>>>>>>>>>>>>>>>>>>>>>")
+    emit("(When data is set from TBD to real actions, this becomes data-driven.)")
+
+
+def _print_all_in_equity(strategy_hand: str, villain_position: str, emit=print) -> None:
+    equity = all_in_equity(strategy_hand, villain_position)
+    if equity is not None:
+        emit(f"Equity vs {villain_position} all-in range: {_format_pct(equity * 100)}%")
+
+
+def _table_emitter(table_id: str):
+    def emit(text: str) -> None:
+        for line in text.split("\n"):
+            print(f"[{table_id}] {line}" if line else "")
+
+    return emit
+
+
+class _AutoSession:
+    """Auto-mode state for one observation stream: dedupe, strategy revision, latency samples."""
+
+    def __init__(
+        self,
+        registry: StrategyRegistry | None = None,
+        reloader: StrategyReloader | None = None,
+        measure_latency: bool = False,
+        emit=print,
+    ):
+        self.registry = registry
+        self.reloader = reloader
+        self.measure_latency = measure_latency
+        self.emit = emit
+        self.latencies: list[float] = []
+        self._last_signature: tuple | None = None
+        self._strategy_revision = reloader.current()[0] if reloader is not None else None
+
+    def handle(self, observation: Observation) -> bool:
+        """Print the recommendation for an observation; ``False`` when it was skipped."""
+        emit = self.emit
+        normalized = _normalize_observation(observation, emit=emit)
+        if normalized is None:
+            return False
+
+        signature = (
+            normalized.hero_hand,
+            normalized.hero_position,
+            normalized.villain_position,
+            normalized.villain_action,
+            observation.game_format,
+            observation.stack_depth,
+        )
+        if signature == self._last_signature:
+            return False
+        self._last_signature = signature
+
+        if observation.confidence is not None and observation.confidence < 0.5:
+            source_name = observation.source or "capture"
+            emit(f"Warning: low confidence from {source_name}: {observation.confidence:.2f}; ingesting anyway.")
+
+        strategy = None
+        served_revision = None
+        if self.reloader is not None:
+            # Read the reloader once so the whole observation uses one revision.
+            revision, strategy = self.reloader.current()
+            if revision != self._strategy_revision:
+                emit(f"Strategy data reloaded: revision {revision}")
+                self._strategy_revision = revision
+            served_revision = revision
+        if self.registry is not None:
+            key = self.registry.resolve(observation.game_format, observation.stack_depth)
+            if key is not None:
+                # A registry chart serves this spot; the reloaded revision does not apply.
+                strategy = self.registry.select(*key)
+                served_revision = None
+        scenario_key, recommendation = recommend_action(
+            hero_hand=normalized.strategy_hand,
+            hero_position=normalized.hero_position,
+            villain_position=normalized.villain_position,
+            villain_action=normalized.villain_action,
+            strategy=strategy,
+        )
+        _print_recommendation(
+            hero_hand=normalized.hero_hand,
+            hero_position=normalized.hero_position,
+            villain_position=normalized.villain_position,
+            villain_action=normalized.villain_action,
+            recommendation=recommendation,
+            scenario_key=scenario_key,
+            strategy_revision=served_revision,
+            emit=emit,
+        )
+        if normalized.villain_action == "all-in":
+            _print_all_in_equity(normalized.strategy_hand, normalized.villain_position, emit=emit)
+        if self.measure_latency and observation.observed_at is not None:
+            latency = time.time() - observation.observed_at
+            self.latencies.append(latency)
+            emit(f"Latency: {latency * 1000:.1f} ms")
+        return True
 
 
 def run_auto_mode(
     source: ObservationSource,
     poll_seconds: float = 1.0,
     max_hands: int | None = None,
+    registry: StrategyRegistry | None = None,
+    reloader: StrategyReloader | None = None,
+    measure_latency: bool = False,
 ) -> None:
     print("=== Short Deck (6+) Auto Mode ===")
     print("Polling for observations and auto-running recommendations.")
     print("Press Ctrl+C to stop.")
 
+    session = _AutoSession(registry=registry, reloader=reloader, measure_latency=measure_latency)
     processed = 0
-    last_signature: tuple[str, str, str, str] | None = None
+    # Sources that can block until new data arrives are waited on instead of
+    # sleeping; poll_seconds then only bounds how long one wait may take.
+    wait = getattr(source, "wait", None)
 
     try:
         while True:
             observation = source.next_observation()
             if observation is None:
-                time.sleep(poll_seconds)
+                if wait is not None:
+                    wait(poll_seconds)
+                else:
+                    time.sleep(poll_seconds)
                 continue
 
-            normalized = _normalize_observation(observation)
-            if normalized is None:
+            if not session.handle(observation):
                 continue
 
-            strategy_hand, hero_hand, hero_position, villain_position, villain_action = normalized
-            signature = (hero_hand, hero_position, villain_position, villain_action)
-            if signature == last_signature:
-                continue
-            last_signature = signature
-
-            if observation.confidence is not None and observation.confidence < 0.5:
-                source_name = observation.source or "capture"
-                print(f"Warning: low confidence from {source_name}: {observation.confidence:.2f}; ingesting anyway.")
-
-            scenario_key, recommendation = recommend_action(
-                hero_hand=strategy_hand,
-                hero_position=hero_position,
-                villain_position=villain_position,
-                villain_action=villain_action,
-            )
-            _print_recommendation(
-                hero_hand=hero_hand,
-                hero_position=hero_position,
-                villain_position=villain_position,
-                villain_action=villain_action,
-                recommendation=recommendation,
-                scenario_key=scenario_key,
-            )
-
             processed += 1
             if max_hands is not None and processed >= max_hands:
                 print("\nAuto mode finished.")
                 return
     except KeyboardInterrupt:
         print("\nSession ended.")
+    finally:
+        if measure_latency:
+            _print_latency_summary(session.latencies)
+
+
+def run_multi_table_auto_mode(
+    sources: dict[str, ObservationSource],
+    poll_seconds: float = 1.0,
+    max_hands: int | None = None,
+    registry: StrategyRegistry | None = None,
+    reloader: StrategyReloader | None = None,
+    measure_latency: bool = False,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+) -> None:
+    import asyncio
+
+    from shortdeck_cli.multi_source import MultiSourceEngine
+
+    print("=== Short Deck (6+) Auto Mode ===")
+    print(f"Following {len(sources)} tables: {', '.join(sources)}")
+    print("Press Ctrl+C to stop.")
+
+    sessions = {
+        table_id: _AutoSession(
+            registry=registry,
+            reloader=reloader,
+            measure_latency=measure_latency,
+            emit=_table_emitter(table_id),
+        )
+        for table_id in sources
+    }
+    engine = MultiSourceEngine(
+        sources,
+        handle=lambda table_id, observation: sessions[table_id].handle(observation),
+        poll_seconds=poll_seconds,
+        queue_size=queue_size,
+        max_handled=max_hands,
+    )
+    try:
+        asyncio.run(engine.run())
+        print("\nAuto mode finished.")
+    except KeyboardInterrupt:
+        print("\nSession ended.")
+    finally:
+        if measure_latency:
+            _print_latency_summary([latency for session in sessions.values() for latency in session.latencies])
+
+
+def _print_latency_summary(latencies: list[float]) -> None:
+    if not latencies:
+        print("Latency: no timed observations.")
+        return
+    ordered = sorted(latencies)
+
+    def percentile(percent: float) -> float:
+        return ordered[min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))] * 1000
+
+    print(
+        f"Latency over {len(ordered)} observations: "
+        f"p50 {percentile(50):.1f} ms, p95 {percentile(95):.1f} ms, max {ordered[-1] * 1000:.1f} ms"
+    )
 
 
 def run_manual_mode() -> None:
@@ -310,13 +456,11 @@ def run_manual_mode() -> None:
                 print("\nSession ended.")
                 return
 
-        strategy_hand = hero_hand
-        explicit_hole = len(hero_hand) == 4 and hero_hand[1].islower() and hero_hand[3].islower()
-        if explicit_hole:
-            strategy_hand = _strategy_hand_from_explicit(hero_hand)
+        hand_class = strategy_hand(hero_hand)
+        explicit_hole = hand_class != hero_hand
 
         scenario_key, recommendation = recommend_action(
-            hero_hand=strategy_hand,
+            hero_hand=hand_class,
             hero_position=hero_position,
             villain_position=villain_position,
             villain_action=villain_action,
@@ -330,6 +474,8 @@ def run_manual_mode() -> None:
             recommendation=recommendation,
             scenario_key=scenario_key,
         )
+        if villain_action == "all-in":
+            _print_all_in_equity(hand_class, villain_position)
 
         if explicit_hole:
             hole_cards = [hero_hand[:2], hero_hand[2:]]
@@ -370,12 +516,153 @@ def run_manual_mode() -> None:
                     _print_out_details("River out cards", turn_analysis["river_out_details"], turn_analysis["river_total"])
 
 
+def run_equity_mode(
+    hero_hand: str,
+    villain_range: str,
+    board: str = "",
+    workers: int | None = 1,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_trials: int = DEFAULT_MAX_TRIALS,
+    seed: int = 0,
+) -> None:
+    hero_value = parse_hand(hero_hand)
+    if len(hero_value) != 4:
+        raise ValueError("Equity needs explicit hole cards (example: AsKd).")
+    hole_cards = [hero_value[:2], hero_value[2:]]
+    board_cards = parse_board_cards(board, blocked_cards=hole_cards)
+
+    if villain_range in load_strategy_index().scenario_ids:
+        range_weights = range_from_scenario(villain_range)
+    else:
+        range_weights = parse_range(villain_range)
+
+    if board_cards:
+        result = equity_vs_range(hole_cards, range_weights, board_cards)
+    else:
+        result = run_monte_carlo_equity(
+            hole_cards,
+            range_weights,
+            workers=workers,
+            tolerance=tolerance,
+            max_trials=max_trials,
+            seed=seed,
+        )
+
+    print("\n--- Equity ---")
+    print(f"Hero: {' '.join(hole_cards)}" + (f" on {' '.join(board_cards)}" if board_cards else " (preflop)"))
+    print(f"Villain range: {villain_range}")
+    print(
+        f"Equity: {_format_pct(result.equity * 100)}% "
+        f"(win {_format_pct(result.win * 100)}%, tie {_format_pct(result.tie * 100)}%)"
+    )
+    if result.exact:
+        print(f"Exact enumeration over {result.samples} runouts.")
+    else:
+        print(f"Monte Carlo: {result.samples} trials, standard error {result.std_error * 100:.2f}%")
+
+
+def run_server(server: socketserver.BaseServer) -> None:
+    from shortdeck_cli.server import server_address_label
+
+    server.service.warm_up()
+    print(f"Serving recommendations on {server_address_label(server)} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+    finally:
+        server.server_close()
+
+
+def _strategy_sources(
+    args: argparse.Namespace,
+    parser: argparse.ArgumentParser,
+) -> tuple[StrategyRegistry | None, StrategyReloader | None]:
+    registry = None
+    if args.strategy_dir:
+        try:
+            registry = StrategyRegistry.from_directory(args.strategy_dir)
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+    reloader = None
+    if args.strategy_reload is not None:
+        # Edits go to the JSON; the shipped pack only changes when it is rebuilt.
+        reload_path = args.strategy_reload or strategy_source_path() or default_strategy_path()
+        if reload_path is None:
+            parser.error("No strategy file found to reload; pass --strategy-reload PATH")
+        try:
+            reloader = StrategyReloader(reload_path, interval=args.strategy_reload_seconds)
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+        print(f"Reloading the strategy when this file changes: {reloader.path}")
+    return registry, reloader
+
+
+def _pokerstars_source(
+    args: argparse.Namespace,
+    parser: argparse.ArgumentParser,
+    hero_position: str,
+    window_title: str,
+    debug_dir: str | None,
+) -> PokerStarsWindowOcrSource:
+    hand_reader = None
+    if args.auto_card_templates:
+        try:
+            hand_reader = load_card_templates(args.auto_card_templates)
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+    return PokerStarsWindowOcrSource(
+        hero_position=hero_position,
+        window_title_contains=window_title,
+        tesseract_cmd=args.auto_tesseract_cmd,
+        debug_dir=debug_dir,
+        roi_config_path=args.auto_roi_config,
+        ocr_diff_threshold=args.auto_ocr_diff_threshold,
+        ocr_workers=args.auto_ocr_workers,
+        hand_reader=hand_reader,
+        debug_sample_every=args.auto_debug_sample,
+    )
+
+
+def _auto_table_source(
+    table_id: str,
+    table_source: str,
+    args: argparse.Namespace,
+    parser: argparse.ArgumentParser,
+) -> ObservationSource:
+    """Source for one ``--auto-table ID=SOURCE`` value.
+
+    ``SOURCE`` is a JSONL path (optionally ``jsonl:PATH``), ``pokerstars:POSITION:WINDOW_TITLE``
+    or ``replay:POSITION:DIR``; the other ``--auto-*`` options apply to every table.
+    """
+    backend, separator, rest = table_source.partition(":")
+    if not separator or backend not in ("jsonl", "pokerstars", "replay"):
+        # A bare path, including Windows drive letters such as C:\tables\t1.jsonl.
+        return JsonlObservationSource(table_source)
+    if backend == "jsonl":
+        return JsonlObservationSource(rest)
+    hero_position, separator, target = (part.strip() for part in rest.partition(":"))
+    if not separator or not hero_position or not target:
+        target_name = "WINDOW_TITLE" if backend == "pokerstars" else "DIR"
+        parser.error(f"--auto-table expects {backend}:POSITION:{target_name}, got: {table_source}")
+    if backend == "replay":
+        from shortdeck_cli.ocr_replay import DebugFrameReplaySource
+
+        try:
+            return DebugFrameReplaySource(target, hero_position=hero_position)
+        except ValueError as error:
+            parser.error(str(error))
+    # Keep each table's debug captures apart.
+    debug_dir = str(Path(args.auto_debug_dir) / table_id) if args.auto_debug_dir else None
+    return _pokerstars_source(args, parser, hero_position, target, debug_dir)
+
+
 def cli_main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="Short Deck CLI")
     parser.add_argument("--auto", action="store_true", help="Run in non-interactive auto-ingest mode")
     parser.add_argument(
         "--auto-source",
-        choices=("jsonl", "pokerstars"),
+        choices=("jsonl", "pokerstars", "replay"),
         default="jsonl",
         help="Observation source backend for auto mode",
     )
@@ -383,6 +670,22 @@ def cli_main(argv: list[str] | None = None) -> None:
         "--auto-source-jsonl",
         help="Path to JSONL file containing observed hands/actions (one JSON object per line)",
     )
+    parser.add_argument(
+        "--auto-table",
+        action="append",
+        default=[],
+        metavar="ID=SOURCE",
+        help=(
+            "Follow a table as ID; SOURCE is a JSONL path, pokerstars:POSITION:WINDOW_TITLE or "
+            "replay:POSITION:DIR. Repeat to multiplex several tables in one process"
+        ),
+    )
+    parser.add_argument(
+        "--auto-queue-size",
+        type=int,
+        default=DEFAULT_QUEUE_SIZE,
+        help=f"Observations buffered per table before its source is paused (default: {DEFAULT_QUEUE_SIZE})",
+    )
     parser.add_argument(
         "--auto-hero-position",
         help="Hero position for pokerstars OCR source (UTG/MP1/MP2/HJ/CO/BTN)",
@@ -395,13 +698,45 @@ def cli_main(argv: list[str] | None = None) -> None:
     parser.add_argument(
         "--auto-debug-dir",
         default=None,
-        help="Optional directory to save captured frames and OCR text for debugging",
+        help="Optional directory to save OCR text (and sampled frames, see --auto-debug-sample) for debugging",
+    )
+    parser.add_argument(
+        "--auto-debug-sample",
+        type=int,
+        default=0,
+        metavar="N",
+        help="With --auto-debug-dir, also save every N-th saved frame as a whole-window PNG (default: 0 = text only)",
+    )
+    parser.add_argument(
+        "--auto-replay-dir",
+        default=None,
+        help="Directory of frames saved by --auto-debug-dir to replay with --auto-source replay",
     )
     parser.add_argument(
         "--auto-roi-config",
         default=None,
         help="Optional JSON file defining ROI regions for hero_hand and action_log OCR",
     )
+    parser.add_argument(
+        "--auto-ocr-diff-threshold",
+        type=int,
+        default=DEFAULT_PIXEL_THRESHOLD,
+        help=(
+            "Re-run OCR on a screen region only when a downsampled pixel changed by more than this "
+            f"(0-255, 0 = any change; default: {DEFAULT_PIXEL_THRESHOLD})"
+        ),
+    )
+    parser.add_argument(
+        "--auto-ocr-workers",
+        type=int,
+        default=2,
+        help="Screen regions OCRed concurrently per frame for the pokerstars source (default: 2)",
+    )
+    parser.add_argument(
+        "--auto-card-templates",
+        default=None,
+        help="Card templates JSON (python -m shortdeck_cli.ocr_replay calibrate-cards) to read hero cards without Tesseract",
+    )
     parser.add_argument(
         "--auto-tesseract-cmd",
         default=None,
@@ -411,7 +746,7 @@ def cli_main(argv: list[str] | None = None) -> None:
         "--auto-poll-seconds",
         type=float,
         default=1.0,
-        help="Polling interval for auto mode (default: 1.0)",
+        help="Polling interval for auto mode; sources that can wait for new data wake earlier (default: 1.0)",
     )
     parser.add_argument(
         "--auto-max-hands",
@@ -419,25 +754,243 @@ def cli_main(argv: list[str] | None = None) -> None:
         default=None,
         help="Stop auto mode after N processed hands (test/debug option)",
     )
+    parser.add_argument(
+        "--auto-latency",
+        action="store_true",
+        help="Print observation-to-recommendation latency per hand and a summary at exit",
+    )
+    parser.add_argument(
+        "--strategy-dir",
+        default=None,
+        help="Directory of .sdpack strategy packs picked per observation by game_format/stack_depth",
+    )
+    parser.add_argument(
+        "--strategy-reload",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="PATH",
+        help="Reload the strategy pack/JSON (default: the shipped chart) when it changes during auto mode",
+    )
+    parser.add_argument(
+        "--strategy-reload-seconds",
+        type=float,
+        default=DEFAULT_RELOAD_INTERVAL,
+        help=f"How often --strategy-reload checks the file (default: {DEFAULT_RELOAD_INTERVAL})",
+    )
+
+    parser.add_argument(
+        "--equity",
+        metavar="HOLE",
+        default=None,
+        help="Compute hero equity for explicit hole cards (e.g. AsKd) against --equity-range and exit",
+    )
+    parser.add_argument(
+        "--equity-range",
+        default=None,
+        help="Villain range as hand classes (e.g. 'AA, AKs, T9o:0.5') or a scenario key (its all-in weights)",
+    )
+    parser.add_argument(
+        "--equity-board",
+        default="",
+        help="Optional board cards (3-5, e.g. KsQhTd); preflop uses Monte Carlo",
+    )
+    parser.add_argument(
+        "--equity-tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help=f"Stop Monte Carlo once the standard error is below this (default: {DEFAULT_TOLERANCE})",
+    )
+    parser.add_argument(
+        "--equity-max-trials",
+        type=int,
+        default=DEFAULT_MAX_TRIALS,
+        help=f"Upper bound on Monte Carlo trials (default: {DEFAULT_MAX_TRIALS})",
+    )
+    parser.add_argument(
+        "--equity-seed",
+        type=int,
+        default=0,
+        help="Seed for reproducible Monte Carlo equity (default: 0)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for Monte Carlo equity and --batch (0 = all CPUs, default: 1)",
+    )
+
+    parser.add_argument(
+        "--batch",
+        metavar="INPUT",
+        default=None,
+        help="Score every observation in a JSONL file (- for stdin) and exit",
+    )
+    parser.add_argument(
+        "--batch-output",
+        default="-",
+        help="Where to write --batch results (default: stdout)",
+    )
+    parser.add_argument(
+        "--batch-format",
+        choices=OUTPUT_FORMATS,
+        default=None,
+        help="Result format for --batch (default: csv for .csv outputs, else jsonl)",
+    )
+    parser.add_argument(
+        "--batch-chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Observations read and scored per chunk in --batch mode (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    parser.add_argument(
+        "--batch-strategy",
+        default=None,
+        help="Strategy pack or JSON to score --batch against (default: the shipped chart)",
+    )
+
+    parser.add_argument(
+        "--serve",
+        nargs="?",
+        const=DEFAULT_SERVE_ADDRESS,
+        default=None,
+        metavar="ADDRESS",
+        help=f"Serve recommendations as newline-delimited JSON on HOST:PORT or unix:PATH (default: {DEFAULT_SERVE_ADDRESS})",
+    )
+
+    parser.add_argument(
+        "--query",
+        nargs=argparse.REMAINDER,
+        default=None,
+        metavar="ARGS",
+        help="Run a strategy query (freq/mixed, see --query --help) over the strategy data and exit",
+    )
 
     args = parser.parse_args(argv)
 
+    if args.query is not None:
+        from shortdeck_cli.strategy_query import main as run_strategy_query
+
+        run_strategy_query(args.query, prog=f"{parser.prog} --query")
+        return
+
+    if args.batch:
+        output_format = args.batch_format or ("csv" if args.batch_output.lower().endswith(".csv") else "jsonl")
+        config = BatchConfig(strategy_path=args.batch_strategy, strategy_dir=args.strategy_dir)
+        try:
+            with ExitStack() as stack:
+                source = sys.stdin if args.batch == "-" else stack.enter_context(open(args.batch, encoding="utf-8"))
+                if args.batch_output == "-":
+                    output = sys.stdout
+                else:
+                    output = stack.enter_context(open(args.batch_output, "w", encoding="utf-8", newline=""))
+                summary = run_batch(
+                    source,
+                    output,
+                    output_format=output_format,
+                    chunk_size=args.batch_chunk_size,
+                    workers=args.workers or None,
+                    config=config,
+                )
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+        print(f"Scored {summary.records} observations ({summary.errors} skipped).", file=sys.stderr)
+        return
+
+    if args.equity:
+        if not args.equity_range:
+            parser.error("--equity-range is required when --equity is used")
+        try:
+            run_equity_mode(
+                hero_hand=args.equity,
+                villain_range=args.equity_range,
+                board=args.equity_board,
+                workers=args.workers or None,
+                tolerance=args.equity_tolerance,
+                max_trials=args.equity_max_trials,
+                seed=args.equity_seed,
+            )
+        except ValueError as error:
+            parser.error(str(error))
+        return
+
+    if args.serve:
+        from shortdeck_cli.server import RecommendationService, create_server
+
+        registry, reloader = _strategy_sources(args, parser)
+        try:
+            server = create_server(args.serve, RecommendationService(registry=registry, reloader=reloader))
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+        if reloader is not None:
+            reloader.start()
+        try:
+            run_server(server)
+        finally:
+            if reloader is not None:
+                reloader.stop()
+        return
+
     if args.auto:
-        if args.auto_source == "jsonl":
+        registry, reloader = _strategy_sources(args, parser)
+        tables: dict[str, ObservationSource] = {}
+        for spec in args.auto_table:
+            table_id, separator, table_source = (part.strip() for part in spec.partition("="))
+            if not separator or not table_id or not table_source:
+                parser.error(f"--auto-table expects ID=SOURCE, got: {spec}")
+            if table_id in tables:
+                parser.error(f"Duplicate --auto-table id: {table_id}")
+            tables[table_id] = _auto_table_source(table_id, table_source, args, parser)
+
+        if tables:
+            source: ObservationSource | None = None
+        elif args.auto_source == "jsonl":
             if not args.auto_source_jsonl:
                 parser.error("--auto-source-jsonl is required when --auto-source jsonl is used")
-            source: ObservationSource = JsonlObservationSource(args.auto_source_jsonl)
+            source = JsonlObservationSource(args.auto_source_jsonl)
+        elif args.auto_source == "replay":
+            from shortdeck_cli.ocr_replay import DebugFrameReplaySource
+
+            if not args.auto_replay_dir or not args.auto_hero_position:
+                parser.error("--auto-replay-dir and --auto-hero-position are required when --auto-source replay is used")
+            try:
+                source = DebugFrameReplaySource(args.auto_replay_dir, hero_position=args.auto_hero_position)
+            except ValueError as error:
+                parser.error(str(error))
         else:
             if not args.auto_hero_position:
                 parser.error("--auto-hero-position is required when --auto-source pokerstars is used")
-            source = PokerStarsWindowOcrSource(
-                hero_position=args.auto_hero_position,
-                window_title_contains=args.auto_window_title,
-                tesseract_cmd=args.auto_tesseract_cmd,
-                debug_dir=args.auto_debug_dir,
-                roi_config_path=args.auto_roi_config,
-            )
-        run_auto_mode(source=source, poll_seconds=args.auto_poll_seconds, max_hands=args.auto_max_hands)
+            source = _pokerstars_source(args, parser, args.auto_hero_position, args.auto_window_title, args.auto_debug_dir)
+
+        if reloader is not None:
+            reloader.start()
+        try:
+            if source is None:
+                run_multi_table_auto_mode(
+                    tables,
+                    poll_seconds=args.auto_poll_seconds,
+                    max_hands=args.auto_max_hands,
+                    registry=registry,
+                    reloader=reloader,
+                    measure_latency=args.auto_latency,
+                    queue_size=args.auto_queue_size,
+                )
+            else:
+                run_auto_mode(
+                    source=source,
+                    poll_seconds=args.auto_poll_seconds,
+                    max_hands=args.auto_max_hands,
+                    registry=registry,
+                    reloader=reloader,
+                    measure_latency=args.auto_latency,
+                )
+        finally:
+            if reloader is not None:
+                reloader.stop()
+            for opened in (source, *tables.values()):
+                close = getattr(opened, "close", None)
+                if close is not None:
+                    close()
         return
 
     run_manual_mode()
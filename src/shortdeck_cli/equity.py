@@ -0,0 +1,265 @@
+"""Hero-vs-range equity for preflop and postflop short-deck spots.
+
+Villain ranges use the hand-class notation of ``preflop_scenarios.json``
+(``AA``, ``AKs``, ``T9o``) with a weight per class, either parsed from text
+(``"AA, AKs, T9o:0.5"``) or taken from the action weights of a scenario's
+``hand_actions``. Every class is expanded into concrete combos and combos that
+collide with hero's cards or the board are dropped (card removal).
+
+Turn and river spots are enumerated exactly. Flop spots are enumerated
+exactly unless a trial count is given, and preflop spots use seeded Monte
+Carlo sampling.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import accumulate, combinations
+
+from shortdeck_cli.batch_evaluator import batch_available, evaluate_batch
+from shortdeck_cli.evaluator import load_strategy_index
+from shortdeck_cli.hand_evaluator import (
+    CARD_RANK_KEY,
+    CARD_SUIT_BIT,
+    DECK_SIZE,
+    RANK_TO_INDEX,
+    SUIT_TO_INDEX,
+    encode_cards,
+    hand_state,
+    score_state,
+)
+from shortdeck_cli.rules import HAND_CLASSES
+
+DEFAULT_PREFLOP_TRIALS = 20000
+BOARD_SIZE = 5
+
+
+@dataclass(frozen=True)
+class EquityResult:
+    equity: float
+    win: float
+    tie: float
+    lose: float
+    samples: int
+    exact: bool
+    std_error: float = 0.0
+
+
+def hand_class_combos(hand_class: str) -> list[tuple[int, int]]:
+    if hand_class not in HAND_CLASSES:
+        raise ValueError(f"Unknown hand class: {hand_class}")
+
+    first = RANK_TO_INDEX[hand_class[0]] * 4
+    second = RANK_TO_INDEX[hand_class[1]] * 4
+    suits = range(len(SUIT_TO_INDEX))
+    if first == second:
+        return [(first + one, first + two) for one, two in combinations(suits, 2)]
+    if hand_class[2] == "s":
+        return [(first + suit, second + suit) for suit in suits]
+    return [(first + one, second + two) for one in suits for two in suits if one != two]
+
+
+def parse_range(raw_value: str) -> dict[str, float]:
+    """Parse ``"AA, AKs, T9o:0.5"`` into class weights (``:50%`` also means 0.5, ``:1%`` is 0.01)."""
+    weights: dict[str, float] = {}
+    for token in raw_value.replace(",", " ").split():
+        hand_class, _, raw_weight = token.partition(":")
+        hand_class = hand_class[:2].upper() + hand_class[2:].lower()
+        if hand_class not in HAND_CLASSES:
+            raise ValueError(f"Unknown hand class in range: {token}")
+        percent = raw_weight.endswith("%")
+        try:
+            weight = float(raw_weight[:-1] if percent else raw_weight) if raw_weight else 1.0
+        except ValueError as error:
+            raise ValueError(f"Invalid range weight: {token}") from error
+        if percent:
+            weight /= 100
+        if not 0 <= weight <= 1:
+            raise ValueError(f"Range weight must be between 0 and 1 (or 0-100%): {token}")
+        weights[hand_class] = weight
+    if not weights:
+        raise ValueError("Range must contain at least one hand class (example: AA, AKs, T9o:0.5).")
+    return weights
+
+
+def range_from_scenario(scenario_key: str, actions: tuple[str, ...] = ("all-in",)) -> dict[str, float]:
+    """Weight each hand class by how often it takes ``actions`` in a scenario."""
+    index = load_strategy_index()
+    scenario_id = index.scenario_ids.get(scenario_key)
+    if scenario_id is None:
+        raise ValueError(f"Unknown scenario: {scenario_key}")
+
+    weights: dict[str, float] = {}
+    for hand_class in HAND_CLASSES:
+        distribution = index.distribution(scenario_id, hand_class)
+        if distribution is None:
+            continue
+        share = sum(percent for action, percent in distribution if action in actions) / 100
+        if share > 0:
+            weights[hand_class] = share
+    return weights
+
+
+def _live_combos(villain_range: dict[str, float], dead: set[int]) -> list[tuple[tuple[int, int], float]]:
+    combos: list[tuple[tuple[int, int], float]] = []
+    for hand_class, weight in villain_range.items():
+        if weight <= 0:
+            continue
+        for combo in hand_class_combos(hand_class):
+            if combo[0] not in dead and combo[1] not in dead:
+                combos.append((combo, weight))
+    return combos
+
+
+def _runout_scores(hole: list[int], runouts: list[tuple[int, ...]]) -> list[int]:
+    if not runouts:
+        return []
+    if batch_available():
+        return evaluate_batch(hole, runouts).tolist()
+    rank_key, suit_bits = hand_state(hole)
+    scores: list[int] = []
+    for runout in runouts:
+        runout_key, runout_bits = rank_key, suit_bits
+        for card in runout:
+            runout_key += CARD_RANK_KEY[card]
+            runout_bits |= CARD_SUIT_BIT[card]
+        scores.append(score_state(runout_key, runout_bits))
+    return scores
+
+
+def _exact_equity(hero: list[int], board: list[int], combos: list[tuple[tuple[int, int], float]]) -> EquityResult:
+    dead = set(hero) | set(board)
+    live = [card for card in range(DECK_SIZE) if card not in dead]
+    runouts = [tuple(board) + extra for extra in combinations(live, BOARD_SIZE - len(board))]
+    hero_scores = _runout_scores(hero, runouts)
+
+    win = tie = lose = 0.0
+    samples = 0
+    for (first, second), weight in combos:
+        valid = [index for index, runout in enumerate(runouts) if first not in runout and second not in runout]
+        villain_scores = _runout_scores([first, second], [runouts[index] for index in valid])
+        share = weight / len(valid)
+        for index, villain_score in zip(valid, villain_scores):
+            hero_score = hero_scores[index]
+            if hero_score > villain_score:
+                win += share
+            elif hero_score == villain_score:
+                tie += share
+            else:
+                lose += share
+        samples += len(valid)
+
+    total = win + tie + lose
+    return EquityResult(
+        equity=(win + tie / 2) / total,
+        win=win / total,
+        tie=tie / total,
+        lose=lose / total,
+        samples=samples,
+        exact=True,
+    )
+
+
+def sampled_counts(
+    hero: list[int],
+    board: list[int],
+    combos: list[tuple[tuple[int, int], float]],
+    trials: int,
+    rng: random.Random,
+) -> tuple[int, int, int]:
+    dead = set(hero) | set(board)
+    live = [card for card in range(DECK_SIZE) if card not in dead]
+    cumulative = list(accumulate(weight for _, weight in combos))
+    total_weight = cumulative[-1]
+    missing = BOARD_SIZE - len(board)
+
+    hero_key, hero_bits = hand_state(hero + board)
+    board_key, board_bits = hand_state(board)
+    wins = ties = losses = 0
+    for _ in range(trials):
+        first, second = combos[bisect_right(cumulative, rng.random() * total_weight)][0]
+        runout = rng.sample([card for card in live if card != first and card != second], missing)
+
+        runout_key = sum(CARD_RANK_KEY[card] for card in runout)
+        runout_bits = 0
+        for card in runout:
+            runout_bits |= CARD_SUIT_BIT[card]
+        hero_score = score_state(hero_key + runout_key, hero_bits | runout_bits)
+        villain_score = score_state(
+            board_key + runout_key + CARD_RANK_KEY[first] + CARD_RANK_KEY[second],
+            board_bits | runout_bits | CARD_SUIT_BIT[first] | CARD_SUIT_BIT[second],
+        )
+        if hero_score > villain_score:
+            wins += 1
+        elif hero_score == villain_score:
+            ties += 1
+        else:
+            losses += 1
+    return wins, ties, losses
+
+
+def sampled_result(wins: int, ties: int, losses: int) -> EquityResult:
+    trials = wins + ties + losses
+    equity = (wins + ties / 2) / trials
+    # Each trial scores 1, 0.5 or 0, so E[x^2] = (wins + ties / 4) / trials.
+    variance = max((wins + ties / 4) / trials - equity * equity, 0.0)
+    return EquityResult(
+        equity=equity,
+        win=wins / trials,
+        tie=ties / trials,
+        lose=losses / trials,
+        samples=trials,
+        exact=False,
+        std_error=math.sqrt(variance / trials),
+    )
+
+
+def _validate_spot(hero_cards: list[str], board_cards: list[str]) -> tuple[list[int], list[int]]:
+    if len(hero_cards) != 2:
+        raise ValueError("Hero must hold exactly 2 cards (example: AsKd).")
+    if len(board_cards) not in (0, 3, 4, 5):
+        raise ValueError("Board must have 0, 3, 4 or 5 cards.")
+    hero = encode_cards(hero_cards)
+    board = encode_cards(board_cards)
+    if len(set(hero + board)) != len(hero) + len(board):
+        raise ValueError("Hero cards and board must not share cards.")
+    return hero, board
+
+
+def prepare_spot(
+    hero_cards: list[str],
+    villain_range: dict[str, float],
+    board_cards: list[str] | None = None,
+) -> tuple[list[int], list[int], list[tuple[tuple[int, int], float]]]:
+    """Encode a spot and expand the villain range into live, weighted combos."""
+    hero, board = _validate_spot(hero_cards, board_cards or [])
+    if not any(weight > 0 for weight in villain_range.values()):
+        raise ValueError("Villain range is empty.")
+    combos = _live_combos(villain_range, set(hero) | set(board))
+    if not combos:
+        raise ValueError("Villain range has no combos left after card removal.")
+    return hero, board, combos
+
+
+def equity_vs_range(
+    hero_cards: list[str],
+    villain_range: dict[str, float],
+    board_cards: list[str] | None = None,
+    trials: int | None = None,
+    seed: int | None = None,
+) -> EquityResult:
+    """Hero equity (win + tie / 2) against a weighted villain range.
+
+    Turn and river boards are always enumerated. Flop boards are enumerated
+    unless ``trials`` is set; preflop uses ``trials`` Monte Carlo samples
+    (default ``DEFAULT_PREFLOP_TRIALS``) drawn from ``random.Random(seed)``.
+    """
+    hero, board, combos = prepare_spot(hero_cards, villain_range, board_cards)
+    if len(board) >= 4 or (len(board) == 3 and trials is None):
+        return _exact_equity(hero, board, combos)
+
+    trials = trials or DEFAULT_PREFLOP_TRIALS
+    return sampled_result(*sampled_counts(hero, board, combos, trials, random.Random(seed)))
@@ -0,0 +1,94 @@
+"""Multiprocess Monte Carlo equity runner with deterministic seeding.
+
+Trials are split into fixed-size batches. Batch ``i`` always draws from a
+seed derived from ``(seed, i)``, batches are merged in index order and the
+stopping rule is checked after each merged batch, so the result depends only
+on the seed, batch size and tolerance — never on the worker count or on
+which process finishes first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+import concurrent.futures
+
+from shortdeck_cli.equity import EquityResult, prepare_spot, sampled_counts, sampled_result
+
+DEFAULT_BATCH_TRIALS = 20000
+DEFAULT_MAX_TRIALS = 2_000_000
+DEFAULT_TOLERANCE = 0.001
+
+
+def batch_seed(seed: int, batch_index: int) -> int:
+    digest = hashlib.sha256(f"{seed}:{batch_index}".encode("ascii")).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+def _run_batch(
+    hero: list[int],
+    board: list[int],
+    combos: list[tuple[tuple[int, int], float]],
+    trials: int,
+    seed: int,
+) -> tuple[int, int, int]:
+    return sampled_counts(hero, board, combos, trials, random.Random(seed))
+
+
+def run_monte_carlo_equity(
+    hero_cards: list[str],
+    villain_range: dict[str, float],
+    board_cards: list[str] | None = None,
+    workers: int | None = 1,
+    batch_trials: int = DEFAULT_BATCH_TRIALS,
+    max_trials: int = DEFAULT_MAX_TRIALS,
+    tolerance: float = DEFAULT_TOLERANCE,
+    seed: int = 0,
+) -> EquityResult:
+    """Sample equity until the standard error drops to ``tolerance``.
+
+    ``workers=None`` uses every CPU; ``workers=1`` runs in-process. At most
+    ``max_trials`` trials (rounded up to whole batches) are merged.
+    """
+    if batch_trials <= 0 or max_trials <= 0:
+        raise ValueError("batch_trials and max_trials must be positive.")
+    if tolerance <= 0:
+        raise ValueError("tolerance must be positive.")
+
+    hero, board, combos = prepare_spot(hero_cards, villain_range, board_cards)
+    workers = workers or os.cpu_count() or 1
+    max_batches = -(-max_trials // batch_trials)
+
+    totals = [0, 0, 0]
+    result: EquityResult | None = None
+
+    def merge(counts: tuple[int, int, int]) -> bool:
+        nonlocal result
+        for position, count in enumerate(counts):
+            totals[position] += count
+        result = sampled_result(*totals)
+        return result.std_error <= tolerance
+
+    if workers == 1:
+        for batch_index in range(max_batches):
+            if merge(_run_batch(hero, board, combos, batch_trials, batch_seed(seed, batch_index))):
+                break
+        return result
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        next_batch = 0
+        while next_batch < max_batches:
+            # One round keeps every worker busy; batches past the stopping
+            # point are discarded so the answer never depends on timing.
+            round_indexes = range(next_batch, min(next_batch + workers, max_batches))
+            futures = [
+                executor.submit(_run_batch, hero, board, combos, batch_trials, batch_seed(seed, batch_index))
+                for batch_index in round_indexes
+            ]
+            next_batch = round_indexes.stop
+            if any(merge(future.result()) for future in futures):
+                for future in futures:
+                    future.cancel()
+                break
+    return result
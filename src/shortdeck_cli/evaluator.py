@@ -5,6 +5,18 @@ from functools import lru_cache
 from json import load
 from pathlib import Path
 
+from shortdeck_cli.preflop_tree import PreflopTree, preflop_tree
+from shortdeck_cli.rules import ACTIONS, POSITIONS
+from shortdeck_cli.strategy_index import StrategyIndex, compile_strategy_index
+from shortdeck_cli.strategy_pack import (
+    PACK_SUFFIX,
+    StrategyPack,
+    pack_source_digest,
+    pack_source_stamp,
+    source_digest,
+    source_stamp,
+)
+
 
 POSITION_ALIAS = {
     "UTG": "UTG",
@@ -15,30 +27,35 @@ POSITION_ALIAS = {
     "BTN": "BTN",
 }
 
-DISPLAY_MIN_PERCENT = 1.0
+STRATEGY_JSON_NAME = "preflop_scenarios.json"
+STRATEGY_PACK_NAME = "preflop_scenarios.sdpack"
 
 
-@lru_cache(maxsize=1)
-def load_strategy_data() -> dict:
+def _data_file_candidates(file_name: str) -> list[Path]:
     candidates: list[Path] = []
 
-    package_path = Path(__file__).resolve().parent / "data" / "preflop_scenarios.json"
+    package_path = Path(__file__).resolve().parent / "data" / file_name
     candidates.append(package_path)
 
     bundle_dir = getattr(sys, "_MEIPASS", None)
     if bundle_dir:
-        candidates.append(Path(bundle_dir) / "shortdeck_cli" / "data" / "preflop_scenarios.json")
-        candidates.append(Path(bundle_dir) / "data" / "preflop_scenarios.json")
+        candidates.append(Path(bundle_dir) / "shortdeck_cli" / "data" / file_name)
+        candidates.append(Path(bundle_dir) / "data" / file_name)
 
     exe_dir = Path(sys.executable).resolve().parent
-    candidates.append(exe_dir / "shortdeck_cli" / "data" / "preflop_scenarios.json")
-    candidates.append(exe_dir / "data" / "preflop_scenarios.json")
+    candidates.append(exe_dir / "shortdeck_cli" / "data" / file_name)
+    candidates.append(exe_dir / "data" / file_name)
+    return candidates
 
+
+@lru_cache(maxsize=1)
+def load_strategy_data() -> dict:
+    candidates = _data_file_candidates(STRATEGY_JSON_NAME)
     file_path = next((candidate for candidate in candidates if candidate.exists()), None)
     if file_path is None:
         searched = "\n".join(str(candidate) for candidate in candidates)
         raise FileNotFoundError(
-            "Could not locate preflop_scenarios.json. Searched:\n"
+            f"Could not locate {STRATEGY_JSON_NAME}. Searched:\n"
             f"{searched}"
         )
 
@@ -67,81 +84,147 @@ def _fallback_recommendation(hero_hand: str, villain_action: str) -> str:
     return "Dummy recommendation: Open"
 
 
-def _format_percent(value: float) -> str:
-    rounded = round(value, 1)
-    if rounded.is_integer():
-        return str(int(rounded))
-    return f"{rounded:.1f}"
+@lru_cache(maxsize=1)
+def strategy_spots() -> dict[tuple[str, str, str], str]:
+    return {
+        (hero, villain, action): build_scenario_key(hero, villain, action)
+        for hero in POSITIONS
+        for villain in POSITIONS
+        for action in ACTIONS
+    }
+
+
+def node_scenario_keys(tree: PreflopTree, node_id: int) -> tuple[str, ...]:
+    """Scenario keys a tree node reads, most specific first.
+
+    The exact sequence key comes first. A node where at most one player
+    before the hero entered the pot, with a limp or an all-in, also reads the
+    single-villain key of ``build_scenario_key`` (MP1 and MP2 share it).
+    """
+    hero = tree.to_act(node_id)
+    keys = [tree.line_key(node_id)]
+    entered = [(position, action) for position, action in tree.history(node_id) if action != "fold"]
+    if not entered:
+        keys.append(build_scenario_key(hero, hero, "fold"))
+    elif len(entered) == 1 and entered[0][1] in ("limp", "all-in"):
+        keys.append(build_scenario_key(hero, *entered[0]))
+    return tuple(keys)
 
 
-def _format_data_recommendation(action_data: str | dict[str, float | int]) -> str:
-    if isinstance(action_data, str):
-        return f"Data recommendation: {action_data} (confidence: high)"
+@lru_cache(maxsize=1)
+def strategy_nodes() -> tuple[tuple[str, ...], ...]:
+    tree = preflop_tree()
+    return tuple(node_scenario_keys(tree, node_id) for node_id in range(tree.node_count))
 
-    allowed_actions = {"all-in", "call", "fold", "raise", "check", "open", "limp", "ante"}
-    raw_entries: list[tuple[str, float]] = []
-    for action, raw_value in action_data.items():
-        if action not in allowed_actions:
-            continue
-        value = float(raw_value)
-        if value <= 0:
-            continue
-        raw_entries.append((action, value))
 
-    use_fraction_scale = bool(raw_entries) and all(0 < value <= 1 for _, value in raw_entries)
-    normalized: list[tuple[str, float]] = []
-    for action, value in raw_entries:
-        if use_fraction_scale:
-            value *= 100
-        normalized.append((action, value))
+def index_from_data(data: dict) -> StrategyIndex:
+    return compile_strategy_index(data, strategy_spots(), strategy_nodes)
 
-    if not normalized:
-        return "Data recommendation: TBD"
 
-    total = sum(value for _, value in normalized)
-    if total <= 0:
-        return "Data recommendation: TBD"
+def load_strategy_file(path: str | Path, in_memory: bool = False) -> StrategyIndex:
+    """Index over a specific strategy pack (``.sdpack``) or strategy JSON file.
 
-    scaled = [(action, (value / total) * 100) for action, value in normalized]
-    scaled.sort(key=lambda item: item[1], reverse=True)
+    ``in_memory`` reads a pack instead of mapping it, so the file can be replaced on Windows.
+    """
+    path = Path(path)
+    if path.suffix == PACK_SUFFIX:
+        return StrategyPack(path, in_memory=in_memory).index(strategy_spots(), strategy_nodes)
+    with path.open("r", encoding="utf-8") as data_file:
+        return index_from_data(load(data_file))
 
-    filtered = [(action, value) for action, value in scaled if value >= DISPLAY_MIN_PERCENT]
-    if not filtered:
-        filtered = [scaled[0]]
 
-    filtered_total = sum(value for _, value in filtered)
-    display_scaled = [(action, (value / filtered_total) * 100) for action, value in filtered]
+def _first_existing(file_name: str) -> Path | None:
+    return next((candidate for candidate in _data_file_candidates(file_name) if candidate.exists()), None)
 
-    top_weight = display_scaled[0][1]
-    if top_weight >= 90:
-        confidence = "high"
-    elif top_weight >= 60:
-        confidence = "medium"
-    else:
-        confidence = "low"
 
-    if len(display_scaled) == 1:
-        return f"Data recommendation: {display_scaled[0][0]} (confidence: {confidence})"
+def pack_matches_source(pack_path: Path, source_path: Path) -> bool:
+    """Whether a pack was built from the current contents of ``source_path``.
 
-    parts = [f"{_format_percent(value)}% {action}" for action, value in display_scaled]
-    return f"Data recommendation: {', '.join(parts)} (confidence: {confidence})"
+    A matching size and modification time settle it without reading the JSON.
+    Only when they differ (the JSON was edited, or copied by a checkout) is the
+    JSON hashed and compared with the recorded digest.
+    """
+    try:
+        stamp = pack_source_stamp(pack_path)
+        if stamp is not None and stamp == source_stamp(source_path):
+            return True
+        return pack_source_digest(pack_path) == source_digest(source_path)
+    except (OSError, ValueError):
+        return False
 
 
-def recommend_action(hero_hand: str, hero_position: str, villain_position: str, villain_action: str) -> tuple[str, str]:
-    scenario_key = build_scenario_key(
-        hero_position=hero_position,
-        villain_position=villain_position,
-        villain_action=villain_action,
+@lru_cache(maxsize=1)
+def _warn_stale_pack(pack_path: Path, source_path: Path) -> None:
+    print(
+        f"Warning: {pack_path.name} was not built from the current {source_path.name}; using the JSON. "
+        "Rebuild the pack with: python -m shortdeck_cli.strategy_pack build",
+        file=sys.stderr,
     )
-    scenarios = load_strategy_data().get("scenarios", {})
-    scenario = scenarios.get(scenario_key)
-
-    if scenario and hero_hand in scenario.get("hand_actions", {}):
-        action = scenario["hand_actions"][hero_hand]
-        recommendation = _format_data_recommendation(action)
-    elif scenario and scenario.get("default_recommendation") != "TBD":
-        recommendation = _format_data_recommendation(scenario["default_recommendation"])
-    else:
+
+
+def strategy_source_path() -> Path | None:
+    """The shipped strategy JSON, the file to edit when changing the charts."""
+    return _first_existing(STRATEGY_JSON_NAME)
+
+
+def default_strategy_path() -> Path | None:
+    """The shipped strategy pack, or the strategy JSON when there is no pack or it is out of date."""
+    pack_path = _first_existing(STRATEGY_PACK_NAME)
+    source_path = _first_existing(STRATEGY_JSON_NAME)
+    if pack_path is not None and (source_path is None or pack_matches_source(pack_path, source_path)):
+        return pack_path
+    if pack_path is not None:
+        _warn_stale_pack(pack_path, source_path)
+    return source_path
+
+
+@lru_cache(maxsize=1)
+def load_strategy_index() -> StrategyIndex:
+    """Index over the shipped strategy pack, or over the JSON when no usable, up-to-date pack exists."""
+    path = default_strategy_path()
+    if path is not None and path.suffix == PACK_SUFFIX:
+        try:
+            return load_strategy_file(path)
+        except (OSError, ValueError):
+            pass
+    return index_from_data(load_strategy_data())
+
+
+def recommend_action(
+    hero_hand: str,
+    hero_position: str,
+    villain_position: str,
+    villain_action: str,
+    strategy: StrategyIndex | None = None,
+) -> tuple[str, str]:
+    """Look up a spot in ``strategy`` (default: the shipped strategy pack)."""
+    index = strategy if strategy is not None else load_strategy_index()
+    scenario_key, scenario_id = index.spot(hero_position, villain_position, villain_action)
+    recommendation = index.recommendation(scenario_id, hero_hand)
+    if recommendation is None:
         recommendation = _fallback_recommendation(hero_hand=hero_hand, villain_action=villain_action)
 
     return scenario_key, recommendation
+
+
+def recommend_line(
+    hero_hand: str,
+    hero_position: str,
+    line: list[tuple[str, str]],
+    strategy: StrategyIndex | None = None,
+) -> tuple[str, str]:
+    """Look up the hero's decision after a preflop action ``line`` of ``(position, action)`` pairs.
+
+    Players missing from ``line`` before the hero are taken to have folded.
+    """
+    index = strategy if strategy is not None else load_strategy_index()
+    tree = preflop_tree()
+    node_id = tree.hero_node(hero_position, line)
+    scenario_key, scenario_id = index.node(node_id)
+    recommendation = index.recommendation(scenario_id, hero_hand)
+    if recommendation is None:
+        facing = tree.facing(node_id)
+        fallback_action = "fold" if facing is None else "limp" if facing == "limp" else "all-in"
+        recommendation = _fallback_recommendation(hero_hand=hero_hand, villain_action=fallback_action)
+
+    return scenario_key, recommendation
@@ -0,0 +1,129 @@
+"""Block until a file changes instead of sleeping a fixed poll interval.
+
+On Linux ``InotifyWaiter`` watches the file's directory through the kernel's
+inotify API (via ctypes) and waits on the descriptor with ``selectors``, so
+a writer's append wakes the reader immediately. Watching the directory also
+catches the file being created, replaced or rotated. Elsewhere, or when
+inotify is unavailable, ``StatPollWaiter`` checks the file's size, mtime and
+inode at a short interval.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import selectors
+import struct
+import sys
+import time
+from pathlib import Path
+
+DEFAULT_STAT_INTERVAL = 0.05
+
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+# wd, mask, cookie, name length; the NUL-padded name follows.
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _file_signature(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class StatPollWaiter:
+    """Portable fallback: poll the file's stat signature every ``interval`` seconds."""
+
+    def __init__(self, path: str | Path, interval: float = DEFAULT_STAT_INTERVAL):
+        self.path = Path(path)
+        self.interval = interval
+        self._signature = _file_signature(self.path)
+
+    def wait(self, timeout: float) -> bool:
+        """Return ``True`` as soon as the file changed, ``False`` after ``timeout`` seconds."""
+        deadline = time.monotonic() + timeout
+        while True:
+            signature = _file_signature(self.path)
+            if signature != self._signature:
+                self._signature = signature
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(self.interval, remaining))
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWaiter:
+    """Linux inotify watch on the file's directory, filtered to the file's name."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path).resolve()
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self._fd, os.fsencode(self.path.parent), _WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"inotify_add_watch failed for {self.path.parent}")
+
+        self._name = os.fsencode(self.path.name)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._fd, selectors.EVENT_READ)
+
+    def _drain(self) -> bool:
+        touched = False
+        while True:
+            try:
+                payload = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return touched
+            offset = 0
+            while offset < len(payload):
+                _, _, _, name_length = _EVENT_HEADER.unpack_from(payload, offset)
+                start = offset + _EVENT_HEADER.size
+                if payload[start:start + name_length].rstrip(b"\0") == self._name:
+                    touched = True
+                offset = start + name_length
+
+    def wait(self, timeout: float) -> bool:
+        """Return ``True`` as soon as the file changed, ``False`` after ``timeout`` seconds."""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._selector.select(remaining):
+                return False
+            # Events for other files in the directory are consumed and ignored.
+            if self._drain():
+                return True
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            self._selector.close()
+            os.close(self._fd)
+            self._fd = -1
+
+
+def file_waiter(path: str | Path, interval: float = DEFAULT_STAT_INTERVAL) -> InotifyWaiter | StatPollWaiter:
+    """Best available waiter for ``path``: inotify on Linux, stat polling otherwise."""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWaiter(path)
+        except (AttributeError, OSError):
+            pass
+    return StatPollWaiter(path, interval=interval)
@@ -0,0 +1,73 @@
+"""Skip OCR on screen regions that did not change since the last read.
+
+Each region crop is reduced to a small grayscale thumbnail. OCR runs again
+only when some thumbnail pixel moved by more than ``pixel_threshold`` from
+the thumbnail of the crop that was last OCRed; otherwise the cached text is
+returned. Downsampling averages away anti-aliasing and compression noise,
+while a new card or action line still shifts some pixels a lot. Comparing
+with the last OCRed crop (not the previous frame) keeps slow drift from
+going unnoticed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+DEFAULT_THUMBNAIL_SIZE = (64, 16)
+DEFAULT_PIXEL_THRESHOLD = 24
+
+
+def region_thumbnail(image, size: tuple[int, int] = DEFAULT_THUMBNAIL_SIZE) -> bytes:
+    """Grayscale, downsampled pixels of a PIL image crop."""
+    return image.convert("L").resize(size).tobytes()
+
+
+def thumbnails_differ(previous: bytes, current: bytes, pixel_threshold: int = DEFAULT_PIXEL_THRESHOLD) -> bool:
+    if len(previous) != len(current):
+        return True
+    return any(abs(old - new) > pixel_threshold for old, new in zip(previous, current))
+
+
+class FrameDiffGate:
+    """Per-region OCR cache keyed by region name."""
+
+    def __init__(
+        self,
+        thumbnail_size: tuple[int, int] = DEFAULT_THUMBNAIL_SIZE,
+        pixel_threshold: int = DEFAULT_PIXEL_THRESHOLD,
+    ):
+        if pixel_threshold < 0:
+            raise ValueError("pixel_threshold must be non-negative.")
+        self.thumbnail_size = thumbnail_size
+        self.pixel_threshold = pixel_threshold
+        self.ocr_runs = 0
+        self.reused = 0
+        self._thumbnails: dict[str, bytes] = {}
+        self._texts: dict[str, str] = {}
+
+    def lookup(self, name: str, image) -> tuple[bytes, str | None]:
+        """Return the crop's thumbnail and the cached text, or ``None`` when the region must be OCRed again."""
+        thumbnail = region_thumbnail(image, self.thumbnail_size)
+        previous = self._thumbnails.get(name)
+        if previous is not None and not thumbnails_differ(previous, thumbnail, self.pixel_threshold):
+            self.reused += 1
+            return thumbnail, self._texts[name]
+        return thumbnail, None
+
+    def store(self, name: str, thumbnail: bytes, text: str) -> None:
+        self.ocr_runs += 1
+        self._thumbnails[name] = thumbnail
+        self._texts[name] = text
+
+    def read(self, name: str, image, ocr: Callable[[object], str]) -> tuple[str, bool]:
+        """Return ``(text, changed)``, calling ``ocr(image)`` only when the region changed."""
+        thumbnail, text = self.lookup(name, image)
+        if text is not None:
+            return text, False
+        text = ocr(image)
+        self.store(name, thumbnail, text)
+        return text, True
+
+    def reset(self) -> None:
+        self._thumbnails.clear()
+        self._texts.clear()
@@ -0,0 +1,191 @@
+"""Integer card encoding and table-driven short-deck hand evaluation.
+
+Cards are encoded as ``rank_index * 4 + suit_index`` (0..35) using the same
+rank-major order as ``postflop.full_shortdeck_deck``. A hand is reduced to an
+additive rank key (base-5 rank histogram) plus a 36-bit suit/rank mask, and
+both are resolved through precomputed tables, so 5, 6 and 7 card hands are
+scored directly without enumerating 5-card combinations.
+
+Scores are plain integers: ``category << 20`` followed by up to five 4-bit
+rank nibbles, ordered exactly like the legacy ``_evaluate_five`` tuples.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
+
+RANK_ORDER = "6789TJQKA"
+RANK_TO_INDEX = {rank: index for index, rank in enumerate(RANK_ORDER)}
+SUITS = "shdc"
+SUIT_TO_INDEX = {suit: index for index, suit in enumerate(SUITS)}
+
+CATEGORY_NAME = {
+    0: "High Card",
+    1: "One Pair",
+    2: "Two Pair",
+    3: "Three of a Kind",
+    4: "Straight",
+    5: "Full House",
+    6: "Flush",
+    7: "Four of a Kind",
+    8: "Straight Flush",
+}
+
+# Bump whenever the scoring rules or score encoding change; persisted rank
+# tables record it and are rejected when it no longer matches.
+RULES_VERSION = 1
+
+DECK_SIZE = len(RANK_ORDER) * len(SUITS)
+CATEGORY_SHIFT = 20
+RANK_MASK = (1 << len(RANK_ORDER)) - 1
+
+CARD_NAMES = tuple(f"{rank}{suit}" for rank in RANK_ORDER for suit in SUITS)
+CARD_TO_INDEX = {card: index for index, card in enumerate(CARD_NAMES)}
+CARD_RANK_KEY = tuple(5 ** (index // 4) for index in range(DECK_SIZE))
+CARD_SUIT_BIT = tuple(1 << ((index % 4) * len(RANK_ORDER) + index // 4) for index in range(DECK_SIZE))
+
+
+def card_index(card: str) -> int:
+    try:
+        return CARD_TO_INDEX[card]
+    except KeyError as error:
+        raise ValueError(f"Unknown short-deck card: {card}") from error
+
+
+def card_name(index: int) -> str:
+    return CARD_NAMES[index]
+
+
+def encode_cards(cards: Iterable[str]) -> list[int]:
+    return [card_index(card) for card in cards]
+
+
+def strength_from_tuple(strength: tuple) -> int:
+    score = strength[0]
+    for position in range(5):
+        score <<= 4
+        if position + 1 < len(strength):
+            score |= strength[position + 1]
+    return score
+
+
+def strength_category(score: int) -> int:
+    return score >> CATEGORY_SHIFT
+
+
+def _pack(category: int, ranks: Iterable[int]) -> int:
+    return strength_from_tuple((category, *ranks))
+
+
+def _build_straight_highs() -> tuple[int | None, ...]:
+    windows = [(((1 << 5) - 1) << (high - 4), high) for high in range(len(RANK_ORDER) - 1, 3, -1)]
+    wheel = (1 << RANK_TO_INDEX["A"]) | sum(1 << RANK_TO_INDEX[rank] for rank in "6789")
+    windows.append((wheel, RANK_TO_INDEX["9"]))
+
+    highs: list[int | None] = []
+    for mask in range(RANK_MASK + 1):
+        highs.append(next((high for needed, high in windows if mask & needed == needed), None))
+    return tuple(highs)
+
+
+STRAIGHT_HIGH = _build_straight_highs()
+
+
+def _score_rank_counts(counts: list[int]) -> int:
+    descending = [rank for rank in range(len(RANK_ORDER) - 1, -1, -1) if counts[rank]]
+    quads = [rank for rank in descending if counts[rank] == 4]
+    trips = [rank for rank in descending if counts[rank] == 3]
+    pairs = [rank for rank in descending if counts[rank] == 2]
+
+    if quads:
+        kicker = next(rank for rank in descending if rank != quads[0])
+        return _pack(7, (quads[0], kicker))
+
+    if trips and (len(trips) > 1 or pairs):
+        return _pack(5, (trips[0], max(trips[1:] + pairs)))
+
+    straight_high = STRAIGHT_HIGH[sum(1 << rank for rank in descending)]
+    if straight_high is not None:
+        return _pack(4, (straight_high,))
+
+    if trips:
+        kickers = [rank for rank in descending if rank != trips[0]][:2]
+        return _pack(3, (trips[0], *kickers))
+
+    if len(pairs) > 1:
+        kicker = next(rank for rank in descending if rank not in pairs[:2])
+        return _pack(2, (pairs[0], pairs[1], kicker))
+
+    if pairs:
+        kickers = [rank for rank in descending if rank != pairs[0]][:3]
+        return _pack(1, (pairs[0], *kickers))
+
+    return _pack(0, descending[:5])
+
+
+def _score_flush_mask(mask: int) -> int:
+    straight_high = STRAIGHT_HIGH[mask]
+    if straight_high is not None:
+        return _pack(8, (straight_high,))
+    ranks = [rank for rank in range(len(RANK_ORDER) - 1, -1, -1) if mask >> rank & 1]
+    return _pack(6, ranks[:5])
+
+
+def _rank_histograms(min_cards: int, max_cards: int) -> Iterable[list[int]]:
+    counts = [0] * len(RANK_ORDER)
+
+    def walk(rank: int, remaining: int):
+        if rank == len(RANK_ORDER):
+            if max_cards - remaining >= min_cards:
+                yield counts
+            return
+        for count in range(min(4, remaining) + 1):
+            counts[rank] = count
+            yield from walk(rank + 1, remaining - count)
+        counts[rank] = 0
+
+    yield from walk(0, max_cards)
+
+
+@lru_cache(maxsize=1)
+def lookup_tables() -> tuple[dict[int, int], tuple[int, ...]]:
+    """Return ``(rank_key -> score, flush_mask -> score)`` tables, built on first use."""
+    by_rank_key: dict[int, int] = {}
+    for counts in _rank_histograms(5, 7):
+        rank_key = sum(count * 5 ** rank for rank, count in enumerate(counts))
+        by_rank_key[rank_key] = _score_rank_counts(counts)
+
+    by_flush_mask = tuple(
+        _score_flush_mask(mask) if mask.bit_count() >= 5 else 0
+        for mask in range(RANK_MASK + 1)
+    )
+    return by_rank_key, by_flush_mask
+
+
+def score_state(rank_key: int, suit_bits: int) -> int:
+    """Score a hand from its accumulated rank key and suit bit mask."""
+    by_rank_key, by_flush_mask = lookup_tables()
+    score = by_rank_key[rank_key]
+    for shift in (0, 9, 18, 27):
+        flush_score = by_flush_mask[(suit_bits >> shift) & RANK_MASK]
+        if flush_score > score:
+            score = flush_score
+    return score
+
+
+def hand_state(indexes: Iterable[int]) -> tuple[int, int]:
+    rank_key = 0
+    suit_bits = 0
+    for index in indexes:
+        rank_key += CARD_RANK_KEY[index]
+        suit_bits |= CARD_SUIT_BIT[index]
+    return rank_key, suit_bits
+
+
+def evaluate(indexes: Iterable[int]) -> int:
+    return score_state(*hand_state(indexes))
+
+
+def evaluate_cards(cards: Iterable[str]) -> int:
+    return evaluate(card_index(card) for card in cards)
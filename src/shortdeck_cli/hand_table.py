@@ -0,0 +1,209 @@
+"""Exhaustive precomputed short-deck hand-rank table persisted to disk.
+
+Every 5, 6 and 7 card hand from the 36-card deck is ranked ahead of time and
+stored as a 16-bit strength ordinal at its combinatorial (colex) index:
+
+    index = C(c0, 1) + C(c1, 2) + ... + C(c[k-1], k)   for sorted c0 < c1 < ...
+
+The file is memory-mapped on first lookup, so importing the package or
+starting the CLI never pays for it. A rules digest in the header ties the
+table to the scoring rules in ``hand_evaluator``; stale tables are refused.
+
+Build it once with ``python -m shortdeck_cli.hand_table build``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from math import comb
+from pathlib import Path
+
+from shortdeck_cli.hand_evaluator import (
+    CARD_RANK_KEY,
+    CARD_SUIT_BIT,
+    CATEGORY_NAME,
+    DECK_SIZE,
+    RANK_MASK,
+    RANK_ORDER,
+    RULES_VERSION,
+    SUITS,
+    card_index,
+    lookup_tables,
+)
+
+TABLE_MAGIC = b"SDHR"
+TABLE_FORMAT_VERSION = 1
+HAND_SIZES = (5, 6, 7)
+DEFAULT_TABLE_PATH = Path(__file__).resolve().parent / "data" / "hand_ranks.bin"
+TABLE_PATH_ENV = "SHORTDECK_HAND_TABLE"
+
+# magic, format version, rules version, rules digest, class count, then the
+# number of entries stored for 5, 6 and 7 card hands (0 when not built).
+_HEADER = struct.Struct("<4sHH32sIIII")
+
+_COMB = tuple(tuple(comb(n, k) for k in range(8)) for n in range(DECK_SIZE + 1))
+
+
+def rules_digest() -> bytes:
+    payload = repr((RULES_VERSION, RANK_ORDER, SUITS, sorted(CATEGORY_NAME.items())))
+    return hashlib.sha256(payload.encode("utf-8")).digest()
+
+
+def colex_index(sorted_indexes: Sequence[int]) -> int:
+    return sum(_COMB[card][position + 1] for position, card in enumerate(sorted_indexes))
+
+
+def _strength_classes() -> list[int]:
+    by_rank_key, by_flush_mask = lookup_tables()
+    return sorted(set(by_rank_key.values()) | {score for score in by_flush_mask if score})
+
+
+def _colex_ordinals(hand_size: int, ordinal_of: dict[int, int]) -> array:
+    by_rank_key, by_flush_mask = lookup_tables()
+    ordinals = array("H")
+    append = ordinals.append
+
+    def emit(rank_key: int, suit_bits: int) -> None:
+        score = by_rank_key[rank_key]
+        for shift in (0, 9, 18, 27):
+            flush_score = by_flush_mask[(suit_bits >> shift) & RANK_MASK]
+            if flush_score > score:
+                score = flush_score
+        append(ordinal_of[score])
+
+    # Outer loops pick the highest card first, so hands come out in
+    # increasing colex order and the array position equals colex_index().
+    def walk(slots_left: int, upper: int, rank_key: int, suit_bits: int) -> None:
+        if slots_left == 1:
+            for card in range(upper):
+                emit(rank_key + CARD_RANK_KEY[card], suit_bits | CARD_SUIT_BIT[card])
+            return
+        for card in range(slots_left - 1, upper):
+            walk(slots_left - 1, card, rank_key + CARD_RANK_KEY[card], suit_bits | CARD_SUIT_BIT[card])
+
+    walk(hand_size, DECK_SIZE, 0, 0)
+    return ordinals
+
+
+def build_hand_table(path: str | Path = DEFAULT_TABLE_PATH, hand_sizes: Iterable[int] = HAND_SIZES) -> Path:
+    hand_sizes = set(hand_sizes)
+    unknown = hand_sizes.difference(HAND_SIZES)
+    if unknown:
+        raise ValueError(f"Hand sizes must be within {HAND_SIZES}, got: {sorted(unknown)}")
+
+    classes = _strength_classes()
+    ordinal_of = {score: ordinal for ordinal, score in enumerate(classes)}
+    sections = {size: _colex_ordinals(size, ordinal_of) if size in hand_sizes else array("H") for size in HAND_SIZES}
+
+    if sys.byteorder != "little":
+        for section in sections.values():
+            section.byteswap()
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    with temp_path.open("wb") as table_file:
+        table_file.write(
+            _HEADER.pack(
+                TABLE_MAGIC,
+                TABLE_FORMAT_VERSION,
+                RULES_VERSION,
+                rules_digest(),
+                len(classes),
+                *(len(sections[size]) for size in HAND_SIZES),
+            )
+        )
+        table_file.write(struct.pack(f"<{len(classes)}I", *classes))
+        for size in HAND_SIZES:
+            sections[size].tofile(table_file)
+    os.replace(temp_path, path)
+    return path
+
+
+class HandRankTable:
+    """Read-only, memory-mapped view over a built hand-rank table."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        with self.path.open("rb") as table_file:
+            self._mmap = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f"Hand table is truncated: {self.path}")
+        magic, format_version, rules_version, digest, class_count, *entry_counts = _HEADER.unpack_from(self._mmap, 0)
+        if magic != TABLE_MAGIC or format_version != TABLE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported hand table format: {self.path}")
+        if rules_version != RULES_VERSION or digest != rules_digest():
+            raise ValueError(f"Hand table was built for a different rule set; rebuild it: {self.path}")
+        if sys.byteorder != "little":
+            raise ValueError("Hand tables are stored little-endian and cannot be mapped on this host.")
+
+        offset = _HEADER.size
+        self._scores = struct.unpack_from(f"<{class_count}I", self._mmap, offset)
+        offset += 4 * class_count
+
+        view = memoryview(self._mmap)
+        self._sections: dict[int, memoryview] = {}
+        for size, count in zip(HAND_SIZES, entry_counts):
+            if count:
+                if count != comb(DECK_SIZE, size) or offset + 2 * count > len(self._mmap):
+                    raise ValueError(f"Hand table section for {size} cards is corrupt: {self.path}")
+                self._sections[size] = view[offset:offset + 2 * count].cast("H")
+            offset += 2 * count
+
+    def supports(self, hand_size: int) -> bool:
+        return hand_size in self._sections
+
+    def score_indexes(self, indexes: Iterable[int]) -> int:
+        ordered = sorted(indexes)
+        return self._scores[self._sections[len(ordered)][colex_index(ordered)]]
+
+
+@lru_cache(maxsize=1)
+def load_hand_table() -> HandRankTable | None:
+    """Map the hand table on first use; ``None`` when it is missing or stale."""
+    path = Path(os.environ.get(TABLE_PATH_ENV) or DEFAULT_TABLE_PATH)
+    if not path.exists():
+        return None
+    try:
+        return HandRankTable(path)
+    except (OSError, ValueError):
+        return None
+
+
+def table_strength(cards: Sequence[str]) -> int | None:
+    table = load_hand_table()
+    if table is None or not table.supports(len(cards)):
+        return None
+    return table.score_indexes(card_index(card) for card in cards)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Short-deck hand-rank table tools")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    build = subcommands.add_parser("build", help="Enumerate every hand and write the rank table")
+    build.add_argument("--output", default=None, help=f"Output path (default: ${TABLE_PATH_ENV} or {DEFAULT_TABLE_PATH})")
+    build.add_argument(
+        "--hand-sizes",
+        type=int,
+        nargs="+",
+        default=list(HAND_SIZES),
+        help="Hand sizes to precompute (default: 5 6 7)",
+    )
+    args = parser.parse_args(argv)
+
+    output = Path(args.output or os.environ.get(TABLE_PATH_ENV) or DEFAULT_TABLE_PATH)
+    path = build_hand_table(output, hand_sizes=args.hand_sizes)
+    print(f"Wrote hand-rank table: {path} ({path.stat().st_size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""asyncio engine that follows many observation sources at once.
+
+Every source gets a producer task and a consumer task joined by a bounded
+queue. Producers call the (blocking) ``next_observation``/``wait`` methods
+on a thread pool with one worker per source, so a slow OCR capture only
+stalls its own table. When a table's consumer falls behind, its full queue
+makes the producer stop reading that source until there is room again.
+A source that raises (an OCR window closed, an unreadable file) is reported
+and retried with a growing delay while the other tables keep running.
+``run`` only returns after every source call has finished, so sources can be
+closed right after it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+from shortdeck_cli.auto_ingest import DEFAULT_QUEUE_SIZE, Observation, ObservationSource
+
+# Longest delay between retries of a source that keeps failing.
+MAX_RETRY_SECONDS = 30.0
+
+
+def _report_source_error(source_id: str, error: Exception, retry_seconds: float) -> None:
+    print(f"[{source_id}] Source error: {error} (retrying in {retry_seconds:g}s)", file=sys.stderr)
+
+
+class MultiSourceEngine:
+    """Feed observations from named sources to ``handle(source_id, observation)``.
+
+    ``handle`` runs on the event loop and returns ``True`` when it processed
+    the observation; ``run`` returns once ``max_handled`` observations were
+    processed (or never, when it is ``None``). ``on_error(source_id, error,
+    retry_seconds)`` is told about every failed source call.
+    """
+
+    def __init__(
+        self,
+        sources: Mapping[str, ObservationSource],
+        handle: Callable[[str, Observation], bool],
+        poll_seconds: float = 1.0,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        max_handled: int | None = None,
+        on_error: Callable[[str, Exception, float], None] = _report_source_error,
+    ):
+        if not sources:
+            raise ValueError("At least one observation source is required.")
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1.")
+        self.sources = dict(sources)
+        self.handle = handle
+        self.poll_seconds = poll_seconds
+        self.queue_size = queue_size
+        self.max_handled = max_handled
+        self.on_error = on_error
+        self.handled = 0
+
+    async def run(self) -> int:
+        done = asyncio.Event()
+        executor = ThreadPoolExecutor(max_workers=len(self.sources), thread_name_prefix="observation-source")
+        tasks: list[asyncio.Task] = []
+        for source_id, source in self.sources.items():
+            queue: asyncio.Queue[Observation] = asyncio.Queue(maxsize=self.queue_size)
+            tasks.append(asyncio.create_task(self._produce(source_id, source, queue, executor)))
+            tasks.append(asyncio.create_task(self._consume(source_id, queue, done)))
+
+        finished = asyncio.create_task(done.wait())
+        try:
+            await asyncio.wait([finished, *tasks], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (finished, *tasks):
+                task.cancel()
+            await asyncio.gather(finished, *tasks, return_exceptions=True)
+            # A call may still be running inside a source (a capture, or a
+            # ``wait`` bounded by ``poll_seconds``); let it return so the
+            # caller can close the sources once ``run`` is done.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        for task in tasks:
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+        return self.handled
+
+    async def _produce(
+        self,
+        source_id: str,
+        source: ObservationSource,
+        queue: asyncio.Queue,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        wait = getattr(source, "wait", None)
+        retry_seconds = 0.0
+        while True:
+            try:
+                observation = await loop.run_in_executor(executor, source.next_observation)
+                if observation is None:
+                    if wait is not None:
+                        await loop.run_in_executor(executor, wait, self.poll_seconds)
+                    else:
+                        await asyncio.sleep(self.poll_seconds)
+            except Exception as error:
+                retry_seconds = min(MAX_RETRY_SECONDS, max(self.poll_seconds, retry_seconds * 2, 0.1))
+                self.on_error(source_id, error, retry_seconds)
+                await asyncio.sleep(retry_seconds)
+                continue
+            retry_seconds = 0.0
+            if observation is not None:
+                await queue.put(observation)
+
+    async def _consume(self, source_id: str, queue: asyncio.Queue, done: asyncio.Event) -> None:
+        while True:
+            observation = await queue.get()
+            if not self.handle(source_id, observation):
+                continue
+            self.handled += 1
+            if self.max_handled is not None and self.handled >= self.max_handled:
+                done.set()
+                return
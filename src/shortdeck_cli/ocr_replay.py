@@ -0,0 +1,393 @@
+"""Replay frames saved by ``--auto-debug-dir`` through the OCR path offline.
+
+A debug directory holds ``{frame}.png`` with the ``{frame}.hand.txt`` and
+``{frame}.action.txt`` OCR text captured live. Replays either reuse that
+recorded text (to check the parsing stage alone) or OCR the saved images
+again through ``FrameOcr`` (crop, change gate, OCR), so OCR settings can be
+compared on Linux before they reach a table.
+
+The benchmark reports frames/sec, per-stage latency and, with a labels file,
+extraction accuracy. Labels are JSONL, one object per labeled frame::
+
+    {"frame": "000012", "hero_hand": "AsAd", "villain_position": "UTG", "villain_action": "limp"}
+
+Only the fields present are compared; ``"hero_hand": null`` marks a frame
+where no observation should be extracted.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+from shortdeck_cli.action_log import ActionLogTracker
+from shortdeck_cli.auto_ingest import Observation, ObservationSource
+from shortdeck_cli.card_templates import (
+    DEFAULT_CARD_LAYOUT,
+    DEFAULT_MIN_SCORE,
+    CardTemplates,
+    calibrate_card_templates,
+    load_card_templates,
+    parse_card_layout,
+)
+from shortdeck_cli.frame_diff import FrameDiffGate
+from shortdeck_cli.hand_evaluator import SUITS
+from shortdeck_cli.pokerstars_capture import (
+    FrameOcr,
+    FramePrefetcher,
+    crop_region,
+    extract_observation_from_ocr_parts,
+    load_roi_config,
+)
+from shortdeck_cli.rules import RANKS
+
+REPLAY_SOURCE_NAME = "pokerstars-replay"
+LABEL_FIELDS = ("hero_hand", "villain_position", "villain_action")
+STAGES = ("load", "crop", "diff", "ocr", "parse")
+
+
+@dataclass(frozen=True)
+class DebugFrame:
+    frame_id: str
+    image_path: Path
+
+    @property
+    def hand_text_path(self) -> Path:
+        return self.image_path.with_name(f"{self.frame_id}.hand.txt")
+
+    @property
+    def action_text_path(self) -> Path:
+        return self.image_path.with_name(f"{self.frame_id}.action.txt")
+
+    def recorded_text(self) -> tuple[str, str]:
+        try:
+            hand_text = self.hand_text_path.read_text(encoding="utf-8")
+            action_text = self.action_text_path.read_text(encoding="utf-8")
+        except OSError as error:
+            raise ValueError(f"Frame {self.frame_id} has no recorded OCR text.") from error
+        return hand_text, action_text
+
+
+def load_debug_frames(directory: str | Path) -> list[DebugFrame]:
+    directory = Path(directory)
+    if not directory.is_dir():
+        raise ValueError(f"Debug frame directory not found: {directory}")
+    # Frames always have OCR text; PNGs exist only for sampled frames.
+    frame_ids = {path.stem for path in directory.glob("*.png")}
+    frame_ids.update(path.name[: -len(".hand.txt")] for path in directory.glob("*.hand.txt"))
+    if not frame_ids:
+        raise ValueError(f"No saved frames (*.png or *.hand.txt) in {directory}")
+    return [DebugFrame(frame_id=frame_id, image_path=directory / f"{frame_id}.png") for frame_id in sorted(frame_ids)]
+
+
+def frames_with_images(frames: list[DebugFrame]) -> list[DebugFrame]:
+    with_images = [frame for frame in frames if frame.image_path.is_file()]
+    if not with_images:
+        raise ValueError("No saved frame images; capture with --auto-debug-sample to save PNGs.")
+    return with_images
+
+
+def load_frame_image(path: Path):
+    try:
+        from PIL import Image  # type: ignore
+    except ImportError as error:
+        raise RuntimeError("Pillow is required to OCR saved frames") from error
+
+    image = Image.open(path)
+    image.load()
+    return image
+
+
+def load_labels(file_path: str | Path) -> dict[str, dict]:
+    labels: dict[str, dict] = {}
+    with Path(file_path).open("r", encoding="utf-8") as labels_file:
+        for line_number, line in enumerate(labels_file, start=1):
+            if not line.strip():
+                continue
+            try:
+                payload = json.loads(line)
+            except ValueError as error:
+                raise ValueError(f"Invalid JSON on labels line {line_number}.") from error
+            if not isinstance(payload, dict) or not isinstance(payload.get("frame"), str):
+                raise ValueError(f"Labels line {line_number} needs a string 'frame' id.")
+            labels[payload["frame"]] = {name: payload[name] for name in LABEL_FIELDS if name in payload}
+    return labels
+
+
+class DebugFrameReplaySource(ObservationSource):
+    """Observation source over saved frames; without ``frame_ocr`` the recorded OCR text is parsed."""
+
+    def __init__(self, directory: str | Path, hero_position: str, frame_ocr: FrameOcr | None = None):
+        frames = load_debug_frames(directory)
+        self.frames = frames if frame_ocr is None else frames_with_images(frames)
+        self.hero_position = hero_position
+        self.frame_ocr = frame_ocr
+        self.action_log = ActionLogTracker()
+        self._position = 0
+
+    def next_observation(self) -> Observation | None:
+        while self._position < len(self.frames):
+            frame = self.frames[self._position]
+            self._position += 1
+            if self.frame_ocr is None:
+                hand_text, action_text = frame.recorded_text()
+            else:
+                text = self.frame_ocr.read(load_frame_image(frame.image_path))
+                if not text.changed:
+                    continue
+                hand_text, action_text = text.hand_text, text.action_text
+            observation = extract_observation_from_ocr_parts(
+                hand_text=hand_text,
+                action_text=action_text,
+                hero_position=self.hero_position,
+                source_name=REPLAY_SOURCE_NAME,
+                tracker=self.action_log,
+            )
+            if observation is not None:
+                return replace(observation, observed_at=time.time())
+        return None
+
+
+@dataclass
+class BenchmarkReport:
+    frames: int = 0
+    seconds: float = 0.0
+    stage_seconds: dict[str, list[float]] = field(default_factory=lambda: {stage: [] for stage in STAGES})
+    labeled: int = 0
+    correct: int = 0
+    field_labeled: dict[str, int] = field(default_factory=lambda: dict.fromkeys(LABEL_FIELDS, 0))
+    field_correct: dict[str, int] = field(default_factory=lambda: dict.fromkeys(LABEL_FIELDS, 0))
+    mismatches: list[str] = field(default_factory=list)
+
+    @property
+    def frames_per_second(self) -> float:
+        return self.frames / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def accuracy(self) -> float | None:
+        return self.correct / self.labeled if self.labeled else None
+
+    def record_label(self, frame_id: str, label: dict, observation: Observation | None) -> None:
+        self.labeled += 1
+        matched = True
+        for name, expected in label.items():
+            if name == "hero_hand" and expected is None:
+                ok = observation is None
+            else:
+                ok = observation is not None and getattr(observation, name) == expected
+            self.field_labeled[name] += 1
+            self.field_correct[name] += ok
+            matched = matched and ok
+        if matched:
+            self.correct += 1
+        else:
+            self.mismatches.append(frame_id)
+
+
+def _percentile_ms(ordered: list[float], percent: float) -> float:
+    return ordered[min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))] * 1000
+
+
+def format_benchmark_report(report: BenchmarkReport) -> str:
+    lines = [f"Frames: {report.frames} in {report.seconds:.3f} s ({report.frames_per_second:.1f} frames/sec)"]
+    for stage in STAGES:
+        samples = sorted(report.stage_seconds[stage])
+        if not samples:
+            continue
+        mean_ms = sum(samples) / len(samples) * 1000
+        lines.append(
+            f"  {stage:<5} mean {mean_ms:.2f} ms, p50 {_percentile_ms(samples, 50):.2f} ms, "
+            f"p95 {_percentile_ms(samples, 95):.2f} ms"
+        )
+    if report.accuracy is not None:
+        lines.append(f"Accuracy: {report.correct}/{report.labeled} frames ({report.accuracy * 100:.1f}%)")
+        for name in LABEL_FIELDS:
+            if report.field_labeled[name]:
+                lines.append(f"  {name}: {report.field_correct[name]}/{report.field_labeled[name]}")
+        if report.mismatches:
+            lines.append(f"Mismatched frames: {', '.join(report.mismatches)}")
+    return "\n".join(lines)
+
+
+def run_ocr_benchmark(
+    frames: list[DebugFrame],
+    hero_position: str,
+    frame_ocr: FrameOcr | None = None,
+    labels: dict[str, dict] | None = None,
+) -> BenchmarkReport:
+    """Run every frame through load, crop/OCR (or recorded text) and parsing, timing each stage.
+
+    With ``frame_ocr`` the next image is decoded on a background thread while
+    the current one is recognized, like live capture.
+    """
+    report = BenchmarkReport()
+    labels = labels or {}
+    action_log = ActionLogTracker()
+    remaining = iter(frames if frame_ocr is None else frames_with_images(frames))
+
+    def load_next():
+        frame = next(remaining, None)
+        if frame is None:
+            return None
+        started = time.perf_counter()
+        payload = frame.recorded_text() if frame_ocr is None else load_frame_image(frame.image_path)
+        report.stage_seconds["load"].append(time.perf_counter() - started)
+        return frame, payload
+
+    # Recorded text is read inline: there is no OCR stage to overlap with.
+    prefetcher = FramePrefetcher(load_next, max_age=None) if frame_ocr is not None else None
+    started = time.perf_counter()
+    try:
+        while True:
+            if prefetcher is not None:
+                loaded = prefetcher.next()[1]
+                prefetcher.prefetch()
+            else:
+                loaded = load_next()
+            if loaded is None:
+                break
+            frame, payload = loaded
+            if frame_ocr is None:
+                hand_text, action_text = payload
+            else:
+                text = frame_ocr.read(payload)
+                report.stage_seconds["crop"].append(text.crop_seconds)
+                if frame_ocr.gate is not None:
+                    report.stage_seconds["diff"].append(text.diff_seconds)
+                report.stage_seconds["ocr"].append(text.ocr_seconds)
+                hand_text, action_text = text.hand_text, text.action_text
+
+            parse_started = time.perf_counter()
+            observation = extract_observation_from_ocr_parts(
+                hand_text=hand_text,
+                action_text=action_text,
+                hero_position=hero_position,
+                source_name=REPLAY_SOURCE_NAME,
+                tracker=action_log,
+            )
+            report.stage_seconds["parse"].append(time.perf_counter() - parse_started)
+            report.frames += 1
+            if frame.frame_id in labels:
+                report.record_label(frame.frame_id, labels[frame.frame_id], observation)
+    finally:
+        if prefetcher is not None:
+            prefetcher.close()
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def calibrate_from_frames(
+    frames: list[DebugFrame],
+    labels: dict[str, dict],
+    roi_config_path: str | Path,
+    layout=DEFAULT_CARD_LAYOUT,
+    min_score: float = DEFAULT_MIN_SCORE,
+) -> tuple[CardTemplates, int]:
+    """Calibrate card templates from the hero_hand crops of labeled frames; returns the templates and frames used."""
+    hand_roi = load_roi_config(roi_config_path).get("hero_hand")
+    if hand_roi is None:
+        raise ValueError("Card calibration needs a hero_hand ROI.")
+    samples = [
+        (crop_region(load_frame_image(frame.image_path), hand_roi), labels[frame.frame_id]["hero_hand"])
+        for frame in frames_with_images(frames)
+        if labels.get(frame.frame_id, {}).get("hero_hand")
+    ]
+    return calibrate_card_templates(samples, layout=layout, min_score=min_score), len(samples)
+
+
+def _tesseract_image_to_string(tesseract_cmd: str | None):
+    try:
+        import pytesseract  # type: ignore
+    except ImportError as error:
+        raise RuntimeError("pytesseract is required for --ocr tesseract") from error
+    if tesseract_cmd:
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+    return pytesseract.image_to_string
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Replay saved PokerStars debug frames")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    bench = subcommands.add_parser("bench", help="Time the OCR path over saved frames and score it against labels")
+    bench.add_argument("--frames", required=True, help="Directory written by --auto-debug-dir")
+    bench.add_argument("--hero-position", required=True, help="Hero position the frames were captured at")
+    bench.add_argument("--labels", default=None, help="Ground-truth JSONL (frame, hero_hand, villain_position, villain_action)")
+    bench.add_argument(
+        "--ocr",
+        choices=("recorded", "tesseract"),
+        default="recorded",
+        help="Parse the recorded OCR text, or OCR the saved images again (default: recorded)",
+    )
+    bench.add_argument("--roi-config", default=None, help="ROI config used to crop the frames (--ocr tesseract)")
+    bench.add_argument("--tesseract-cmd", default=None, help="Optional path to the tesseract executable")
+    bench.add_argument("--workers", type=int, default=2, help="Concurrent OCR calls per frame (default: 2)")
+    bench.add_argument(
+        "--ocr-diff-threshold",
+        type=int,
+        default=None,
+        help="Enable the frame-diff gate with this pixel threshold (default: OCR every frame)",
+    )
+    bench.add_argument("--card-templates", default=None, help="Read hero cards with these templates instead of Tesseract")
+
+    calibrate = subcommands.add_parser("calibrate-cards", help="Build card templates from labeled frames")
+    calibrate.add_argument("--frames", required=True, help="Directory written by --auto-debug-dir")
+    calibrate.add_argument("--labels", required=True, help="Ground-truth JSONL with explicit hero_hand cards (e.g. AsKd)")
+    calibrate.add_argument("--roi-config", required=True, help="ROI config with the hero_hand region")
+    calibrate.add_argument("--layout", default=None, help="JSON list of {rank, suit} boxes per card within the hero_hand ROI")
+    calibrate.add_argument(
+        "--min-score",
+        type=float,
+        default=DEFAULT_MIN_SCORE,
+        help=f"Lowest match score accepted when recognizing (default: {DEFAULT_MIN_SCORE})",
+    )
+    calibrate.add_argument("--output", required=True, help="Where to write the card templates JSON")
+    args = parser.parse_args(argv)
+
+    if args.command == "calibrate-cards":
+        try:
+            layout = DEFAULT_CARD_LAYOUT
+            if args.layout:
+                layout = parse_card_layout(json.loads(Path(args.layout).read_text(encoding="utf-8")))
+            templates, used = calibrate_from_frames(
+                load_debug_frames(args.frames),
+                load_labels(args.labels),
+                args.roi_config,
+                layout=layout,
+                min_score=args.min_score,
+            )
+            path = templates.save(args.output)
+        except (OSError, RuntimeError, ValueError) as error:
+            parser.error(str(error))
+        missing = [rank for rank in RANKS if rank not in templates.ranks] + [suit for suit in SUITS if suit not in templates.suits]
+        print(f"Wrote card templates: {path} ({used} frames)")
+        if missing:
+            print(f"Warning: no samples for {', '.join(missing)}; label more frames to recognize them.")
+        return
+
+    try:
+        frames = load_debug_frames(args.frames)
+        labels = load_labels(args.labels) if args.labels else None
+        frame_ocr = None
+        if args.ocr == "tesseract":
+            frame_ocr = FrameOcr(
+                _tesseract_image_to_string(args.tesseract_cmd),
+                load_roi_config(args.roi_config) if args.roi_config else {},
+                gate=FrameDiffGate(pixel_threshold=args.ocr_diff_threshold) if args.ocr_diff_threshold is not None else None,
+                workers=args.workers,
+                hand_reader=load_card_templates(args.card_templates) if args.card_templates else None,
+            )
+        try:
+            report = run_ocr_benchmark(frames, args.hero_position, frame_ocr=frame_ocr, labels=labels)
+        finally:
+            if frame_ocr is not None:
+                frame_ocr.close()
+    except (OSError, RuntimeError, ValueError) as error:
+        parser.error(str(error))
+    print(format_benchmark_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 """Parsing and validation helpers for CLI input."""
 
-from shortdeck_cli.rules import ACTIONS, POSITIONS, RANKS
+from dataclasses import dataclass
+
+from shortdeck_cli.auto_ingest import Observation
+from shortdeck_cli.preflop_tree import TREE_ACTIONS
+from shortdeck_cli.rules import ACTIONS, POSITIONS, RANKS, previous_positions
 
 
 def _extract_cards(raw_value: str) -> list[str]:
@@ -86,6 +90,23 @@ def parse_action(raw_value: str) -> str:
     return value
 
 
+def parse_action_line(raw_value: str) -> list[tuple[str, str]]:
+    """Parse a preflop line such as ``UTG limp, MP1 raise, UTG all-in`` into ``(position, action)`` pairs."""
+    line: list[tuple[str, str]] = []
+    for raw_entry in raw_value.replace(";", ",").split(","):
+        entry = raw_entry.strip().lower().replace("all in", "all-in").replace(":", " ")
+        if not entry:
+            continue
+        parts = entry.split()
+        if len(parts) != 2:
+            raise ValueError(f"Line entries must look like 'UTG limp', got {raw_entry.strip()!r}")
+        position = parse_position(parts[0])
+        if parts[1] not in TREE_ACTIONS:
+            raise ValueError(f"Line actions must be one of: {', '.join(TREE_ACTIONS)}")
+        line.append((position, parts[1]))
+    return line
+
+
 def parse_flop_cards(raw_value: str, blocked_cards: list[str]) -> list[str]:
     cards = _extract_cards(raw_value)
     if len(cards) != 3:
@@ -105,3 +126,63 @@ def parse_turn_card(raw_value: str, blocked_cards: list[str]) -> str:
     if card in set(blocked_cards):
         raise ValueError(f"Turn card overlaps with known cards: {card}")
     return card
+
+
+def parse_board_cards(raw_value: str, blocked_cards: list[str]) -> list[str]:
+    if raw_value.strip() == "":
+        return []
+    cards = _extract_cards(raw_value)
+    if len(cards) not in (3, 4, 5):
+        raise ValueError("Board must contain 3, 4 or 5 cards (example: KsQhTd9c).")
+    overlap = set(blocked_cards).intersection(cards)
+    if overlap:
+        raise ValueError(f"Board cards overlap with known cards: {', '.join(sorted(overlap))}")
+    return cards
+
+
+def strategy_hand(hero_hand: str) -> str:
+    """Hand class used for strategy lookups: explicit hole cards (AsKd) become AKo."""
+    explicit_hole = len(hero_hand) == 4 and hero_hand[1].islower() and hero_hand[3].islower()
+    if not explicit_hole:
+        return hero_hand
+
+    rank_one, suit_one = hero_hand[0], hero_hand[1]
+    rank_two, suit_two = hero_hand[2], hero_hand[3]
+    if rank_one == rank_two:
+        return f"{rank_one}{rank_two}"
+
+    ordered = sorted([rank_one, rank_two], key=RANKS.index)
+    suitedness = "s" if suit_one == suit_two else "o"
+    return f"{ordered[0]}{ordered[1]}{suitedness}"
+
+
+@dataclass(frozen=True)
+class NormalizedObservation:
+    strategy_hand: str
+    hero_hand: str
+    hero_position: str
+    villain_position: str
+    villain_action: str
+
+
+def normalize_observation(observation: Observation) -> NormalizedObservation:
+    """Validate an observation into a strategy spot; raises ValueError when it is unusable."""
+    hero_hand = parse_hand(observation.hero_hand)
+    hero_position = parse_position(observation.hero_position)
+
+    if hero_position == "UTG":
+        villain_position = "UTG"
+        villain_action = "fold"
+    else:
+        if observation.villain_position is None or observation.villain_action is None:
+            raise ValueError("villain_position and villain_action are required when hero is not UTG.")
+        villain_position = parse_position(observation.villain_position, allowed_positions=previous_positions(hero_position))
+        villain_action = parse_action(observation.villain_action)
+
+    return NormalizedObservation(
+        strategy_hand=strategy_hand(hero_hand),
+        hero_hand=hero_hand,
+        hero_position=hero_position,
+        villain_position=villain_position,
+        villain_action=villain_action,
+    )
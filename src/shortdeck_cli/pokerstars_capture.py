@@ -2,28 +2,25 @@
 
 from __future__ import annotations
 
-import ctypes
 import json
-import platform
 import re
-from ctypes import wintypes
-from dataclasses import dataclass
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from pathlib import Path
 
+from shortdeck_cli.action_log import ActionLogTracker
 from shortdeck_cli.auto_ingest import Observation, ObservationSource
+from shortdeck_cli.capture import CaptureBackend, RoiRect, default_capture_backend, roi_box, roi_union
+from shortdeck_cli.frame_diff import DEFAULT_PIXEL_THRESHOLD, FrameDiffGate
 
 
 VALID_POSITIONS = ("UTG", "MP1", "MP2", "HJ", "CO", "BTN")
 VALID_ACTIONS = ("fold", "limp", "all-in")
-
-
-@dataclass(frozen=True)
-class RoiRect:
-    left: float
-    top: float
-    right: float
-    bottom: float
-    normalized: bool
+# ROI name and Tesseract page segmentation mode (single line / text block).
+OCR_REGIONS = (("hero_hand", "--psm 7"), ("action_log", "--psm 6"))
+DEFAULT_MAX_FRAME_AGE = 0.25
 
 
 def _normalize_ocr_text(text: str) -> str:
@@ -69,12 +66,21 @@ def extract_observation_from_ocr_parts(
     action_text: str,
     hero_position: str,
     source_name: str = "pokerstars-ocr",
+    tracker: ActionLogTracker | None = None,
 ) -> Observation | None:
+    """Build an observation from one frame's OCR text.
+
+    With a ``tracker`` the action log is read incrementally across frames
+    (only lines not seen before are parsed) and the villain comes from the
+    current hand's timeline; without one the whole text is searched.
+    """
     hero_position = hero_position.upper().strip()
     if hero_position not in VALID_POSITIONS:
         raise ValueError("hero_position must be one of: UTG, MP1, MP2, HJ, CO, BTN")
 
     hero_hand = _extract_hero_hand(_normalize_ocr_text(hand_text))
+    if tracker is not None:
+        tracker.update(hero_hand, action_text)
     if hero_hand is None:
         return None
 
@@ -88,7 +94,10 @@ def extract_observation_from_ocr_parts(
             source=source_name,
         )
 
-    villain = _extract_villain_action(_normalize_ocr_text(action_text), hero_position)
+    if tracker is not None:
+        villain = tracker.villain_action(hero_position)
+    else:
+        villain = _extract_villain_action(_normalize_ocr_text(action_text), hero_position)
     if villain is None:
         return Observation(
             hero_hand=hero_hand,
@@ -154,60 +163,167 @@ def load_roi_config(file_path: str | Path) -> dict[str, RoiRect]:
     return regions
 
 
+def crop_region(image, roi: RoiRect):
+    return image.crop(roi_box(roi, *image.size))
+
+
 @dataclass(frozen=True)
-class _WindowRect:
-    left: int
-    top: int
-    right: int
-    bottom: int
+class FrameText:
+    hand_text: str
+    action_text: str
+    # False when every region reused its cached text.
+    changed: bool
+    crop_seconds: float = 0.0
+    diff_seconds: float = 0.0
+    ocr_seconds: float = 0.0
+
+
+class FrameOcr:
+    """OCR the hand and action-log regions of captured frames.
+
+    With a ``gate``, regions whose crop did not change since their last OCR
+    reuse the cached text (see ``frame_diff``). A ``hand_reader`` (such as
+    ``card_templates.CardTemplates``) replaces Tesseract for the hero_hand
+    region. With ``workers > 1`` the regions that need OCR are recognized
+    concurrently on a persistent thread pool; pytesseract runs one tesseract
+    process per call, so the calls of a frame overlap instead of queueing.
+    Without ROIs the whole frame is OCRed once and used for both regions.
+    """
 
+    def __init__(
+        self,
+        image_to_string: Callable[..., str],
+        roi_regions: dict[str, RoiRect] | None = None,
+        gate: FrameDiffGate | None = None,
+        workers: int = 1,
+        hand_reader: Callable[[object], str] | None = None,
+    ):
+        if workers < 1:
+            raise ValueError("OCR workers must be at least 1.")
+        self.image_to_string = image_to_string
+        self.roi_regions = roi_regions or {}
+        if hand_reader is not None and "hero_hand" not in self.roi_regions:
+            raise ValueError("A hero-hand reader needs a hero_hand ROI.")
+        self.hand_reader = hand_reader
+        self.gate = gate
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr") if workers > 1 else None
+
+    def _reader(self, name: str, config: str) -> Callable[[object], str]:
+        if name == "hero_hand" and self.hand_reader is not None:
+            return self.hand_reader
+        return lambda crop: self.image_to_string(crop, config=config)
+
+    def read(self, image, roi_regions: dict[str, RoiRect] | None = None) -> FrameText:
+        """Recognize ``image``; ``roi_regions`` overrides the configured ROIs (e.g. for a region-only grab)."""
+        started = time.perf_counter()
+        regions = self.roi_regions if roi_regions is None else roi_regions
+        # OCR key -> (crop, reader); both regions share "window" without ROIs.
+        jobs: dict[str, tuple[object, Callable[[object], str]]] = {}
+        region_keys: dict[str, str] = {}
+        for name, config in OCR_REGIONS:
+            roi = regions.get(name)
+            key = name if roi is not None else "window"
+            region_keys[name] = key
+            if key not in jobs:
+                if roi is not None:
+                    jobs[key] = (crop_region(image, roi), self._reader(name, config))
+                else:
+                    jobs[key] = (image, self.image_to_string)
+        cropped = time.perf_counter()
+
+        texts: dict[str, str] = {}
+        thumbnails: dict[str, bytes] = {}
+        if self.gate is not None:
+            for key, (crop, _) in jobs.items():
+                thumbnails[key], cached = self.gate.lookup(key, crop)
+                if cached is not None:
+                    texts[key] = cached
+        pending = {key: job for key, job in jobs.items() if key not in texts}
+        diffed = time.perf_counter()
+
+        if self._executor is not None and len(pending) > 1:
+            futures = {self._executor.submit(reader, crop): key for key, (crop, reader) in pending.items()}
+            for future in as_completed(futures):
+                texts[futures[future]] = future.result()
+        else:
+            for key, (crop, reader) in pending.items():
+                texts[key] = reader(crop)
+        if self.gate is not None:
+            for key in pending:
+                self.gate.store(key, thumbnails[key], texts[key])
+        finished = time.perf_counter()
+
+        return FrameText(
+            hand_text=texts[region_keys["hero_hand"]],
+            action_text=texts[region_keys["action_log"]],
+            changed=bool(pending),
+            crop_seconds=cropped - started,
+            diff_seconds=diffed - cropped,
+            ocr_seconds=finished - diffed,
+        )
 
-def _find_window_rect(title_contains: str) -> _WindowRect | None:
-    if platform.system() != "Windows":
-        return None
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
 
-    user32 = ctypes.windll.user32
-    wnd_enum_proc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
-    enum_windows = user32.EnumWindows
-    enum_windows.argtypes = [wnd_enum_proc, wintypes.LPARAM]
-    enum_windows.restype = wintypes.BOOL
-
-    get_window_text_length = user32.GetWindowTextLengthW
-    get_window_text = user32.GetWindowTextW
-    is_window_visible = user32.IsWindowVisible
-    get_window_rect = user32.GetWindowRect
-
-    wanted = title_contains.lower().strip()
-    found: list[_WindowRect] = []
-
-    @wnd_enum_proc
-    def _callback(hwnd, _lparam):
-        if not is_window_visible(hwnd):
-            return True
-        length = get_window_text_length(hwnd)
-        if length <= 0:
-            return True
-        buffer = ctypes.create_unicode_buffer(length + 1)
-        get_window_text(hwnd, buffer, length + 1)
-        title = buffer.value.strip()
-        if not title:
-            return True
-        if wanted not in title.lower():
-            return True
-
-        rect = wintypes.RECT()
-        if not get_window_rect(hwnd, ctypes.byref(rect)):
-            return True
-        found.append(_WindowRect(rect.left, rect.top, rect.right, rect.bottom))
-        return False
-
-    enum_windows(_callback, 0)
-    if not found:
-        return None
-    return found[0]
+
+class FramePrefetcher:
+    """Grab the next frame on a background thread while the current one is recognized.
+
+    ``next()`` returns ``(captured_at, frame)``. ``prefetch()`` starts grabbing
+    the following frame; callers use it only when they will ask for that frame
+    right away (the table is busy), so idle polls grab once per poll instead
+    of discarding a frame that went stale during the poll sleep. A prefetched
+    frame older than ``max_age`` seconds is still dropped and grabbed again,
+    so pipelining never hands out a stale table state.
+    """
+
+    def __init__(self, grab: Callable[[], object], max_age: float | None = DEFAULT_MAX_FRAME_AGE):
+        self.grab = grab
+        self.max_age = max_age
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="frame-capture")
+        self._pending: Future | None = None
+
+    def _grab(self) -> tuple[float, object]:
+        captured_at = time.time()
+        return captured_at, self.grab()
+
+    def next(self) -> tuple[float, object]:
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            captured_at, frame = pending.result()
+            if self.max_age is None or time.time() - captured_at <= self.max_age:
+                return captured_at, frame
+        return self._grab()
+
+    def prefetch(self) -> None:
+        if self._pending is None:
+            self._pending = self._executor.submit(self._grab)
+
+    def close(self) -> None:
+        # Let a grab in progress finish so the capture backend can be closed after this.
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass(frozen=True)
+class CapturedFrame:
+    image: object
+    # ROIs relative to ``image``.
+    regions: dict[str, RoiRect]
+    # Whole window (sampled for the debug directory) rather than the ROI union.
+    full_window: bool
 
 
 class PokerStarsWindowOcrSource(ObservationSource):
+    """Captures the table window and OCRs its hand and action-log regions.
+
+    Only the union of the configured ROIs is grabbed. With a debug directory,
+    OCR text is written for every frame that changed, and every
+    ``debug_sample_every``-th saved frame is also saved as a PNG of the whole
+    window (0 saves no images): once such a frame is due, captures grab the
+    whole window until the table changes.
+    """
+
     def __init__(
         self,
         hero_position: str,
@@ -215,82 +331,103 @@ class PokerStarsWindowOcrSource(ObservationSource):
         tesseract_cmd: str | None = None,
         debug_dir: str | None = None,
         roi_config_path: str | None = None,
+        ocr_diff_threshold: int = DEFAULT_PIXEL_THRESHOLD,
+        ocr_workers: int = 2,
+        hand_reader: Callable[[object], str] | None = None,
+        capture_backend: CaptureBackend | None = None,
+        debug_sample_every: int = 0,
+        image_to_string: Callable[..., str] | None = None,
     ):
         self.hero_position = hero_position.upper().strip()
         self.window_title_contains = window_title_contains
         self.debug_dir = Path(debug_dir) if debug_dir else None
         self._frame_index = 0
         self._roi_regions = load_roi_config(roi_config_path) if roi_config_path else {}
+        self._union_cache: tuple[tuple[int, int], tuple[tuple[int, int, int, int], dict[str, RoiRect]]] | None = None
 
         if self.hero_position not in VALID_POSITIONS:
             raise ValueError("hero_position must be one of: UTG, MP1, MP2, HJ, CO, BTN")
+        if debug_sample_every < 0:
+            raise ValueError("debug_sample_every must be non-negative.")
+        self.debug_sample_every = debug_sample_every
+
+        if image_to_string is None:
+            try:
+                import pytesseract  # type: ignore
+            except ImportError as error:
+                raise RuntimeError("pytesseract is required for --auto-source pokerstars") from error
+
+            if tesseract_cmd:
+                pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+            image_to_string = pytesseract.image_to_string
+
+        self._capture = capture_backend or default_capture_backend(window_title_contains)
+        self._frame_ocr = FrameOcr(
+            image_to_string,
+            self._roi_regions,
+            gate=FrameDiffGate(pixel_threshold=ocr_diff_threshold),
+            workers=ocr_workers,
+            hand_reader=hand_reader,
+        )
+        self._frames = FramePrefetcher(self._grab_frame)
+        self.action_log = ActionLogTracker()
 
-        try:
-            import pytesseract  # type: ignore
-
-            self._pytesseract = pytesseract
-        except ImportError as error:
-            raise RuntimeError("pytesseract is required for --auto-source pokerstars") from error
-
-        if tesseract_cmd:
-            self._pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+    def _roi_union(self, size: tuple[int, int]) -> tuple[tuple[int, int, int, int], dict[str, RoiRect]]:
+        if self._union_cache is None or self._union_cache[0] != size:
+            self._union_cache = (size, roi_union(self._roi_regions, *size))
+        return self._union_cache[1]
 
-        try:
-            from PIL import ImageGrab  # type: ignore
-
-            self._image_grab = ImageGrab
-        except ImportError as error:
-            raise RuntimeError("Pillow is required for --auto-source pokerstars") from error
-
-    @staticmethod
-    def _crop_region(image, roi: RoiRect):
-        width, height = image.size
-        if roi.normalized:
-            left = int(roi.left * width)
-            top = int(roi.top * height)
-            right = int(roi.right * width)
-            bottom = int(roi.bottom * height)
+    def _grab_frame(self) -> CapturedFrame | None:
+        rect = self._capture.window_rect()
+        if rect is None:
+            return None
+        # Sample by saved frame number: unchanged frames are never saved, so
+        # the sample stays due until the next frame that is.
+        full_window = (
+            self.debug_dir is not None
+            and self.debug_sample_every > 0
+            and (self._frame_index + 1) % self.debug_sample_every == 0
+        )
+        if full_window:
+            bbox, regions = (0, 0, *rect.size), self._roi_regions
         else:
-            left = int(roi.left)
-            top = int(roi.top)
-            right = int(roi.right)
-            bottom = int(roi.bottom)
-
-        left = max(0, min(left, width - 1))
-        top = max(0, min(top, height - 1))
-        right = max(left + 1, min(right, width))
-        bottom = max(top + 1, min(bottom, height))
-        return image.crop((left, top, right, bottom))
+            bbox, regions = self._roi_union(rect.size)
+        image = self._capture.grab((rect.left + bbox[0], rect.top + bbox[1], rect.left + bbox[2], rect.top + bbox[3]))
+        return CapturedFrame(image=image, regions=regions, full_window=full_window)
 
     def next_observation(self) -> Observation | None:
-        rect = _find_window_rect(self.window_title_contains)
-        if rect is None:
+        captured_at, frame = self._frames.next()
+        if frame is None:
             return None
 
-        image = self._image_grab.grab(bbox=(rect.left, rect.top, rect.right, rect.bottom), all_screens=True)
-        hand_roi = self._roi_regions.get("hero_hand")
-        action_roi = self._roi_regions.get("action_log")
-
-        if hand_roi is not None:
-            hand_text = self._pytesseract.image_to_string(self._crop_region(image, hand_roi), config="--psm 7")
-        else:
-            hand_text = self._pytesseract.image_to_string(image)
-
-        if action_roi is not None:
-            action_text = self._pytesseract.image_to_string(self._crop_region(image, action_roi), config="--psm 6")
-        else:
-            action_text = self._pytesseract.image_to_string(image)
+        text = self._frame_ocr.read(frame.image, roi_regions=frame.regions)
+        if not text.changed:
+            # Same table state as the last frame: nothing new to report or save.
+            return None
+        hand_text, action_text = text.hand_text, text.action_text
 
         if self.debug_dir:
             self.debug_dir.mkdir(parents=True, exist_ok=True)
             frame_id = f"{self._frame_index:06d}"
-            image.save(self.debug_dir / f"{frame_id}.png")
+            if frame.full_window:
+                frame.image.save(self.debug_dir / f"{frame_id}.png")
             (self.debug_dir / f"{frame_id}.hand.txt").write_text(hand_text, encoding="utf-8")
             (self.debug_dir / f"{frame_id}.action.txt").write_text(action_text, encoding="utf-8")
 
         self._frame_index += 1
-        return extract_observation_from_ocr_parts(
+        observation = extract_observation_from_ocr_parts(
             hand_text=hand_text,
             action_text=action_text,
             hero_position=self.hero_position,
+            tracker=self.action_log,
         )
+        if observation is None:
+            return None
+        # The caller polls again without sleeping: overlap that capture with its work.
+        self._frames.prefetch()
+        return replace(observation, observed_at=captured_at)
+
+    def close(self) -> None:
+        self._frames.close()
+        self._frame_ocr.close()
+        self._capture.close()
@@ -1,23 +1,36 @@
 """Short-deck postflop made-hand and outs analysis helpers."""
 
+from copy import deepcopy
+from functools import lru_cache
 from itertools import combinations
 from math import comb
 
-RANK_ORDER = "6789TJQKA"
-RANK_TO_INDEX = {rank: index for index, rank in enumerate(RANK_ORDER)}
-SUITS = "shdc"
-
-CATEGORY_NAME = {
-    0: "High Card",
-    1: "One Pair",
-    2: "Two Pair",
-    3: "Three of a Kind",
-    4: "Straight",
-    5: "Full House",
-    6: "Flush",
-    7: "Four of a Kind",
-    8: "Straight Flush",
-}
+from shortdeck_cli.batch_evaluator import batch_available, score_states
+from shortdeck_cli.hand_evaluator import (
+    CARD_RANK_KEY,
+    CARD_SUIT_BIT,
+    CARD_TO_INDEX,
+    CATEGORY_NAME,
+    RANK_ORDER,
+    RANK_TO_INDEX,
+    SUITS,
+    encode_cards,
+    evaluate_cards,
+    hand_state,
+    score_state,
+    strength_category,
+)
+from shortdeck_cli.hand_table import table_strength
+from shortdeck_cli.suit_isomorphism import canonicalize, invert_suit_map, translate_card
+
+# Spots are cached under their suit-isomorphic canonical form, so one entry
+# serves every suit relabelling of the same hole cards and board.
+ANALYSIS_CACHE_SIZE = 4096
+
+# Result fields holding cards, translated back to the caller's suits on the
+# way out of the cache. Lists keep the deck order of an uncached analysis.
+_CARD_LIST_FIELDS = ("four_to_straight_cards", "four_to_flush_cards")
+_CARD_DETAIL_FIELDS = ("turn_out_details", "river_out_details", "river_by_turn_card")
 
 
 def full_shortdeck_deck() -> list[str]:
@@ -131,26 +144,112 @@ def _evaluate_five(cards: list[str]) -> tuple:
     return (0, *ranks)
 
 
-def best_hand_strength(cards: list[str]) -> tuple:
-    return max(_evaluate_five(list(combo)) for combo in combinations(cards, 5))
+def best_hand_strength(cards: list[str]) -> int:
+    strength = table_strength(cards)
+    if strength is not None:
+        return strength
+    return evaluate_cards(cards)
+
+
+def hand_name_from_strength(strength: int) -> str:
+    return CATEGORY_NAME[strength_category(strength)]
+
+
+def _score_states(rank_keys: list[int], suit_bits: list[int]) -> list[int]:
+    if not rank_keys:
+        return []
+    if batch_available():
+        return score_states(rank_keys, suit_bits).tolist()
+    return [score_state(rank_key, bits) for rank_key, bits in zip(rank_keys, suit_bits)]
+
+
+def _translate_result(result: dict, suit_map: dict[str, str]) -> dict:
+    # Deep copy: the cached result is shared by every spot of its suit class,
+    # so callers must never get its nested dicts and lists.
+    translated = deepcopy(result)
+    for field in _CARD_LIST_FIELDS:
+        if field in result:
+            cards = [translate_card(card, suit_map) for card in result[field]]
+            translated[field] = sorted(cards, key=CARD_TO_INDEX.__getitem__)
+    for field in _CARD_DETAIL_FIELDS:
+        if field in result:
+            details = [{**item, "card": translate_card(item["card"], suit_map)} for item in translated[field]]
+            translated[field] = sorted(details, key=lambda item: CARD_TO_INDEX[item["card"]])
+    return translated
+
 
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def _analyze_flop_canonical(hole_cards: tuple[str, ...], flop_cards: tuple[str, ...]) -> dict:
+    return _analyze_flop_uncached(list(hole_cards), list(flop_cards))
 
-def hand_name_from_strength(strength: tuple) -> str:
-    return CATEGORY_NAME[strength[0]]
+
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def _analyze_turn_canonical(hole_cards: tuple[str, ...], board_cards: tuple[str, ...]) -> dict:
+    return _analyze_turn_uncached(list(hole_cards), list(board_cards[:3]), board_cards[3])
+
+
+def clear_analysis_cache() -> None:
+    _analyze_flop_canonical.cache_clear()
+    _analyze_turn_canonical.cache_clear()
 
 
 def analyze_flop(hole_cards: list[str], flop_cards: list[str]) -> dict:
+    (canonical_hole, canonical_flop), to_canonical = canonicalize((hole_cards, flop_cards))
+    result = _analyze_flop_canonical(canonical_hole, canonical_flop)
+    return _translate_result(result, invert_suit_map(to_canonical))
+
+
+def analyze_turn(hole_cards: list[str], flop_cards: list[str], turn_card: str) -> dict:
+    (canonical_hole, canonical_board), to_canonical = canonicalize((hole_cards, flop_cards + [turn_card]))
+    result = _analyze_turn_canonical(canonical_hole, canonical_board)
+    return _translate_result(result, invert_suit_map(to_canonical))
+
+
+def _category_distribution(category_counts: list[int], current_category: int, total: int) -> dict:
+    """Final made-hand category percentages, keyed by ``CATEGORY_NAME``.
+
+    ``river_category_pct`` is the full distribution, ``river_better_category_pct``
+    keeps only categories above the current one, and ``river_at_least_pct``
+    is cumulative (probability of finishing with that category or better).
+    """
+    category_pct = {
+        CATEGORY_NAME[category]: (count * 100.0 / total) if total else 0.0
+        for category, count in enumerate(category_counts)
+    }
+    at_least_pct: dict[str, float] = {}
+    running = 0
+    for category in range(len(category_counts) - 1, -1, -1):
+        running += category_counts[category]
+        at_least_pct[CATEGORY_NAME[category]] = (running * 100.0 / total) if total else 0.0
+
+    return {
+        "river_category_pct": category_pct,
+        "river_better_category_pct": {
+            CATEGORY_NAME[category]: category_pct[CATEGORY_NAME[category]]
+            for category in range(current_category + 1, len(category_counts))
+        },
+        "river_at_least_pct": {CATEGORY_NAME[category]: at_least_pct[CATEGORY_NAME[category]] for category in CATEGORY_NAME},
+    }
+
+
+def _analyze_flop_uncached(hole_cards: list[str], flop_cards: list[str]) -> dict:
     known_cards = hole_cards + flop_cards
     current_strength = best_hand_strength(known_cards)
     deck = [card for card in full_shortdeck_deck() if card not in set(known_cards)]
+    deck_indexes = encode_cards(deck)
+
+    # Turn pass: extend the flop state (rank key + suit bits) by each turn card.
+    flop_key, flop_bits = hand_state(encode_cards(known_cards))
+    turn_keys = [flop_key + CARD_RANK_KEY[index] for index in deck_indexes]
+    turn_bits = [flop_bits | CARD_SUIT_BIT[index] for index in deck_indexes]
+    turn_strengths = _score_states(turn_keys, turn_bits)
 
     turn_outs = 0
     turn_out_details: list[dict[str, str]] = []
     four_to_straight_cards: list[str] = []
     four_to_flush_cards: list[str] = []
-    for turn_card in deck:
+    for turn_card, strength_after_turn in zip(deck, turn_strengths):
         cards_after_turn = known_cards + [turn_card]
-        strength_after_turn = best_hand_strength(cards_after_turn)
         if strength_after_turn > current_strength:
             turn_outs += 1
             turn_out_details.append(
@@ -168,14 +267,43 @@ def analyze_flop(hole_cards: list[str], flop_cards: list[str]) -> dict:
     total_turn_cards = len(deck)
     turn_outs_pct = (turn_outs * 100.0 / total_turn_cards) if total_turn_cards else 0.0
 
+    # River pass: every turn state is extended by one more card instead of
+    # rescoring 7 cards from scratch. Each unordered runout is scored once and
+    # credited to both of its cards' per-turn distributions.
+    runouts = list(combinations(range(len(deck)), 2))
+    river_strengths = _score_states(
+        [turn_keys[turn] + CARD_RANK_KEY[deck_indexes[river]] for turn, river in runouts],
+        [turn_bits[turn] | CARD_SUIT_BIT[deck_indexes[river]] for turn, river in runouts],
+    )
+
+    improved_by_turn = [0] * len(deck)
+    made_hands_by_turn: list[dict[str, int]] = [{} for _ in deck]
+    category_counts = [0] * len(CATEGORY_NAME)
     success_by_river = 0
-    total_by_river = comb(len(deck), 2)
-    for turn_card, river_card in combinations(deck, 2):
-        final_strength = best_hand_strength(known_cards + [turn_card, river_card])
+    for (turn, river), final_strength in zip(runouts, river_strengths):
+        category_counts[strength_category(final_strength)] += 1
         if final_strength > current_strength:
             success_by_river += 1
+            made_hand = hand_name_from_strength(final_strength)
+            for position in (turn, river):
+                improved_by_turn[position] += 1
+                made_hands_by_turn[position][made_hand] = made_hands_by_turn[position].get(made_hand, 0) + 1
 
+    total_by_river = comb(len(deck), 2)
     improve_by_river_pct = (success_by_river * 100.0 / total_by_river) if total_by_river else 0.0
+    river_distribution = _category_distribution(category_counts, strength_category(current_strength), total_by_river)
+
+    rivers_per_turn = len(deck) - 1
+    river_by_turn_card = [
+        {
+            "card": turn_card,
+            "river_total": rivers_per_turn,
+            "improve_count": improved_by_turn[position],
+            "improve_pct": (improved_by_turn[position] * 100.0 / rivers_per_turn) if rivers_per_turn else 0.0,
+            "made_hands": made_hands_by_turn[position],
+        }
+        for position, turn_card in enumerate(deck)
+    ]
 
     return {
         "made_hand": hand_name_from_strength(current_strength),
@@ -186,18 +314,27 @@ def analyze_flop(hole_cards: list[str], flop_cards: list[str]) -> dict:
         "turn_out_details": turn_out_details,
         "four_to_straight_cards": four_to_straight_cards,
         "four_to_flush_cards": four_to_flush_cards,
+        "river_by_turn_card": river_by_turn_card,
+        **river_distribution,
     }
 
 
-def analyze_turn(hole_cards: list[str], flop_cards: list[str], turn_card: str) -> dict:
+def _analyze_turn_uncached(hole_cards: list[str], flop_cards: list[str], turn_card: str) -> dict:
     known_cards = hole_cards + flop_cards + [turn_card]
     current_strength = best_hand_strength(known_cards)
     deck = [card for card in full_shortdeck_deck() if card not in set(known_cards)]
 
+    deck_indexes = encode_cards(deck)
+
+    turn_key, turn_bits = hand_state(encode_cards(known_cards))
+    river_strengths = _score_states(
+        [turn_key + CARD_RANK_KEY[index] for index in deck_indexes],
+        [turn_bits | CARD_SUIT_BIT[index] for index in deck_indexes],
+    )
+
     river_outs = 0
     river_out_details: list[dict[str, str]] = []
-    for river_card in deck:
-        final_strength = best_hand_strength(known_cards + [river_card])
+    for river_card, final_strength in zip(deck, river_strengths):
         if final_strength > current_strength:
             river_outs += 1
             river_out_details.append(
@@ -0,0 +1,235 @@
+"""Precomputed preflop all-in equity matrix for every starting-hand class pair.
+
+The 81 hand classes of ``rules.HAND_CLASSES`` give an 81x81 matrix of
+class-vs-class all-in equities. The generator enumerates every board exactly
+for each combo pairing (grouped by suit isomorphism, with card removal) and
+writes a small binary asset next to ``preflop_scenarios.json``:
+
+    header | equity uint16[81 * 81] (scaled by 65535) | combo pairs uint8[81 * 81]
+
+``combo pairs`` is the number of non-conflicting combo pairings of two
+classes, which weights class pairs in range-vs-range queries. At runtime
+every lookup is a table read; NumPy is only needed to rebuild the asset
+(``python -m shortdeck_cli.preflop_equity build``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import struct
+import time
+from array import array
+from functools import lru_cache
+from itertools import combinations, permutations
+from pathlib import Path
+
+from shortdeck_cli.batch_evaluator import hand_states, require_numpy, score_states
+from shortdeck_cli.equity import hand_class_combos, range_from_scenario
+from shortdeck_cli.evaluator import POSITION_ALIAS
+from shortdeck_cli.hand_evaluator import DECK_SIZE, RULES_VERSION, hand_state
+from shortdeck_cli.rules import HAND_CLASSES
+
+EQUITY_MAGIC = b"SDEQ"
+EQUITY_FORMAT_VERSION = 1
+EQUITY_SCALE = 65535
+DEFAULT_EQUITY_PATH = Path(__file__).resolve().parent / "data" / "preflop_equity.bin"
+
+# magic, format version, rules version, class count
+_HEADER = struct.Struct("<4sHHI")
+
+CLASS_INDEX = {hand_class: index for index, hand_class in enumerate(HAND_CLASSES)}
+
+
+def compatible_combo_pairs(first_class: str, second_class: str) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+    return [
+        (first, second)
+        for first in hand_class_combos(first_class)
+        for second in hand_class_combos(second_class)
+        if not set(first).intersection(second)
+    ]
+
+
+def _canonical_pairing(first: tuple[int, int], second: tuple[int, int]) -> tuple[tuple[int, int], tuple[int, int]]:
+    best = None
+    for permutation in permutations(range(4)):
+        mapped_first = tuple(sorted(card - card % 4 + permutation[card % 4] for card in first))
+        mapped_second = tuple(sorted(card - card % 4 + permutation[card % 4] for card in second))
+        candidate = (mapped_first, mapped_second)
+        if best is None or candidate < best:
+            best = candidate
+    return best
+
+
+class PreflopEquityMatrix:
+    def __init__(self, equities: array, combo_pairs: bytes):
+        self._equities = equities
+        self._combo_pairs = combo_pairs
+        self._size = len(HAND_CLASSES)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "PreflopEquityMatrix":
+        payload = Path(path).read_bytes()
+        if len(payload) < _HEADER.size:
+            raise ValueError(f"Preflop equity asset is truncated: {path}")
+        magic, format_version, rules_version, class_count = _HEADER.unpack_from(payload, 0)
+        if magic != EQUITY_MAGIC or format_version != EQUITY_FORMAT_VERSION:
+            raise ValueError(f"Unsupported preflop equity asset: {path}")
+        if rules_version != RULES_VERSION or class_count != len(HAND_CLASSES):
+            raise ValueError(f"Preflop equity asset was built for a different rule set; rebuild it: {path}")
+
+        cells = class_count * class_count
+        offset = _HEADER.size
+        if len(payload) != offset + 3 * cells:
+            raise ValueError(f"Preflop equity asset is corrupt: {path}")
+        equities = array("H")
+        equities.frombytes(payload[offset:offset + 2 * cells])
+        if array("H", [1]).tobytes() != b"\x01\x00":
+            equities.byteswap()
+        return cls(equities, payload[offset + 2 * cells:])
+
+    def save(self, path: str | Path) -> Path:
+        path = Path(path)
+        equities = array("H", self._equities)
+        if array("H", [1]).tobytes() != b"\x01\x00":
+            equities.byteswap()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(
+            _HEADER.pack(EQUITY_MAGIC, EQUITY_FORMAT_VERSION, RULES_VERSION, self._size)
+            + equities.tobytes()
+            + bytes(self._combo_pairs)
+        )
+        return path
+
+    def class_equity(self, hero_class: str, villain_class: str) -> float:
+        cell = CLASS_INDEX[hero_class] * self._size + CLASS_INDEX[villain_class]
+        return self._equities[cell] / EQUITY_SCALE
+
+    def combo_pairs(self, hero_class: str, villain_class: str) -> int:
+        return self._combo_pairs[CLASS_INDEX[hero_class] * self._size + CLASS_INDEX[villain_class]]
+
+    def range_equity(self, hero_range: dict[str, float], villain_range: dict[str, float]) -> float:
+        """All-in equity of a weighted hero range against a weighted villain range."""
+        total = 0.0
+        weighted_equity = 0.0
+        for hero_class, hero_weight in hero_range.items():
+            if hero_weight <= 0:
+                continue
+            row = CLASS_INDEX[hero_class] * self._size
+            for villain_class, villain_weight in villain_range.items():
+                if villain_weight <= 0:
+                    continue
+                cell = row + CLASS_INDEX[villain_class]
+                weight = hero_weight * villain_weight * self._combo_pairs[cell]
+                total += weight
+                weighted_equity += weight * self._equities[cell]
+        if total <= 0:
+            raise ValueError("Ranges have no compatible combos.")
+        return weighted_equity / total / EQUITY_SCALE
+
+    def class_vs_range_equity(self, hero_class: str, villain_range: dict[str, float]) -> float:
+        return self.range_equity({hero_class: 1.0}, villain_range)
+
+
+@lru_cache(maxsize=1)
+def load_preflop_equity() -> PreflopEquityMatrix | None:
+    """Read the shipped equity matrix on first use; ``None`` when missing or stale."""
+    if not DEFAULT_EQUITY_PATH.exists():
+        return None
+    try:
+        return PreflopEquityMatrix.load(DEFAULT_EQUITY_PATH)
+    except (OSError, ValueError):
+        return None
+
+
+def all_in_equity(hero_class: str, villain_position: str) -> float | None:
+    """Hero class equity against the villain's opening all-in range, if known."""
+    matrix = load_preflop_equity()
+    if matrix is None or hero_class not in CLASS_INDEX:
+        return None
+    try:
+        shove_range = range_from_scenario(f"open:{POSITION_ALIAS[villain_position]}_rfi", actions=("all-in",))
+    except ValueError:
+        return None
+    if not shove_range:
+        return None
+    return matrix.class_vs_range_equity(hero_class, shove_range)
+
+
+class _BoardEnumerator:
+    """All C(36, 5) boards as NumPy arrays of rank keys, suit bits and card masks."""
+
+    def __init__(self):
+        np = require_numpy()
+        self._np = np
+        boards = np.array(list(combinations(range(DECK_SIZE), 5)), dtype=np.intp)
+        self.rank_keys, self.suit_bits = hand_states(boards)
+        self.card_masks = np.bitwise_or.reduce(np.left_shift(np.int64(1), boards.astype(np.int64)), axis=1)
+
+    def pairing_counts(self, first: tuple[int, int], second: tuple[int, int]) -> tuple[int, int, int]:
+        np = self._np
+        dead = 0
+        for card in first + second:
+            dead |= 1 << card
+        valid = (self.card_masks & dead) == 0
+        rank_keys = self.rank_keys[valid]
+        suit_bits = self.suit_bits[valid]
+
+        first_key, first_bits = hand_state(first)
+        second_key, second_bits = hand_state(second)
+        first_scores = score_states(rank_keys + first_key, suit_bits | first_bits)
+        second_scores = score_states(rank_keys + second_key, suit_bits | second_bits)
+        wins = int(np.count_nonzero(first_scores > second_scores))
+        ties = int(np.count_nonzero(first_scores == second_scores))
+        return wins, ties, len(first_scores) - wins - ties
+
+
+def _exact_class_equity(enumerator: _BoardEnumerator, hero_class: str, villain_class: str) -> tuple[float, int]:
+    pairings = compatible_combo_pairs(hero_class, villain_class)
+    groups: dict[tuple[tuple[int, int], tuple[int, int]], int] = {}
+    for first, second in pairings:
+        key = _canonical_pairing(first, second)
+        groups[key] = groups.get(key, 0) + 1
+
+    equity = 0.0
+    for (first, second), count in groups.items():
+        wins, ties, losses = enumerator.pairing_counts(first, second)
+        equity += count * (wins + ties / 2) / (wins + ties + losses)
+    return equity / len(pairings), len(pairings)
+
+
+def build_preflop_equity_matrix(progress: bool = False) -> PreflopEquityMatrix:
+    enumerator = _BoardEnumerator()
+    size = len(HAND_CLASSES)
+    equities = array("H", [0] * (size * size))
+    combo_pairs = bytearray(size * size)
+
+    started = time.perf_counter()
+    for row, hero_class in enumerate(HAND_CLASSES):
+        for column in range(row, size):
+            villain_class = HAND_CLASSES[column]
+            if row == column:
+                equity, pair_count = 0.5, len(compatible_combo_pairs(hero_class, villain_class))
+            else:
+                equity, pair_count = _exact_class_equity(enumerator, hero_class, villain_class)
+            equities[row * size + column] = round(equity * EQUITY_SCALE)
+            equities[column * size + row] = EQUITY_SCALE - equities[row * size + column]
+            combo_pairs[row * size + column] = pair_count
+            combo_pairs[column * size + row] = pair_count
+        if progress:
+            print(f"{hero_class}: row {row + 1}/{size} done ({time.perf_counter() - started:.0f}s)")
+    return PreflopEquityMatrix(equities, bytes(combo_pairs))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Short-deck preflop equity matrix tools")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    build = subcommands.add_parser("build", help="Enumerate every class pairing and write the equity matrix")
+    build.add_argument("--output", default=str(DEFAULT_EQUITY_PATH), help=f"Output path (default: {DEFAULT_EQUITY_PATH})")
+    args = parser.parse_args(argv)
+
+    path = build_preflop_equity_matrix(progress=True).save(args.output)
+    print(f"Wrote preflop equity matrix: {path} ({path.stat().st_size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Preflop action sequences as a precomputed game tree with integer node ids.
+
+Every decision point of a six-handed preflop betting round is a node; node
+``ROOT`` (0) is UTG acting first. Players act in ``POSITIONS`` order and the
+action comes back around until every player still in the hand has matched
+the largest bet, so the tree covers multiway limps, iso-raises behind limpers
+and a limper shoving over a raise. The bet sizes are abstracted into price
+levels:
+
+- unopened or limped: fold, limp, raise, all-in
+- raised: fold, call, all-in (the only re-raise is all-in)
+- all-in: fold, call
+
+The child of every (node, action) pair sits in one flat array, so following
+an action is a single list read. Sequence keys (``line_key``) name each
+decision spot for strategy data, e.g. ``line:HJ_vs_UTG_limp-MP2_limp``;
+positions that folded are left out of the key.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
+
+from shortdeck_cli.rules import POSITIONS
+
+TREE_ACTIONS = ("fold", "limp", "call", "raise", "all-in")
+TREE_ACTION_ID = {action: action_id for action_id, action in enumerate(TREE_ACTIONS)}
+
+ROOT = 0
+# Child id of an action that ends the preflop betting.
+CLOSED = -1
+_ILLEGAL = -2
+
+# Per-position status inside a node: not acted yet, the price level put in, or folded.
+_PENDING = 0
+_LIMPED = 1
+_RAISED = 2
+_ALL_IN = 3
+_FOLDED = 4
+
+_LEVEL_ACTIONS = {
+    0: ("fold", "limp", "raise", "all-in"),
+    _LIMPED: ("fold", "limp", "raise", "all-in"),
+    _RAISED: ("fold", "call", "all-in"),
+    _ALL_IN: ("fold", "call"),
+}
+_LEVEL_NAMES = {_LIMPED: "limp", _RAISED: "raise", _ALL_IN: "all-in"}
+
+Line = tuple[tuple[str, str], ...]
+
+
+def _next_to_act(status: tuple[int, ...], level: int, actor: int) -> int | None:
+    if sum(1 for value in status if value != _FOLDED) <= 1:
+        return None
+    seats = len(status)
+    for step in range(1, seats + 1):
+        seat = (actor + step) % seats
+        value = status[seat]
+        if value in (_FOLDED, _ALL_IN):
+            continue
+        if value == _PENDING or value < level:
+            return seat
+    return None
+
+
+def _apply(status: tuple[int, ...], level: int, seat: int, action: str) -> tuple[tuple[int, ...], int]:
+    after = list(status)
+    if action == "fold":
+        after[seat] = _FOLDED
+    elif action in ("limp", "call"):
+        level = max(level, _LIMPED)
+        after[seat] = level
+    else:
+        level = _RAISED if action == "raise" else _ALL_IN
+        after[seat] = level
+    return tuple(after), level
+
+
+class PreflopTree:
+    """Every preflop decision node, numbered breadth-first from ``ROOT``."""
+
+    def __init__(self, positions: tuple[str, ...] = POSITIONS):
+        self.positions = positions
+        self.position_index = {position: seat for seat, position in enumerate(positions)}
+        action_count = len(TREE_ACTIONS)
+        seats = len(positions)
+
+        to_act = [0]
+        levels = [0]
+        parents = [-1]
+        parent_actions = [-1]
+        statuses = [(_PENDING,) * seats]
+        children: list[int] = []
+        node_id = 0
+        while node_id < len(to_act):
+            seat, level, status = to_act[node_id], levels[node_id], statuses[node_id]
+            row = [_ILLEGAL] * action_count
+            for action in _LEVEL_ACTIONS[level]:
+                child_status, child_level = _apply(status, level, seat, action)
+                next_seat = _next_to_act(child_status, child_level, seat)
+                if next_seat is None:
+                    row[TREE_ACTION_ID[action]] = CLOSED
+                    continue
+                row[TREE_ACTION_ID[action]] = len(to_act)
+                to_act.append(next_seat)
+                levels.append(child_level)
+                parents.append(node_id)
+                parent_actions.append(TREE_ACTION_ID[action])
+                statuses.append(child_status)
+            children.extend(row)
+            node_id += 1
+
+        self.node_count = len(to_act)
+        self._to_act = bytes(to_act)
+        self._levels = bytes(levels)
+        self._parents = parents
+        self._parent_actions = parent_actions
+        self._statuses = b"".join(bytes(status) for status in statuses)
+        self._children = children
+
+    def to_act(self, node_id: int) -> str:
+        return self.positions[self._to_act[node_id]]
+
+    def legal_actions(self, node_id: int) -> tuple[str, ...]:
+        return _LEVEL_ACTIONS[self._levels[node_id]]
+
+    def facing(self, node_id: int) -> str | None:
+        """Largest action before this node (``limp``, ``raise`` or ``all-in``); ``None`` when unopened."""
+        return _LEVEL_NAMES.get(self._levels[node_id])
+
+    def in_hand(self, node_id: int, position: str) -> bool:
+        """Whether ``position`` can still act (it has not folded or gone all-in)."""
+        status = self._statuses[node_id * len(self.positions) + self.position_index[position]]
+        return status not in (_FOLDED, _ALL_IN)
+
+    def child(self, node_id: int, action: str) -> int:
+        """Node after the player to act takes ``action``; ``CLOSED`` when that ends the betting."""
+        action_id = TREE_ACTION_ID.get(action)
+        child = _ILLEGAL if action_id is None else self._children[node_id * len(TREE_ACTIONS) + action_id]
+        if child == _ILLEGAL:
+            legal = ", ".join(self.legal_actions(node_id))
+            raise ValueError(f"{self.to_act(node_id)} cannot {action} here; legal actions: {legal}")
+        return child
+
+    def _fold_to(self, node_id: int, position: str) -> int:
+        # Players skipped between two listed actions folded.
+        if not self.in_hand(node_id, position):
+            raise ValueError(f"{position} is no longer in the hand.")
+        while self.to_act(node_id) != position:
+            node_id = self.child(node_id, "fold")
+            if node_id == CLOSED:
+                raise ValueError(f"The betting closed before {position} could act.")
+        return node_id
+
+    def walk(self, line: Iterable[tuple[str, str]], node_id: int = ROOT) -> int:
+        """Follow ``(position, action)`` pairs from ``node_id``; unlisted players in between fold."""
+        for position, action in line:
+            node_id = self._fold_to(node_id, position)
+            node_id = self.child(node_id, action)
+            if node_id == CLOSED:
+                raise ValueError(f"The betting closed after {position} {action}.")
+        return node_id
+
+    def hero_node(self, hero_position: str, line: Iterable[tuple[str, str]]) -> int:
+        """Decision node of ``hero_position`` after ``line``, folding any players left in between."""
+        return self._fold_to(self.walk(line), hero_position)
+
+    def history(self, node_id: int) -> Line:
+        """Every ``(position, action)`` pair leading to ``node_id``, folds included."""
+        line: list[tuple[str, str]] = []
+        while node_id != ROOT:
+            parent = self._parents[node_id]
+            line.append((self.to_act(parent), TREE_ACTIONS[self._parent_actions[node_id]]))
+            node_id = parent
+        line.reverse()
+        return tuple(line)
+
+    def line_key(self, node_id: int) -> str:
+        hero = self.to_act(node_id)
+        actions = [f"{position}_{action.replace('-', '_')}" for position, action in self.history(node_id) if action != "fold"]
+        if not actions:
+            return f"line:{hero}_unopened"
+        return f"line:{hero}_vs_{'-'.join(actions)}"
+
+
+@lru_cache(maxsize=1)
+def preflop_tree() -> PreflopTree:
+    return PreflopTree()
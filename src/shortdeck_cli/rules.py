@@ -5,6 +5,30 @@ ACTIONS = ("fold", "limp", "all-in")
 RANKS = "AKQJT9876"
 
 
+def _build_hand_classes() -> tuple[str, ...]:
+	classes: list[str] = []
+	for row, high in enumerate(RANKS):
+		for column, low in enumerate(RANKS):
+			if row == column:
+				classes.append(f"{high}{low}")
+			elif column > row:
+				classes.append(f"{high}{low}s")
+			else:
+				classes.append(f"{low}{high}o")
+	return tuple(classes)
+
+
+# The 9x9 starting-hand grid, row by row: pairs on the diagonal, suited
+# hands above it and offsuit hands below it.
+HAND_CLASSES = _build_hand_classes()
+
+
+def hand_class_combo_count(hand_class: str) -> int:
+	if len(hand_class) == 2:
+		return 6
+	return 4 if hand_class[2] == "s" else 12
+
+
 def previous_positions(position: str) -> tuple[str, ...]:
 	index = POSITIONS.index(position)
 	return POSITIONS[:index]
@@ -0,0 +1,237 @@
+"""Long-lived recommendation server over a local socket.
+
+The server keeps the strategy index, the hand-rank tables and the postflop
+analysis cache warm, so clients pay only a socket round trip per lookup. The
+protocol is newline-delimited JSON over TCP (``HOST:PORT``) or a Unix socket
+(``unix:PATH``). Each request line is an object::
+
+    {"id": 1, "method": "recommend", "params": {"hero_hand": "AKo", "hero_position": "UTG"}}
+    {"id": 2, "method": "line", "params": {"hero_hand": "AKo", "hero_position": "HJ", "line": "UTG limp, MP1 raise", "game_format": "6max-100a"}}
+
+and gets exactly one response line, ``{"id": 1, "result": ...}`` or
+``{"id": 1, "error": "..."}``. Clients may pipeline any number of request
+lines without waiting; responses come back in request order. A JSON array
+of requests is answered with one array of responses. Every connection is
+served on its own thread.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socketserver
+from collections.abc import Callable
+from pathlib import Path
+
+from shortdeck_cli.auto_ingest import Observation
+from shortdeck_cli.evaluator import load_strategy_index, recommend_action, recommend_line
+from shortdeck_cli.parser import (
+    normalize_observation,
+    parse_action_line,
+    parse_flop_cards,
+    parse_hand,
+    parse_position,
+    parse_turn_card,
+    strategy_hand,
+)
+from shortdeck_cli.postflop import analyze_flop, analyze_turn
+from shortdeck_cli.strategy_index import StrategyIndex
+from shortdeck_cli.strategy_registry import StrategyRegistry
+from shortdeck_cli.strategy_reload import StrategyReloader
+
+UNIX_PREFIX = "unix:"
+MAX_REQUEST_BYTES = 1024 * 1024
+
+
+def _hole_cards(raw_value) -> list[str]:
+    hand = parse_hand(str(raw_value))
+    if len(hand) != 4:
+        raise ValueError("Postflop analysis needs explicit hole cards (example: AsKd).")
+    return [hand[:2], hand[2:]]
+
+
+def _optional_str(params: dict, name: str) -> str | None:
+    value = params.get(name)
+    return None if value is None else str(value)
+
+
+class RecommendationService:
+    """Dispatches protocol requests to the evaluator and postflop analysis."""
+
+    def __init__(self, registry: StrategyRegistry | None = None, reloader: StrategyReloader | None = None):
+        self.registry = registry
+        self.reloader = reloader
+        self._methods: dict[str, Callable[[dict], object]] = {
+            "ping": lambda params: "pong",
+            "recommend": self.recommend,
+            "line": self.line,
+            "flop": self.flop,
+            "turn": self.turn,
+        }
+
+    def warm_up(self) -> None:
+        """Load everything the first request would otherwise wait for."""
+        if self.reloader is not None:
+            # Do not map the default pack too: the reloaded file may be it.
+            self.reloader.current()[1].preload()
+        else:
+            load_strategy_index().preload()
+        analyze_turn(["As", "Kd"], ["Qh", "Jc", "Ts"], "9d")
+        analyze_flop(["As", "Kd"], ["Qh", "Jc", "Ts"])
+
+    def _strategy(self, game_format: str | None, stack_depth) -> tuple[int | None, StrategyIndex | None]:
+        """Strategy for a table, and the reloaded revision when that is what serves it."""
+        strategy = None
+        revision = None
+        if self.reloader is not None:
+            revision, strategy = self.reloader.current()
+        if self.registry is not None:
+            key = self.registry.resolve(game_format, stack_depth)
+            if key is not None:
+                strategy = self.registry.select(*key)
+                revision = None
+        return revision, strategy
+
+    def recommend(self, params: dict) -> dict:
+        observation = Observation(
+            hero_hand=str(params.get("hero_hand", "")),
+            hero_position=str(params.get("hero_position", "")),
+            villain_position=_optional_str(params, "villain_position"),
+            villain_action=_optional_str(params, "villain_action"),
+            game_format=_optional_str(params, "game_format"),
+            stack_depth=params.get("stack_depth"),
+        )
+        spot = normalize_observation(observation)
+
+        revision, strategy = self._strategy(observation.game_format, observation.stack_depth)
+        scenario_key, recommendation = recommend_action(
+            hero_hand=spot.strategy_hand,
+            hero_position=spot.hero_position,
+            villain_position=spot.villain_position,
+            villain_action=spot.villain_action,
+            strategy=strategy,
+        )
+        result = {
+            "hero_hand": spot.hero_hand,
+            "strategy_hand": spot.strategy_hand,
+            "hero_position": spot.hero_position,
+            "villain_position": spot.villain_position,
+            "villain_action": spot.villain_action,
+            "scenario_key": scenario_key,
+            "recommendation": recommendation,
+        }
+        if revision is not None:
+            result["strategy_revision"] = revision
+        return result
+
+    def line(self, params: dict) -> dict:
+        hero_hand = parse_hand(str(params.get("hero_hand", "")))
+        hero_position = parse_position(str(params.get("hero_position", "")))
+        line = parse_action_line(str(params.get("line", "")))
+        revision, strategy = self._strategy(_optional_str(params, "game_format"), params.get("stack_depth"))
+        scenario_key, recommendation = recommend_line(strategy_hand(hero_hand), hero_position, line, strategy=strategy)
+        result = {
+            "hero_hand": hero_hand,
+            "hero_position": hero_position,
+            "line": [list(entry) for entry in line],
+            "scenario_key": scenario_key,
+            "recommendation": recommendation,
+        }
+        if revision is not None:
+            result["strategy_revision"] = revision
+        return result
+
+    def flop(self, params: dict) -> dict:
+        hole_cards = _hole_cards(params.get("hole", ""))
+        flop_cards = parse_flop_cards(str(params.get("flop", "")), blocked_cards=hole_cards)
+        return analyze_flop(hole_cards, flop_cards)
+
+    def turn(self, params: dict) -> dict:
+        hole_cards = _hole_cards(params.get("hole", ""))
+        flop_cards = parse_flop_cards(str(params.get("flop", "")), blocked_cards=hole_cards)
+        turn_card = parse_turn_card(str(params.get("turn", "")), blocked_cards=hole_cards + flop_cards)
+        return analyze_turn(hole_cards, flop_cards, turn_card)
+
+    def handle(self, request) -> dict:
+        if not isinstance(request, dict):
+            return {"id": None, "error": "Request must be a JSON object."}
+        request_id = request.get("id")
+        method = self._methods.get(request.get("method"))
+        if method is None:
+            return {"id": request_id, "error": f"Unknown method: {request.get('method')!r}"}
+        params = request.get("params") or {}
+        if not isinstance(params, dict):
+            return {"id": request_id, "error": "params must be a JSON object."}
+        try:
+            return {"id": request_id, "result": method(params)}
+        except (KeyError, TypeError, ValueError) as error:
+            return {"id": request_id, "error": str(error)}
+
+    def handle_line(self, line: bytes | str) -> str:
+        """Answer one protocol line with one JSON response line (newline included)."""
+        try:
+            request = json.loads(line)
+        except ValueError:
+            response = {"id": None, "error": "Invalid JSON."}
+        else:
+            if isinstance(request, list):
+                response = [self.handle(item) for item in request]
+            else:
+                response = self.handle(request)
+        return json.dumps(response, separators=(",", ":")) + "\n"
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        service: RecommendationService = self.server.service
+        while True:
+            line = self.rfile.readline(MAX_REQUEST_BYTES)
+            if not line:
+                return
+            if not line.strip():
+                continue
+            if not line.endswith(b"\n") and len(line) >= MAX_REQUEST_BYTES:
+                self.wfile.write(b'{"id":null,"error":"Request line too long."}\n')
+                return
+            self.wfile.write(service.handle_line(line).encode("utf-8"))
+
+
+class _TcpConnectionHandler(_ConnectionHandler):
+    # Responses are small; do not let Nagle hold them back for the next write.
+    disable_nagle_algorithm = True
+
+
+class _TcpServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+
+def create_server(address: str, service: RecommendationService) -> socketserver.BaseServer:
+    """Bind ``HOST:PORT`` (TCP) or ``unix:PATH``; port 0 picks a free port."""
+    if address.startswith(UNIX_PREFIX):
+        if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+            raise ValueError("Unix sockets are not supported on this platform.")
+        path = Path(address[len(UNIX_PREFIX):])
+        if path.is_socket():
+            path.unlink()
+        server = _UnixServer(os.fspath(path), _ConnectionHandler)
+    else:
+        host, separator, port = address.rpartition(":")
+        if not separator or not port.isdigit():
+            raise ValueError(f"Serve address must be HOST:PORT or {UNIX_PREFIX}PATH: {address}")
+        server = _TcpServer((host or "127.0.0.1", int(port)), _TcpConnectionHandler)
+    server.service = service
+    return server
+
+
+def server_address_label(server: socketserver.BaseServer) -> str:
+    address = server.server_address
+    if isinstance(address, tuple):
+        return f"{address[0]}:{address[1]}"
+    return f"{UNIX_PREFIX}{os.fsdecode(address)}"
@@ -0,0 +1,203 @@
+"""Compiled strategy index: flat per-(scenario, hand class) recommendation arrays.
+
+A ``StrategyIndex`` resolves each scenario once, on first read. Each cell
+``scenario_id * HAND_CLASS_COUNT + hand_id`` then holds the normalized, sorted
+action distribution and the formatted recommendation line, so a lookup is two
+dict reads and one list read. Decision nodes of the preflop tree
+(``preflop_tree``) map to scenario ids through one list, filled on first use.
+Rows come from parsed JSON or from a binary strategy pack (``strategy_pack``).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+
+from shortdeck_cli.rules import HAND_CLASSES
+
+DISPLAY_MIN_PERCENT = 1.0
+ALLOWED_ACTIONS = frozenset({"all-in", "call", "fold", "raise", "check", "open", "limp", "ante"})
+
+HAND_CLASS_COUNT = len(HAND_CLASSES)
+HAND_CLASS_ID = {hand_class: index for index, hand_class in enumerate(HAND_CLASSES)}
+
+Spot = tuple[str, str, str]
+Distribution = tuple[tuple[str, float], ...]
+# One entry per hand class, in ``HAND_CLASSES`` order, then the scenario default.
+ScenarioRow = tuple[Distribution | None, ...]
+
+
+def _format_percent(value: float) -> str:
+    rounded = round(value, 1)
+    if rounded.is_integer():
+        return str(int(rounded))
+    return f"{rounded:.1f}"
+
+
+def action_weights(action_data: str | dict[str, float | int]) -> list[tuple[str, float]]:
+    """Normalize a ``hand_actions`` entry into ``(action, percent)`` pairs, largest first."""
+    if isinstance(action_data, str):
+        return [(action_data, 100.0)]
+
+    raw_entries: list[tuple[str, float]] = []
+    for action, raw_value in action_data.items():
+        if action not in ALLOWED_ACTIONS:
+            continue
+        value = float(raw_value)
+        if value <= 0:
+            continue
+        raw_entries.append((action, value))
+
+    use_fraction_scale = bool(raw_entries) and all(0 < value <= 1 for _, value in raw_entries)
+    normalized: list[tuple[str, float]] = []
+    for action, value in raw_entries:
+        if use_fraction_scale:
+            value *= 100
+        normalized.append((action, value))
+
+    total = sum(value for _, value in normalized)
+    if total <= 0:
+        return []
+
+    scaled = [(action, (value / total) * 100) for action, value in normalized]
+    scaled.sort(key=lambda item: item[1], reverse=True)
+    return scaled
+
+
+def format_distribution(scaled: list[tuple[str, float]] | Distribution) -> str:
+    """Format normalized ``(action, percent)`` pairs, largest first, as a recommendation line."""
+    if not scaled:
+        return "Data recommendation: TBD"
+
+    filtered = [(action, value) for action, value in scaled if value >= DISPLAY_MIN_PERCENT]
+    if not filtered:
+        filtered = [scaled[0]]
+
+    filtered_total = sum(value for _, value in filtered)
+    display_scaled = [(action, (value / filtered_total) * 100) for action, value in filtered]
+
+    top_weight = display_scaled[0][1]
+    if top_weight >= 90:
+        confidence = "high"
+    elif top_weight >= 60:
+        confidence = "medium"
+    else:
+        confidence = "low"
+
+    if len(display_scaled) == 1:
+        return f"Data recommendation: {display_scaled[0][0]} (confidence: {confidence})"
+
+    parts = [f"{_format_percent(value)}% {action}" for action, value in display_scaled]
+    return f"Data recommendation: {', '.join(parts)} (confidence: {confidence})"
+
+
+def format_data_recommendation(action_data: str | dict[str, float | int]) -> str:
+    if isinstance(action_data, str):
+        return f"Data recommendation: {action_data} (confidence: high)"
+    return format_distribution(action_weights(action_data))
+
+
+def scenario_row(scenario: dict) -> ScenarioRow:
+    """Normalize one JSON scenario into per-hand-class distributions plus its default."""
+    hand_actions = scenario.get("hand_actions", {})
+    row: list[Distribution | None] = []
+    for hand_class in HAND_CLASSES:
+        action_data = hand_actions.get(hand_class)
+        row.append(None if action_data is None else tuple(action_weights(action_data)))
+    default = scenario.get("default_recommendation", "TBD")
+    row.append(None if default == "TBD" else tuple(action_weights(default)))
+    return tuple(row)
+
+
+class StrategyIndex:
+    """Strategy data resolved into flat arrays indexed by scenario id and hand-class id.
+
+    Scenario rows are decoded by ``load_row`` the first time a scenario is
+    read, then every hand-class cell of that row is normalized and formatted.
+    """
+
+    def __init__(
+        self,
+        scenario_keys: tuple[str, ...],
+        load_row: Callable[[int], ScenarioRow],
+        spots: Mapping[Spot, str],
+        nodes: Callable[[], Sequence[tuple[str, ...]]] | None = None,
+    ):
+        self.scenario_keys = scenario_keys
+        self.scenario_ids = {key: scenario_id for scenario_id, key in enumerate(scenario_keys)}
+        self._load_row = load_row
+        self._resolved = bytearray(len(scenario_keys))
+        self._distributions: list[Distribution | None] = [None] * (len(scenario_keys) * HAND_CLASS_COUNT)
+        self._recommendations: list[str | None] = [None] * len(self._distributions)
+        # Spots whose key has no scenario resolve to id -1 so lookups still
+        # report the key that was searched for.
+        self._spots = {spot: (key, self.scenario_ids.get(key, -1)) for spot, key in spots.items()}
+        # Returns the candidate scenario keys per preflop tree node, most
+        # specific first; only called on the first ``node`` lookup.
+        self._node_keys = nodes
+        self._nodes: list[tuple[str, int]] | None = None
+
+    def _resolve(self, scenario_id: int) -> None:
+        row = self._load_row(scenario_id)
+        default = row[HAND_CLASS_COUNT]
+        default_text = None if default is None else format_distribution(default)
+        base = scenario_id * HAND_CLASS_COUNT
+        for hand_id in range(HAND_CLASS_COUNT):
+            distribution = row[hand_id]
+            self._distributions[base + hand_id] = distribution
+            self._recommendations[base + hand_id] = default_text if distribution is None else format_distribution(distribution)
+        self._resolved[scenario_id] = 1
+
+    def preload(self) -> None:
+        """Resolve every scenario now, e.g. before swapping a freshly built index in."""
+        for scenario_id, resolved in enumerate(self._resolved):
+            if not resolved:
+                self._resolve(scenario_id)
+
+    def spot(self, hero_position: str, villain_position: str, villain_action: str) -> tuple[str, int]:
+        """Return ``(scenario_key, scenario_id)``; the id is ``-1`` for unknown scenarios."""
+        return self._spots[(hero_position, villain_position, villain_action)]
+
+    def node(self, node_id: int) -> tuple[str, int]:
+        """Return ``(scenario_key, scenario_id)`` for a preflop tree node: its first candidate key with data."""
+        if self._nodes is None:
+            nodes = []
+            for keys in self._node_keys() if self._node_keys is not None else ():
+                known = next((key for key in keys if key in self.scenario_ids), None)
+                nodes.append((keys[0], -1) if known is None else (known, self.scenario_ids[known]))
+            self._nodes = nodes
+        return self._nodes[node_id]
+
+    def recommendation(self, scenario_id: int, hand_class: str) -> str | None:
+        """Formatted data recommendation, falling back to the scenario default."""
+        hand_id = HAND_CLASS_ID.get(hand_class)
+        if scenario_id < 0 or hand_id is None:
+            return None
+        if not self._resolved[scenario_id]:
+            self._resolve(scenario_id)
+        return self._recommendations[scenario_id * HAND_CLASS_COUNT + hand_id]
+
+    def distribution(self, scenario_id: int, hand_class: str) -> Distribution | None:
+        """Normalized ``(action, percent)`` pairs for a hand, largest first."""
+        hand_id = HAND_CLASS_ID.get(hand_class)
+        if scenario_id < 0 or hand_id is None:
+            return None
+        if not self._resolved[scenario_id]:
+            self._resolve(scenario_id)
+        return self._distributions[scenario_id * HAND_CLASS_COUNT + hand_id]
+
+
+def compile_strategy_index(
+    data: dict,
+    spots: Mapping[Spot, str],
+    nodes: Callable[[], Sequence[tuple[str, ...]]] | None = None,
+) -> StrategyIndex:
+    """Build a ``StrategyIndex`` over parsed strategy JSON.
+
+    ``spots`` maps ``(hero_position, villain_position, villain_action)`` to the
+    scenario key that spot reads, and ``nodes`` returns the candidate keys of
+    each preflop tree node (called on the first node lookup), so lookups
+    never build key strings.
+    """
+    scenarios = data.get("scenarios", {})
+    scenario_keys = tuple(scenarios)
+    return StrategyIndex(scenario_keys, lambda scenario_id: scenario_row(scenarios[scenario_keys[scenario_id]]), spots, nodes)
@@ -0,0 +1,299 @@
+"""Binary strategy packs: compiled ``preflop_scenarios.json`` charts read through mmap.
+
+Layout (little-endian):
+
+    header | metadata JSON | action names | scenario directory | strings | cells
+
+The directory holds one fixed-width entry per scenario (key and label offsets
+into the string blob). Cells are fixed-width too: every scenario has one cell
+per hand class plus one for its default recommendation, each storing the
+normalized, sorted ``(action id, percent)`` pairs of ``action_weights``.
+Opening a pack only reads the header and directory; a scenario's cells are
+decoded the first time it is looked up. Packs that may be rebuilt while a
+session runs (``--strategy-reload``) are read into memory instead of mapped:
+Windows refuses to replace a file that any process has mapped.
+
+Packs built from a file record the SHA-256 of that source JSON in their
+metadata (``source_digest``), along with its size and modification time
+(``source_stamp``), so a pack that is older than its JSON can be detected
+with a ``stat`` call in the common case. Rebuild it after editing the JSON
+with ``python -m shortdeck_cli.strategy_pack build``; ``check`` compares the
+digests.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+from shortdeck_cli.rules import HAND_CLASSES
+from shortdeck_cli.strategy_index import Distribution, ScenarioRow, Spot, StrategyIndex, scenario_row
+
+PACK_MAGIC = b"SDSP"
+PACK_FORMAT_VERSION = 1
+PACK_SUFFIX = ".sdpack"
+DATA_DIR = Path(__file__).resolve().parent / "data"
+DEFAULT_SOURCE_PATH = DATA_DIR / "preflop_scenarios.json"
+DEFAULT_PACK_PATH = DATA_DIR / "preflop_scenarios.sdpack"
+
+# magic, format version, hand class count, action count, scenario count,
+# hand class digest, metadata length, string blob length
+_HEADER = struct.Struct("<4sHHHH32sII")
+_ACTION = struct.Struct("<16s")
+# key offset, key length, label offset, label length
+_DIRECTORY_ENTRY = struct.Struct("<IHIH")
+MISSING_CELL = 0xFF
+_ROW_CELLS = len(HAND_CLASSES) + 1
+SOURCE_DIGEST_KEY = "source_sha256"
+SOURCE_STAMP_KEY = "source_stamp"
+
+
+def hand_classes_digest() -> bytes:
+    return hashlib.sha256(",".join(HAND_CLASSES).encode("ascii")).digest()
+
+
+def source_digest(path: str | Path) -> str:
+    """SHA-256 of a strategy JSON file, ignoring CRLF/LF differences from checkouts."""
+    return hashlib.sha256(Path(path).read_bytes().replace(b"\r\n", b"\n")).hexdigest()
+
+
+def source_stamp(path: str | Path) -> tuple[int, int]:
+    """``(size, mtime_ns)`` of a strategy JSON file."""
+    stat = Path(path).stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _cell_struct(action_count: int) -> struct.Struct:
+    return struct.Struct("<B" + "Bd" * action_count)
+
+
+def compile_strategy_pack(
+    data: dict,
+    path: str | Path,
+    source_sha256: str | None = None,
+    source_stamp: tuple[int, int] | None = None,
+) -> Path:
+    """Write the scenarios of parsed strategy JSON as a binary pack.
+
+    ``source_sha256`` (see ``source_digest``) and ``source_stamp`` record which
+    JSON file the pack was built from.
+    """
+    scenarios = data.get("scenarios", {})
+    rows = [scenario_row(scenario) for scenario in scenarios.values()]
+
+    actions: list[str] = []
+    for row in rows:
+        for distribution in row:
+            for action, _ in distribution or ():
+                if action not in actions:
+                    actions.append(action)
+    for action in actions:
+        if len(action.encode("utf-8")) > _ACTION.size:
+            raise ValueError(f"Action name is too long for a strategy pack: {action}")
+    action_ids = {action: action_id for action_id, action in enumerate(actions)}
+    cell = _cell_struct(len(actions))
+
+    strings = bytearray()
+    directory = bytearray()
+    for key, scenario in scenarios.items():
+        key_bytes = key.encode("utf-8")
+        label_bytes = str(scenario.get("label", "")).encode("utf-8")
+        directory += _DIRECTORY_ENTRY.pack(len(strings), len(key_bytes), len(strings) + len(key_bytes), len(label_bytes))
+        strings += key_bytes + label_bytes
+
+    cells = bytearray()
+    padding = [0, 0.0] * len(actions)
+    for row in rows:
+        for distribution in row:
+            if distribution is None:
+                cells += cell.pack(MISSING_CELL, *padding)
+                continue
+            slots = [value for action, percent in distribution for value in (action_ids[action], percent)]
+            cells += cell.pack(len(distribution), *slots, *padding[len(slots):])
+
+    metadata_fields = {key: value for key, value in data.items() if key != "scenarios"}
+    if source_sha256 is not None:
+        metadata_fields[SOURCE_DIGEST_KEY] = source_sha256
+    if source_stamp is not None:
+        metadata_fields[SOURCE_STAMP_KEY] = list(source_stamp)
+    metadata = json.dumps(metadata_fields).encode("utf-8")
+    header = _HEADER.pack(
+        PACK_MAGIC,
+        PACK_FORMAT_VERSION,
+        len(HAND_CLASSES),
+        len(actions),
+        len(scenarios),
+        hand_classes_digest(),
+        len(metadata),
+        len(strings),
+    )
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write a sibling file and rename it over the target, so readers never see
+    # a torn file. On POSIX a process that has the old pack mapped keeps
+    # reading the old inode; on Windows the rename fails while the target is
+    # mapped, which is why reloaded packs are opened with ``in_memory=True``.
+    staging = path.with_name(f".{path.name}.tmp")
+    staging.write_bytes(
+        header
+        + metadata
+        + b"".join(_ACTION.pack(action.encode("utf-8")) for action in actions)
+        + bytes(directory)
+        + bytes(strings)
+        + bytes(cells)
+    )
+    os.replace(staging, path)
+    return path
+
+
+def _read_raw_metadata(path: Path) -> dict:
+    with path.open("rb") as pack_file:
+        header = pack_file.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ValueError(f"Strategy pack is truncated: {path}")
+        magic, format_version, *_, metadata_length, _ = _HEADER.unpack(header)
+        if magic != PACK_MAGIC or format_version != PACK_FORMAT_VERSION:
+            raise ValueError(f"Unsupported strategy pack format: {path}")
+        return json.loads(pack_file.read(metadata_length).decode("utf-8"))
+
+
+def read_pack_metadata(path: str | Path) -> dict:
+    """Read only the header and metadata of a pack (no mapping, no directory)."""
+    metadata = _read_raw_metadata(Path(path))
+    metadata.pop(SOURCE_DIGEST_KEY, None)
+    metadata.pop(SOURCE_STAMP_KEY, None)
+    return metadata
+
+
+def pack_source_digest(path: str | Path) -> str | None:
+    """The source JSON digest a pack was built from; ``None`` when it was not recorded."""
+    digest = _read_raw_metadata(Path(path)).get(SOURCE_DIGEST_KEY)
+    return digest if isinstance(digest, str) else None
+
+
+def pack_source_stamp(path: str | Path) -> tuple[int, int] | None:
+    """The source JSON ``(size, mtime_ns)`` a pack was built from; ``None`` when it was not recorded."""
+    stamp = _read_raw_metadata(Path(path)).get(SOURCE_STAMP_KEY)
+    if not isinstance(stamp, list) or len(stamp) != 2 or not all(isinstance(value, int) for value in stamp):
+        return None
+    return stamp[0], stamp[1]
+
+
+class StrategyPack:
+    """Read-only view over a compiled strategy pack, memory-mapped unless ``in_memory``."""
+
+    def __init__(self, path: str | Path, in_memory: bool = False):
+        self.path = Path(path)
+        with self.path.open("rb") as pack_file:
+            if in_memory:
+                self._buffer = pack_file.read()
+            else:
+                self._buffer = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._buffer) < _HEADER.size:
+            raise ValueError(f"Strategy pack is truncated: {self.path}")
+        magic, format_version, hand_count, action_count, scenario_count, digest, metadata_length, strings_length = (
+            _HEADER.unpack_from(self._buffer, 0)
+        )
+        if magic != PACK_MAGIC or format_version != PACK_FORMAT_VERSION:
+            raise ValueError(f"Unsupported strategy pack format: {self.path}")
+        if hand_count != len(HAND_CLASSES) or digest != hand_classes_digest():
+            raise ValueError(f"Strategy pack was built for a different hand-class layout; rebuild it: {self.path}")
+
+        offset = _HEADER.size
+        self.metadata: dict = json.loads(self._buffer[offset:offset + metadata_length].decode("utf-8"))
+        self.source_digest: str | None = self.metadata.pop(SOURCE_DIGEST_KEY, None)
+        self.metadata.pop(SOURCE_STAMP_KEY, None)
+        offset += metadata_length
+
+        self.actions = tuple(
+            _ACTION.unpack_from(self._buffer, offset + _ACTION.size * action_id)[0].rstrip(b"\0").decode("utf-8")
+            for action_id in range(action_count)
+        )
+        offset += _ACTION.size * action_count
+
+        self._directory_offset = offset
+        self._strings_offset = offset + _DIRECTORY_ENTRY.size * scenario_count
+        self._cells_offset = self._strings_offset + strings_length
+        self._cell = _cell_struct(action_count)
+        expected_size = self._cells_offset + self._cell.size * _ROW_CELLS * scenario_count
+        if len(self._buffer) != expected_size:
+            raise ValueError(f"Strategy pack is corrupt: {self.path}")
+
+        self.scenario_keys = tuple(self._string(scenario_id, 0) for scenario_id in range(scenario_count))
+
+    def _string(self, scenario_id: int, field: int) -> str:
+        entry = _DIRECTORY_ENTRY.unpack_from(self._buffer, self._directory_offset + _DIRECTORY_ENTRY.size * scenario_id)
+        start = self._strings_offset + entry[2 * field]
+        return self._buffer[start:start + entry[2 * field + 1]].decode("utf-8")
+
+    def label(self, scenario_id: int) -> str:
+        return self._string(scenario_id, 1)
+
+    def scenario_row(self, scenario_id: int) -> ScenarioRow:
+        """Decode the hand-class cells and default of one scenario."""
+        row: list[Distribution | None] = []
+        offset = self._cells_offset + self._cell.size * _ROW_CELLS * scenario_id
+        for _ in range(_ROW_CELLS):
+            count, *slots = self._cell.unpack_from(self._buffer, offset)
+            offset += self._cell.size
+            if count == MISSING_CELL:
+                row.append(None)
+                continue
+            row.append(tuple((self.actions[slots[2 * slot]], slots[2 * slot + 1]) for slot in range(count)))
+        return tuple(row)
+
+    def cell_block(self) -> bytes:
+        """Copy of every cell, scenario by scenario, in the fixed-width ``_cell_struct`` layout."""
+        return self._buffer[self._cells_offset:]
+
+    def index(
+        self,
+        spots: dict[Spot, str],
+        nodes: Callable[[], Sequence[tuple[str, ...]]] | None = None,
+    ) -> StrategyIndex:
+        return StrategyIndex(self.scenario_keys, self.scenario_row, spots, nodes)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Short-deck strategy pack tools")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    build = subcommands.add_parser("build", help="Compile strategy JSON into a binary pack")
+    build.add_argument("--source", default=str(DEFAULT_SOURCE_PATH), help=f"Strategy JSON (default: {DEFAULT_SOURCE_PATH})")
+    build.add_argument("--output", default=None, help="Output path (default: the source path with a .sdpack suffix)")
+    check = subcommands.add_parser("check", help="Check that a pack was built from the current strategy JSON")
+    check.add_argument("--source", default=str(DEFAULT_SOURCE_PATH), help=f"Strategy JSON (default: {DEFAULT_SOURCE_PATH})")
+    check.add_argument("--pack", default=None, help="Pack path (default: the source path with a .sdpack suffix)")
+    args = parser.parse_args(argv)
+
+    source = Path(args.source)
+    if args.command == "check":
+        pack_path = Path(args.pack) if args.pack else source.with_suffix(PACK_SUFFIX)
+        try:
+            current = pack_source_digest(pack_path) == source_digest(source)
+        except (OSError, ValueError) as error:
+            parser.exit(2, f"error: {error}\n")
+        if not current:
+            parser.exit(1, f"{pack_path} was not built from the current {source}; rebuild it with: build\n")
+        print(f"{pack_path} is up to date with {source}")
+        return
+
+    with source.open("r", encoding="utf-8") as source_file:
+        data = json.load(source_file)
+    path = compile_strategy_pack(
+        data,
+        args.output or source.with_suffix(PACK_SUFFIX),
+        source_digest(source),
+        source_stamp(source),
+    )
+    print(f"Wrote strategy pack: {path} ({path.stat().st_size} bytes, {len(data.get('scenarios', {}))} scenarios)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""Combo-weighted action frequencies over a whole strategy library.
+
+The library is loaded once into an ``ActionMatrix``: a dense
+``(scenario, hand class, action)`` array of action fractions, with the
+scenario default filled in for hand classes that have no entry of their own.
+Strategy packs are decoded straight from their fixed-width cell block with
+one NumPy view; JSON goes through ``scenario_row``. Queries are then array
+reductions in which every hand class counts with its number of combos
+(6 per pair, 4 suited, 12 offsuit):
+
+    python -m shortdeck_cli.strategy_query freq "vs_limp:CO_vs_HJ_limp"
+    python -m shortdeck_cli.strategy_query freq "vs_all_in:*" --hands "AA, KK, AKs"
+    python -m shortdeck_cli.strategy_query mixed --actions all-in,call --scenarios "vs_all_in:*"
+
+Scenario patterns are shell-style globs over scenario keys. Needs NumPy (the
+``fast`` extra).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+from shortdeck_cli.batch_evaluator import require_numpy
+from shortdeck_cli.equity import parse_range
+from shortdeck_cli.evaluator import default_strategy_path
+from shortdeck_cli.rules import HAND_CLASSES, hand_class_combo_count
+from shortdeck_cli.strategy_index import HAND_CLASS_COUNT, HAND_CLASS_ID, ScenarioRow, scenario_row
+from shortdeck_cli.strategy_pack import MISSING_CELL, PACK_SUFFIX, StrategyPack
+
+HAND_COMBOS = tuple(hand_class_combo_count(hand_class) for hand_class in HAND_CLASSES)
+
+
+@dataclass(frozen=True, eq=False)
+class ActionMatrix:
+    scenario_keys: tuple[str, ...]
+    actions: tuple[str, ...]
+    # (scenarios, hand classes, actions) fractions; each covered cell sums to 1.
+    frequencies: object
+    # (scenarios, hand classes) booleans: the cell has data (its own or the default).
+    covered: object
+
+    def scenario_ids(self, pattern: str = "*"):
+        np = require_numpy("strategy queries")
+        if pattern == "*":
+            return np.arange(len(self.scenario_keys))
+        ids = [scenario_id for scenario_id, key in enumerate(self.scenario_keys) if fnmatchcase(key, pattern)]
+        if not ids:
+            raise ValueError(f"No scenario matches {pattern!r}")
+        return np.asarray(ids, dtype=np.intp)
+
+    def action_ids(self, actions: Iterable[str]):
+        np = require_numpy("strategy queries")
+        ids = []
+        for action in actions:
+            if action not in self.actions:
+                raise ValueError(f"Action {action!r} does not occur in this strategy; actions: {', '.join(self.actions)}")
+            ids.append(self.actions.index(action))
+        return np.asarray(ids, dtype=np.intp)
+
+    def hand_weights(self, hands: Mapping[str, float] | None = None):
+        """Combo count per hand class, scaled by the optional range weights of ``hands``."""
+        np = require_numpy("strategy queries")
+        weights = np.asarray(HAND_COMBOS, dtype=np.float64)
+        if hands is None:
+            return weights
+        scale = np.zeros(HAND_CLASS_COUNT)
+        for hand_class, weight in hands.items():
+            scale[HAND_CLASS_ID[hand_class]] = weight
+        return weights * scale
+
+
+def _matrix_from_cells(np, scenario_keys, actions, counts, action_ids, percents) -> ActionMatrix:
+    # counts (S, H + 1), action_ids / percents (S, H + 1, slots); the last cell
+    # of every row is the scenario default.
+    present = counts != MISSING_CELL
+    used = present[..., None] & (np.arange(action_ids.shape[-1]) < counts[..., None])
+    # One bincount scatters every used slot into its (cell, action) bucket.
+    buckets = np.arange(counts.size).reshape(counts.shape)[..., None] * len(actions) + action_ids
+    cells = np.bincount(
+        buckets[used], weights=percents[used] / 100, minlength=counts.size * len(actions)
+    ).reshape(counts.shape + (len(actions),))
+    own = present[:, :HAND_CLASS_COUNT]
+    frequencies = np.where(own[..., None], cells[:, :HAND_CLASS_COUNT], cells[:, HAND_CLASS_COUNT:])
+    covered = own | present[:, HAND_CLASS_COUNT:]
+    return ActionMatrix(tuple(scenario_keys), tuple(actions), frequencies, covered)
+
+
+def matrix_from_pack(pack: StrategyPack) -> ActionMatrix:
+    """Decode every cell of a strategy pack at once."""
+    np = require_numpy("strategy queries")
+    action_count = len(pack.actions)
+    # Mirrors ``strategy_pack._cell_struct``: count, then (action id, percent) slots, packed.
+    fields = [("count", "u1")]
+    for slot in range(action_count):
+        fields += [(f"action{slot}", "u1"), (f"percent{slot}", "<f8")]
+    cells = np.frombuffer(pack.cell_block(), dtype=np.dtype(fields)).reshape(len(pack.scenario_keys), HAND_CLASS_COUNT + 1)
+    action_ids = np.stack([cells[f"action{slot}"] for slot in range(action_count)], axis=-1)
+    percents = np.stack([cells[f"percent{slot}"] for slot in range(action_count)], axis=-1)
+    return _matrix_from_cells(np, pack.scenario_keys, pack.actions, cells["count"], action_ids, percents)
+
+
+def matrix_from_rows(scenario_keys: Iterable[str], rows: Iterable[ScenarioRow]) -> ActionMatrix:
+    """Build the matrix from normalized scenario rows (``scenario_row``)."""
+    np = require_numpy("strategy queries")
+    rows = list(rows)
+    actions: list[str] = []
+    for row in rows:
+        for distribution in row:
+            for action, _ in distribution or ():
+                if action not in actions:
+                    actions.append(action)
+    slots = max(len(actions), 1)
+    counts = np.full((len(rows), HAND_CLASS_COUNT + 1), MISSING_CELL, dtype=np.uint8)
+    action_ids = np.zeros(counts.shape + (slots,), dtype=np.uint8)
+    percents = np.zeros(counts.shape + (slots,))
+    for scenario_id, row in enumerate(rows):
+        for cell_id, distribution in enumerate(row):
+            if distribution is None:
+                continue
+            counts[scenario_id, cell_id] = len(distribution)
+            for slot, (action, percent) in enumerate(distribution):
+                action_ids[scenario_id, cell_id, slot] = actions.index(action)
+                percents[scenario_id, cell_id, slot] = percent
+    return _matrix_from_cells(np, scenario_keys, actions, counts, action_ids, percents)
+
+
+def matrix_from_data(data: dict) -> ActionMatrix:
+    scenarios = data.get("scenarios", {})
+    return matrix_from_rows(scenarios, (scenario_row(scenario) for scenario in scenarios.values()))
+
+
+def load_action_matrix(path: str | Path | None = None) -> ActionMatrix:
+    """Matrix over a strategy pack or strategy JSON file (default: the shipped strategy)."""
+    path = Path(path) if path is not None else default_strategy_path()
+    if path is None:
+        raise FileNotFoundError("No strategy pack or strategy JSON found.")
+    if path.suffix == PACK_SUFFIX:
+        return matrix_from_pack(StrategyPack(path))
+    with path.open("r", encoding="utf-8") as data_file:
+        return matrix_from_data(json.load(data_file))
+
+
+@dataclass(frozen=True)
+class ActionFrequencies:
+    label: str
+    combos: float
+    frequencies: dict[str, float]
+
+
+def _frequencies(matrix: ActionMatrix, label: str, combos: float, totals) -> ActionFrequencies:
+    shares = totals / combos if combos > 0 else totals * 0
+    ordered = sorted(zip(matrix.actions, shares.tolist()), key=lambda item: item[1], reverse=True)
+    return ActionFrequencies(label=label, combos=combos, frequencies={action: share for action, share in ordered if share > 0})
+
+
+def _weighted_totals(matrix: ActionMatrix, pattern: str, hands: Mapping[str, float] | None):
+    np = require_numpy("strategy queries")
+    scenario_ids = matrix.scenario_ids(pattern)
+    weights = matrix.covered[scenario_ids] * matrix.hand_weights(hands)
+    return scenario_ids, weights.sum(axis=1), np.einsum("sh,sha->sa", weights, matrix.frequencies[scenario_ids])
+
+
+def scenario_frequencies(
+    matrix: ActionMatrix,
+    pattern: str = "*",
+    hands: Mapping[str, float] | None = None,
+) -> list[ActionFrequencies]:
+    """Combo-weighted action frequencies of every scenario matching ``pattern``."""
+    scenario_ids, combos, totals = _weighted_totals(matrix, pattern, hands)
+    return [
+        _frequencies(matrix, matrix.scenario_keys[scenario_id], float(scenario_combos), scenario_totals)
+        for scenario_id, scenario_combos, scenario_totals in zip(scenario_ids.tolist(), combos, totals)
+    ]
+
+
+def pooled_frequencies(
+    matrix: ActionMatrix,
+    pattern: str = "*",
+    hands: Mapping[str, float] | None = None,
+) -> ActionFrequencies:
+    """Action frequencies over the combos of all scenarios matching ``pattern`` together."""
+    _, combos, totals = _weighted_totals(matrix, pattern, hands)
+    return _frequencies(matrix, pattern, float(combos.sum()), totals.sum(axis=0))
+
+
+def mixed_hands(
+    matrix: ActionMatrix,
+    actions: Iterable[str],
+    pattern: str = "*",
+    min_frequency: float = 0.0,
+) -> dict[str, tuple[str, ...]]:
+    """Hand classes that take every one of ``actions`` more than ``min_frequency`` of the time, with the scenarios where they do."""
+    np = require_numpy("strategy queries")
+    scenario_ids = matrix.scenario_ids(pattern)
+    action_ids = matrix.action_ids(actions)
+    if not len(action_ids):
+        raise ValueError("Give at least one action.")
+    mixing = (matrix.frequencies[scenario_ids][:, :, action_ids] > min_frequency).all(axis=2) & matrix.covered[scenario_ids]
+    result: dict[str, tuple[str, ...]] = {}
+    for hand_id in np.flatnonzero(mixing.any(axis=0)).tolist():
+        result[HAND_CLASSES[hand_id]] = tuple(matrix.scenario_keys[scenario_id] for scenario_id in scenario_ids[mixing[:, hand_id]].tolist())
+    return result
+
+
+def format_frequencies(result: ActionFrequencies) -> str:
+    parts = [f"{share * 100:.1f}% {action}" for action, share in result.frequencies.items()]
+    combos = f"{result.combos:g} combos"
+    if not parts:
+        return f"{result.label}: {combos}, no data"
+    return f"{result.label}: {combos}, {', '.join(parts)}"
+
+
+def main(argv: list[str] | None = None, prog: str | None = None) -> None:
+    parser = argparse.ArgumentParser(prog=prog, description="Combo-weighted queries over the strategy data")
+    parser.add_argument("--strategy", default=None, help="Strategy pack or JSON (default: the shipped strategy)")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    freq = subcommands.add_parser("freq", help="Action frequencies per scenario and over all matching scenarios")
+    freq.add_argument("scenarios", nargs="?", default="*", help="Scenario key or glob (default: every scenario)")
+    freq.add_argument("--hands", default=None, help="Only these hand classes, as a range (example: AA, AKs, T9o:0.5)")
+    mixed = subcommands.add_parser("mixed", help="Hand classes that mix the given actions")
+    mixed.add_argument("--actions", required=True, help="Comma-separated actions (example: all-in,call)")
+    mixed.add_argument("--scenarios", default="*", help="Scenario key or glob (default: every scenario)")
+    mixed.add_argument("--min-frequency", type=float, default=0.0, help="Smallest share (0-1) that counts as taking an action")
+    args = parser.parse_args(argv)
+
+    try:
+        matrix = load_action_matrix(args.strategy)
+        if args.command == "freq":
+            hands = None if args.hands is None else parse_range(args.hands)
+            results = scenario_frequencies(matrix, args.scenarios, hands)
+            for result in results:
+                print(format_frequencies(result))
+            if len(results) > 1:
+                print(format_frequencies(pooled_frequencies(matrix, args.scenarios, hands)))
+        else:
+            actions = [action.strip() for action in args.actions.split(",") if action.strip()]
+            hands = mixed_hands(matrix, actions, args.scenarios, args.min_frequency)
+            if not hands:
+                print(f"No hand class mixes {' and '.join(actions)} in {args.scenarios}")
+            for hand_class, scenario_keys in hands.items():
+                print(f"{hand_class}: {', '.join(scenario_keys)}")
+    except (OSError, RuntimeError, ValueError) as error:
+        parser.exit(2, f"error: {error}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Registry of strategy packs keyed by game format and stack depth.
+
+Point it at a directory of ``.sdpack`` files. Only pack headers are read up
+front; a pack is mapped and indexed the first time a table needs it, and at
+most ``capacity`` indexes stay loaded (least recently used are dropped).
+Packs declare their parameters through top-level fields of the source JSON:
+``"format"`` (e.g. ``"5max-50a"``) and an optional ``"stack_depth"`` in big
+blinds.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from shortdeck_cli.evaluator import load_strategy_index, strategy_nodes, strategy_spots
+from shortdeck_cli.strategy_index import StrategyIndex
+from shortdeck_cli.strategy_pack import PACK_SUFFIX, StrategyPack, read_pack_metadata
+
+DEFAULT_REGISTRY_CAPACITY = 4
+
+PackKey = tuple[str, int | None]
+
+
+def _stack_depth(value) -> int | None:
+    try:
+        return None if value is None else int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class StrategyRegistry:
+    """Selects a strategy index per table from several packs."""
+
+    def __init__(
+        self,
+        pack_paths: Iterable[str | Path],
+        capacity: int = DEFAULT_REGISTRY_CAPACITY,
+        default: Callable[[], StrategyIndex] = load_strategy_index,
+    ):
+        if capacity < 1:
+            raise ValueError("Registry capacity must be at least 1.")
+        self.capacity = capacity
+        self._default = default
+        self._paths: dict[PackKey, Path] = {}
+        for path in pack_paths:
+            path = Path(path)
+            metadata = read_pack_metadata(path)
+            game_format = metadata.get("format")
+            if not isinstance(game_format, str):
+                raise ValueError(f"Strategy pack has no game format: {path}")
+            key = (game_format, _stack_depth(metadata.get("stack_depth")))
+            if key in self._paths:
+                raise ValueError(f"Duplicate strategy pack for {key[0]} at depth {key[1]}: {path}")
+            self._paths[key] = path
+        self._loaded: OrderedDict[PackKey, StrategyIndex] = OrderedDict()
+
+    @classmethod
+    def from_directory(cls, directory: str | Path, capacity: int = DEFAULT_REGISTRY_CAPACITY) -> "StrategyRegistry":
+        directory = Path(directory)
+        if not directory.is_dir():
+            raise ValueError(f"Strategy directory not found: {directory}")
+        return cls(sorted(directory.glob(f"*{PACK_SUFFIX}")), capacity=capacity)
+
+    def keys(self) -> list[PackKey]:
+        return list(self._paths)
+
+    def loaded_keys(self) -> list[PackKey]:
+        """Keys of the indexes currently in memory, least recently used first."""
+        return list(self._loaded)
+
+    def resolve(self, game_format: str | None, stack_depth: int | None = None) -> PackKey | None:
+        """Pick the pack key for a table: same format, closest stack depth."""
+        candidates = [key for key in self._paths if key[0] == game_format]
+        if not candidates:
+            return None
+
+        def distance(key: PackKey) -> float:
+            if key[1] == stack_depth:
+                return 0
+            if key[1] is None or stack_depth is None:
+                return float("inf")
+            return abs(key[1] - stack_depth)
+
+        return min(candidates, key=distance)
+
+    def select(self, game_format: str | None = None, stack_depth: int | None = None) -> StrategyIndex:
+        key = self.resolve(game_format, stack_depth)
+        if key is None:
+            return self._default()
+
+        index = self._loaded.get(key)
+        if index is not None:
+            self._loaded.move_to_end(key)
+            return index
+
+        index = StrategyPack(self._paths[key]).index(strategy_spots(), strategy_nodes)
+        self._loaded[key] = index
+        while len(self._loaded) > self.capacity:
+            self._loaded.popitem(last=False)
+        return index
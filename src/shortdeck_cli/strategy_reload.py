@@ -0,0 +1,81 @@
+"""Hot reload of a strategy pack or JSON file for long-running sessions.
+
+A daemon thread stats the file every ``interval`` seconds (mtime, size and
+inode). When it changes, a new index is built and fully resolved on that
+thread, then published with a single reference assignment, so readers
+always see either the old or the new revision — never a half-built one.
+Callers read ``current()`` once per observation. Builds that fail (e.g. a
+JSON file caught mid-save) keep the previous revision and are retried on the
+next change. Packs are read into memory rather than mapped, so rebuilding
+the watched pack also works on Windows, which cannot replace a mapped file.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+from shortdeck_cli.evaluator import load_strategy_file
+from shortdeck_cli.strategy_index import StrategyIndex
+
+DEFAULT_RELOAD_INTERVAL = 1.0
+
+
+def _file_signature(path: Path) -> tuple[int, int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class StrategyReloader:
+    """Serves the latest revision of a strategy file; revision 1 is the initial load."""
+
+    def __init__(self, path: str | Path, interval: float = DEFAULT_RELOAD_INTERVAL):
+        self.path = Path(path)
+        self.interval = interval
+        self.last_error: str | None = None
+        self._signature = _file_signature(self.path)
+        self._current: tuple[int, StrategyIndex] = (1, load_strategy_file(self.path, in_memory=True))
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def current(self) -> tuple[int, StrategyIndex]:
+        """Return ``(revision, index)`` of the newest successfully built index."""
+        return self._current
+
+    def check(self) -> bool:
+        """Rebuild if the file changed since the last check; ``True`` when a new revision was published."""
+        try:
+            signature = _file_signature(self.path)
+        except OSError:
+            return False
+        if signature == self._signature:
+            return False
+        self._signature = signature
+
+        try:
+            index = load_strategy_file(self.path, in_memory=True)
+            index.preload()
+        except (AttributeError, KeyError, OSError, TypeError, ValueError) as error:
+            self.last_error = str(error)
+            return False
+
+        self.last_error = None
+        self._current = (self._current[0] + 1, index)
+        return True
+
+    def start(self) -> "StrategyReloader":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._watch, name="strategy-reload", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
@@ -0,0 +1,46 @@
+"""Suit-isomorphism canonicalization for card spots.
+
+Poker evaluation does not depend on suit names, so AsKs on QsJhTd and AhKh on
+QhJsTc are the same spot. ``canonicalize`` relabels suits so that every member
+of an isomorphism class maps to one key, and returns the relabelling so
+results computed for the canonical spot can be translated back.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from itertools import permutations
+
+from shortdeck_cli.hand_evaluator import CARD_NAMES, CARD_TO_INDEX, SUITS
+
+_SUIT_PERMUTATIONS = tuple(dict(zip(SUITS, order)) for order in permutations(SUITS))
+
+
+def translate_card(card: str, suit_map: dict[str, str]) -> str:
+    return card[0] + suit_map[card[1]]
+
+
+def canonicalize(card_groups: Sequence[Sequence[str]]) -> tuple[tuple[tuple[str, ...], ...], dict[str, str]]:
+    """Return ``(canonical_groups, to_canonical)`` for groups of cards.
+
+    Each group is treated as an unordered set (e.g. hole cards, board), so the
+    canonical groups are sorted in deck order. ``to_canonical`` maps original
+    suits to canonical suits; invert it to translate results back.
+    """
+    best_key: tuple[tuple[int, ...], ...] | None = None
+    best_map: dict[str, str] = _SUIT_PERMUTATIONS[0]
+    for suit_map in _SUIT_PERMUTATIONS:
+        key = tuple(
+            tuple(sorted(CARD_TO_INDEX[translate_card(card, suit_map)] for card in group))
+            for group in card_groups
+        )
+        if best_key is None or key < best_key:
+            best_key = key
+            best_map = suit_map
+
+    canonical_groups = tuple(tuple(CARD_NAMES[index] for index in group) for group in best_key)
+    return canonical_groups, best_map
+
+
+def invert_suit_map(suit_map: dict[str, str]) -> dict[str, str]:
+    return {canonical: original for original, canonical in suit_map.items()}
@@ -0,0 +1,61 @@
+from shortdeck_cli.action_log import ActionLogTracker, LoggedAction, normalize_log_lines, parse_log_line
+from shortdeck_cli.pokerstars_capture import extract_observation_from_ocr_parts
+
+
+def test_normalize_and_parse_log_lines():
+    assert normalize_log_lines("  UTG   Limp\n\nMP1 all in  ") == ["utg limp", "mp1 all-in"]
+    assert parse_log_line("utg fold, mp1 all-in") == [LoggedAction("UTG", "fold"), LoggedAction("MP1", "all-in")]
+    assert parse_log_line("dealer: new hand") == []
+
+
+def test_tracker_parses_only_new_lines_of_a_scrolling_log():
+    tracker = ActionLogTracker()
+
+    assert tracker.update("AsAd", "UTG fold\nMP1 limp") == [LoggedAction("UTG", "fold"), LoggedAction("MP1", "limp")]
+    assert tracker.update("AsAd", "UTG fold\nMP1 limp") == []
+    # The oldest line scrolled off the top while a new one arrived.
+    assert tracker.update("AsAd", "MP1 limp\nMP2 all-in") == [LoggedAction("MP2", "all-in")]
+    # Fewer lines visible, nothing new.
+    assert tracker.update("AsAd", "MP2 all-in") == []
+    assert tracker.timeline == [LoggedAction("UTG", "fold"), LoggedAction("MP1", "limp"), LoggedAction("MP2", "all-in")]
+    assert tracker.villain_action("CO") == ("MP2", "all-in")
+    assert tracker.villain_action("MP2") == ("MP1", "limp")
+    assert tracker.villain_action("UTG") is None
+
+
+def test_tracker_keeps_a_new_line_that_repeats_an_earlier_one():
+    tracker = ActionLogTracker()
+    tracker.update("AsAd", "UTG limp\nMP1 all-in")
+
+    # The log scrolled past both lines and shows a fresh "UTG limp".
+    assert tracker.update("AsAd", "UTG limp") == [LoggedAction("UTG", "limp")]
+    assert tracker.timeline == [LoggedAction("UTG", "limp"), LoggedAction("MP1", "all-in"), LoggedAction("UTG", "limp")]
+
+
+def test_tracker_starts_a_new_timeline_for_a_new_hero_hand():
+    tracker = ActionLogTracker()
+    tracker.update("AsAd", "UTG all-in")
+
+    # A frame without a readable hand keeps the current hand.
+    tracker.update(None, "UTG all-in\nMP1 fold")
+    assert tracker.timeline == [LoggedAction("UTG", "all-in"), LoggedAction("MP1", "fold")]
+
+    assert tracker.update("KcQc", "MP1 fold\nUTG limp") == [LoggedAction("UTG", "limp")]
+    assert tracker.hero_hand == "KcQc"
+    assert tracker.timeline == [LoggedAction("UTG", "limp")]
+
+    tracker.reset()
+    assert tracker.update("KcQc", "MP1 fold\nUTG limp") == [LoggedAction("MP1", "fold"), LoggedAction("UTG", "limp")]
+
+
+def test_extract_with_tracker_does_not_reuse_stale_lines_from_the_previous_hand():
+    tracker = ActionLogTracker()
+    first = extract_observation_from_ocr_parts("As Ad", "UTG all-in", "CO", tracker=tracker)
+    second = extract_observation_from_ocr_parts("Kc Qc", "UTG all-in", "CO", tracker=tracker)
+    third = extract_observation_from_ocr_parts("Kc Qc", "UTG all-in\nUTG limp", "CO", tracker=tracker)
+
+    assert (first.villain_position, first.villain_action) == ("UTG", "all-in")
+    # Without the tracker the previous hand's all-in would be reported again.
+    assert (second.villain_position, second.villain_action) == (None, None)
+    assert extract_observation_from_ocr_parts("Kc Qc", "UTG all-in", "CO").villain_action == "all-in"
+    assert (third.villain_position, third.villain_action) == ("UTG", "limp")
@@ -0,0 +1,98 @@
+import json
+import os
+
+from shortdeck_cli.auto_ingest import JsonlObservationSource, parse_observation_line
+
+
+def _line(hero_hand, **fields):
+    return json.dumps({"hero_hand": hero_hand, "hero_position": "CO", **fields}) + "\n"
+
+
+def _drain(source):
+    hands = []
+    while (observation := source.next_observation()) is not None:
+        hands.append(observation.hero_hand)
+    return hands
+
+
+def test_parse_observation_line_coerces_optional_fields():
+    observation = parse_observation_line(json.dumps({"hero_hand": "AA", "hero_position": "CO", "confidence": "0.5", "stack_depth": "40"}))
+
+    assert observation.confidence == 0.5
+    assert observation.stack_depth == 40
+    assert parse_observation_line("not json") is None
+    assert parse_observation_line('{"hero_hand": "AA"}') is None
+
+
+def test_source_reads_only_appended_lines(tmp_path):
+    path = tmp_path / "obs.jsonl"
+    source = JsonlObservationSource(path)
+    assert source.next_observation() is None
+
+    path.write_text(_line("AA") + "garbage\n" + _line("KK"), encoding="utf-8")
+    assert _drain(source) == ["AA", "KK"]
+
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(_line("QQ"))
+    assert _drain(source) == ["QQ"]
+    source.close()
+
+
+def test_source_waits_for_partial_trailing_line(tmp_path):
+    path = tmp_path / "obs.jsonl"
+    line = _line("AKs")
+    path.write_text(line[:10], encoding="utf-8")
+    source = JsonlObservationSource(path)
+    assert source.next_observation() is None
+
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(line[10:].rstrip("\n"))
+    assert _drain(source) == ["AKs"]
+
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write("\n" + _line("JJ"))
+    assert _drain(source) == ["JJ"]
+    source.close()
+
+
+def test_source_restarts_after_truncation(tmp_path):
+    path = tmp_path / "obs.jsonl"
+    path.write_text(_line("AA") + _line("KK"), encoding="utf-8")
+    source = JsonlObservationSource(path)
+    assert _drain(source) == ["AA", "KK"]
+
+    path.write_text(_line("TT"), encoding="utf-8")
+    assert _drain(source) == ["TT"]
+    source.close()
+
+
+def test_source_drains_rotated_file_then_follows_new_one(tmp_path):
+    path = tmp_path / "obs.jsonl"
+    path.write_text(_line("AA"), encoding="utf-8")
+    source = JsonlObservationSource(path)
+    assert _drain(source) == ["AA"]
+
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(_line("KK"))
+    os.replace(path, tmp_path / "obs.jsonl.1")
+    path.write_text(_line("QQ") + _line("JJ") + _line("TT"), encoding="utf-8")
+
+    assert _drain(source) == ["KK", "QQ", "JJ", "TT"]
+    source.close()
+
+
+def test_source_wait_wakes_when_lines_are_appended(tmp_path):
+    path = tmp_path / "obs.jsonl"
+    path.write_text("", encoding="utf-8")
+    source = JsonlObservationSource(path)
+    assert source.wait(0) is True
+    assert source.next_observation() is None
+
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(_line("AA", observed_at=123.5))
+    assert source.wait(5.0) is True
+
+    observation = source.next_observation()
+    assert observation.hero_hand == "AA"
+    assert observation.observed_at == 123.5
+    source.close()
@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from shortdeck_cli import postflop
+from shortdeck_cli.batch_evaluator import evaluate_batch
+from shortdeck_cli.hand_evaluator import evaluate
+
+
+def test_evaluate_batch_matches_scalar_evaluator_for_seven_cards():
+    rng = random.Random(3)
+    hands = np.array([rng.sample(range(36), 7) for _ in range(3000)])
+
+    scores = evaluate_batch(hands[:, :2], hands[:, 2:])
+
+    assert scores.shape == (3000,)
+    assert scores.tolist() == [evaluate(hand) for hand in hands.tolist()]
+
+
+def test_evaluate_batch_broadcasts_single_hole_over_boards():
+    hole = [0, 1]
+    boards = np.array([[4, 8, 12], [20, 24, 28], [32, 33, 34]])
+
+    scores = evaluate_batch(hole, boards)
+
+    assert scores.tolist() == [evaluate(hole + board) for board in boards.tolist()]
+
+
+def test_evaluate_batch_rejects_oversized_hands():
+    with pytest.raises(ValueError):
+        evaluate_batch([0, 1], np.zeros((2, 6), dtype=int))
+
+
+def test_analyze_flop_batch_and_scalar_paths_agree(monkeypatch):
+    batched = postflop._analyze_flop_uncached(["9h", "8h"], ["Th", "Jc", "6h"])
+
+    monkeypatch.setattr(postflop, "batch_available", lambda: False)
+    scalar = postflop._analyze_flop_uncached(["9h", "8h"], ["Th", "Jc", "6h"])
+
+    assert batched == scalar
@@ -0,0 +1,58 @@
+import csv
+import io
+import json
+
+from shortdeck_cli.batch_mode import BatchConfig, read_chunks, run_batch, score_chunk
+from shortdeck_cli.evaluator import recommend_action
+from shortdeck_cli.strategy_pack import compile_strategy_pack
+
+OBSERVATIONS = [
+    {"hero_hand": "AsKd", "hero_position": "UTG"},
+    {"hero_hand": "QJo", "hero_position": "HJ", "villain_position": "UTG", "villain_action": "fold"},
+    {"hero_hand": "AA", "hero_position": "CO", "villain_position": "UTG", "villain_action": "limp"},
+    {"hero_hand": "AKo", "hero_position": "CO"},
+]
+
+
+def _input(extra_lines=()):
+    lines = [json.dumps(item) for item in OBSERVATIONS] + list(extra_lines)
+    return io.StringIO("\n".join(lines) + "\n")
+
+
+def test_score_chunk_matches_recommend_action_and_reports_errors():
+    records = score_chunk((1, [json.dumps(item) for item in OBSERVATIONS] + ["", "nope"]))
+
+    assert [record["line"] for record in records] == [1, 2, 3, 4, 6]
+    assert records[0]["strategy_hand"] == "AKo"
+    assert (records[0]["scenario_key"], records[0]["recommendation"]) == recommend_action("AKo", "UTG", "UTG", "fold")
+    assert records[2]["scenario_key"] == "vs_limp:CO_vs_UTG_limp"
+    assert "villain_position and villain_action are required" in records[3]["error"]
+    assert records[4]["error"] == "not a valid observation object"
+
+
+def test_read_chunks_numbers_lines_across_chunks():
+    assert list(read_chunks(["a", "b", "c"], chunk_size=2)) == [(1, ["a", "b"]), (3, ["c"])]
+
+
+def test_run_batch_streams_jsonl_in_chunks_and_with_a_process_pool():
+    serial = io.StringIO()
+    summary = run_batch(_input(["garbage"]), serial, chunk_size=2)
+    assert (summary.records, summary.errors) == (5, 2)
+
+    pooled = io.StringIO()
+    run_batch(_input(["garbage"]), pooled, chunk_size=1, workers=2)
+    assert pooled.getvalue() == serial.getvalue()
+    assert [json.loads(line)["line"] for line in serial.getvalue().splitlines()] == [1, 2, 3, 4, 5]
+
+
+def test_run_batch_writes_csv_against_a_given_chart(tmp_path):
+    chart = {"scenarios": {"open:UTG_rfi": {"hand_actions": {"AKo": "fold"}, "default_recommendation": "TBD"}}}
+    pack = compile_strategy_pack(chart, tmp_path / "chart.sdpack")
+    output = io.StringIO()
+
+    run_batch(_input(), output, output_format="csv", config=BatchConfig(strategy_path=str(pack)))
+
+    rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+    assert rows[0]["recommendation"] == "Data recommendation: fold (confidence: high)"
+    assert rows[0]["line"] == "1"
+    assert rows[3]["error"]
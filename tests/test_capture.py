@@ -0,0 +1,145 @@
+import json
+
+import pytest
+
+from shortdeck_cli.capture import FileCaptureBackend, FrameBuffers, RoiRect, roi_box, roi_union
+from shortdeck_cli.pokerstars_capture import PokerStarsWindowOcrSource
+
+Image = pytest.importorskip("PIL.Image")
+
+HAND_BOX = (10, 150, 110, 190)
+ACTION_BOX = (200, 20, 290, 120)
+TEXTS = {
+    (200, 0, 0): "As Ad",
+    (0, 150, 0): "Kc Qc",
+    (0, 0, 200): "UTG limp",
+    (200, 200, 200): "MP1 all-in",
+}
+
+
+def test_roi_union_covers_all_regions_and_rebases_them():
+    regions = {
+        "hero_hand": RoiRect(0.1, 0.5, 0.3, 0.6, normalized=True),
+        "action_log": RoiRect(50, 10, 70, 40, normalized=False),
+    }
+
+    bbox, relative = roi_union(regions, 200, 100)
+
+    assert roi_box(regions["hero_hand"], 200, 100) == (20, 50, 60, 60)
+    assert bbox == (20, 10, 70, 60)
+    assert relative["hero_hand"] == RoiRect(0, 40, 40, 50, normalized=False)
+    assert relative["action_log"] == RoiRect(30, 0, 50, 30, normalized=False)
+    assert roi_union({}, 200, 100) == ((0, 0, 200, 100), {})
+
+
+def test_frame_buffers_reuse_images_per_size():
+    buffers = FrameBuffers()
+
+    images = [buffers.next((4, 4)) for _ in range(6)]
+
+    assert buffers.allocated == 2
+    assert images[0] is images[2] is images[4]
+    assert images[0] is not images[1]
+    assert buffers.next((8, 4)) is not images[0]
+
+
+def _window(hand_color, action_color):
+    image = Image.new("RGB", (300, 200), (30, 80, 30))
+    image.paste(hand_color, HAND_BOX)
+    image.paste(action_color, ACTION_BOX)
+    return image
+
+
+def _source(tmp_path, frames, **kwargs):
+    paths = []
+    for index, frame in enumerate(frames):
+        path = tmp_path / f"window-{index}.png"
+        frame.save(path)
+        paths.append(path)
+    roi = tmp_path / "roi.json"
+    roi.write_text(
+        json.dumps({
+            "hero_hand": dict(zip(("left", "top", "right", "bottom"), HAND_BOX)),
+            "action_log": dict(zip(("left", "top", "right", "bottom"), ACTION_BOX)),
+        }),
+        encoding="utf-8",
+    )
+    backend = FileCaptureBackend(paths)
+
+    def image_to_string(crop, config=""):
+        return TEXTS[crop.getpixel((0, 0))]
+
+    source = PokerStarsWindowOcrSource(
+        hero_position="CO",
+        roi_config_path=str(roi),
+        capture_backend=backend,
+        image_to_string=image_to_string,
+        ocr_workers=1,
+        **kwargs,
+    )
+    return source, backend
+
+
+def test_source_grabs_only_the_roi_union_and_skips_unchanged_frames(tmp_path):
+    source, backend = _source(
+        tmp_path,
+        [
+            _window((200, 0, 0), (0, 0, 200)),
+            _window((200, 0, 0), (0, 0, 200)),
+            _window((0, 150, 0), (200, 200, 200)),
+        ],
+    )
+    try:
+        first = source.next_observation()
+        assert source.next_observation() is None
+        third = source.next_observation()
+        assert source.next_observation() is None
+    finally:
+        source.close()
+
+    assert (first.hero_hand, first.villain_position, first.villain_action) == ("AsAd", "UTG", "limp")
+    assert (third.hero_hand, third.villain_position, third.villain_action) == ("KcQc", "MP1", "all-in")
+    assert set(backend.grabs) == {(10, 20, 290, 190)}
+    assert backend.buffers.allocated == 2
+
+
+def test_source_saves_full_window_only_for_sampled_frames(tmp_path):
+    debug_dir = tmp_path / "debug"
+    source, backend = _source(
+        tmp_path,
+        [
+            _window((200, 0, 0), (0, 0, 200)),
+            _window((0, 150, 0), (0, 0, 200)),
+            _window((200, 0, 0), (200, 200, 200)),
+        ],
+        debug_dir=str(debug_dir),
+        debug_sample_every=2,
+    )
+    try:
+        observations = [source.next_observation() for _ in range(3)]
+    finally:
+        source.close()
+
+    assert [observation.hero_hand for observation in observations] == ["AsAd", "KcQc", "AsAd"]
+    assert backend.grabs == [(10, 20, 290, 190), (0, 0, 300, 200), (10, 20, 290, 190)]
+    assert sorted(path.name for path in debug_dir.glob("*.png")) == ["000001.png"]
+    assert Image.open(debug_dir / "000001.png").size == (300, 200)
+    assert (debug_dir / "000002.hand.txt").read_text(encoding="utf-8") == "As Ad"
+
+
+def test_idle_polls_grab_once_and_keep_a_due_sample_until_the_table_changes(tmp_path):
+    debug_dir = tmp_path / "debug"
+    frames = [_window((200, 0, 0), (0, 0, 200)) for _ in range(3)] + [_window((0, 150, 0), (0, 0, 200))]
+    source, backend = _source(tmp_path, frames, debug_dir=str(debug_dir), debug_sample_every=2)
+    try:
+        assert source.next_observation() is not None
+        assert [source.next_observation() for _ in range(2)] == [None, None]
+        assert source.next_observation().hero_hand == "KcQc"
+    finally:
+        source.close()
+
+    # One grab per poll: nothing is prefetched after a poll that produced no observation.
+    # The second saved frame is sampled, so the idle polls grab the whole window until it arrives.
+    assert backend.grabs == [(10, 20, 290, 190), (0, 0, 300, 200), (0, 0, 300, 200), (0, 0, 300, 200)]
+    assert sorted(path.name for path in debug_dir.glob("*.png")) == ["000001.png"]
+    assert (debug_dir / "000001.hand.txt").read_text(encoding="utf-8") == "Kc Qc"
\ No newline at end of file
@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+from shortdeck_cli.card_templates import calibrate_card_templates, load_card_templates
+from shortdeck_cli.ocr_replay import main
+from shortdeck_cli.pokerstars_capture import FrameOcr, RoiRect
+
+Image = pytest.importorskip("PIL.Image")
+ImageDraw = pytest.importorskip("PIL.ImageDraw")
+
+SUIT_COLORS = {"s": (0, 0, 0), "h": (200, 0, 0), "d": (0, 0, 200), "c": (0, 150, 0)}
+
+
+def _draw_suit(draw, suit, left, top):
+    color = SUIT_COLORS[suit]
+    if suit == "s":
+        draw.polygon([(left + 10, top + 3), (left + 3, top + 16), (left + 17, top + 16)], fill=color)
+    elif suit == "h":
+        draw.ellipse((left + 3, top + 3, left + 17, top + 17), fill=color)
+    elif suit == "d":
+        draw.polygon([(left + 10, top + 2), (left + 17, top + 10), (left + 10, top + 18), (left + 3, top + 10)], fill=color)
+    else:
+        draw.rectangle((left + 4, top + 4, left + 16, top + 16), fill=color)
+
+
+def _hand_crop(hand, shade=255):
+    # Two 40x40 cards: rank glyph top-left, suit symbol below it.
+    image = Image.new("RGB", (80, 40), (shade, shade, shade))
+    draw = ImageDraw.Draw(image)
+    for slot, card in enumerate((hand[:2], hand[2:])):
+        left = slot * 40
+        draw.text((left + 6, 4), card[0], fill=SUIT_COLORS[card[1]])
+        _draw_suit(draw, card[1], left, 20)
+    return image
+
+
+CALIBRATION = ["AsKh", "QdJc", "Ts9h", "8d7c", "6sAh", "KdQc", "Js6h", "9d8c", "7sTd"]
+
+
+def test_calibrated_templates_recognize_unseen_hands():
+    templates = calibrate_card_templates((_hand_crop(hand), hand) for hand in CALIBRATION)
+
+    assert set(templates.ranks) == set("AKQJT9876")
+    assert set(templates.suits) == set("shdc")
+    for hand in ("AdKs", "9c9s", "QhTs", "7d6c"):
+        assert templates.recognize(_hand_crop(hand, shade=230)) == hand
+
+
+def test_templates_reject_blank_crops_and_round_trip_through_json(tmp_path):
+    templates = calibrate_card_templates((_hand_crop(hand), hand) for hand in CALIBRATION)
+    path = templates.save(tmp_path / "cards.json")
+    loaded = load_card_templates(path)
+
+    assert loaded.recognize(_hand_crop("JcJd")) == "JcJd"
+    assert loaded(Image.new("RGB", (80, 40), (255, 255, 255))) == ""
+
+
+def test_calibration_rejects_shorthand_labels():
+    with pytest.raises(ValueError, match="explicit cards"):
+        calibrate_card_templates([(_hand_crop("AsKh"), "AKo")])
+
+
+def test_frame_ocr_reads_hero_cards_with_templates():
+    templates = calibrate_card_templates((_hand_crop(hand), hand) for hand in CALIBRATION)
+    frame = Image.new("RGB", (200, 40), (255, 255, 255))
+    frame.paste(_hand_crop("KsKd"), (0, 0))
+    regions = {
+        "hero_hand": RoiRect(0, 0, 80, 40, normalized=False),
+        "action_log": RoiRect(100, 0, 200, 40, normalized=False),
+    }
+
+    reader = FrameOcr(lambda crop, config="": "UTG limp", regions, hand_reader=templates)
+
+    assert reader.read(frame).hand_text == "KsKd"
+
+
+def test_calibrate_cards_command_uses_labeled_debug_frames(tmp_path, capsys):
+    frames = tmp_path / "frames"
+    frames.mkdir()
+    labels = []
+    for index, hand in enumerate(CALIBRATION):
+        frame = Image.new("RGB", (120, 60), (40, 90, 40))
+        frame.paste(_hand_crop(hand), (20, 10))
+        frame.save(frames / f"{index:06d}.png")
+        labels.append(json.dumps({"frame": f"{index:06d}", "hero_hand": hand}))
+    (tmp_path / "labels.jsonl").write_text("\n".join(labels) + "\n", encoding="utf-8")
+    roi = tmp_path / "roi.json"
+    roi.write_text(json.dumps({"hero_hand": {"left": 20, "top": 10, "right": 100, "bottom": 50}}), encoding="utf-8")
+    output = tmp_path / "cards.json"
+
+    main([
+        "calibrate-cards",
+        "--frames",
+        str(frames),
+        "--labels",
+        str(tmp_path / "labels.jsonl"),
+        "--roi-config",
+        str(roi),
+        "--output",
+        str(output),
+    ])
+
+    assert f"Wrote card templates: {output} (9 frames)" in capsys.readouterr().out
+    assert load_card_templates(output).recognize(_hand_crop("AcAd")) == "AcAd"
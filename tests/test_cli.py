@@ -1,6 +1,9 @@
 import json
 
+import pytest
+
 from shortdeck_cli.cli import main
+from shortdeck_cli.strategy_pack import compile_strategy_pack
 from shortdeck_cli.cli import cli_main
 
 
@@ -86,3 +89,304 @@ def test_cli_auto_mode_utg_observation_does_not_require_villain_fields(tmp_path,
     assert "Hero: KQs @ UTG" in output
     assert "Villain: N/A (UTG open spot)" in output
     assert "Scenario key: open:UTG_rfi" in output
+
+
+def test_cli_equity_mode_reports_standard_error(capsys):
+    cli_main(
+        [
+            "--equity",
+            "AsAd",
+            "--equity-range",
+            "KK",
+            "--equity-tolerance",
+            "0.02",
+            "--equity-max-trials",
+            "20000",
+            "--workers",
+            "1",
+        ]
+    )
+
+    output = capsys.readouterr().out
+    assert "--- Equity ---" in output
+    assert "Hero: As Ad (preflop)" in output
+    assert "standard error" in output
+
+
+def test_cli_equity_mode_enumerates_river_board(capsys):
+    cli_main(["--equity", "AsAd", "--equity-range", "KK", "--equity-board", "Ah7c8dTh6s"])
+
+    output = capsys.readouterr().out
+    assert "Equity: 100% (win 100%, tie 0%)" in output
+    assert "Exact enumeration over 6 runouts." in output
+
+
+def test_cli_all_in_spot_prints_equity_vs_shove_range(monkeypatch, capsys):
+    user_inputs = iter(["AKs", "6", "1", "3"])
+    monkeypatch.setattr("builtins.input", lambda _: next(user_inputs))
+
+    main()
+
+    output = capsys.readouterr().out
+    assert "Scenario key: vs_all_in:BTN_vs_UTG_all_in" in output
+    assert "Equity vs UTG all-in range:" in output
+
+
+def test_cli_auto_mode_selects_strategy_pack_per_observation(tmp_path, capsys):
+    data = {
+        "format": "6max-100a",
+        "stack_depth": 60,
+        "scenarios": {
+            "open:UTG_rfi": {"label": "UTG RFI", "hand_actions": {"KQs": "fold"}, "default_recommendation": "TBD"},
+        },
+    }
+    packs = tmp_path / "packs"
+    compile_strategy_pack(data, packs / "6max.sdpack")
+    source_file = tmp_path / "obs.jsonl"
+    observations = [
+        {"hero_hand": "KQs", "hero_position": "UTG", "game_format": "6max-100a", "stack_depth": 60},
+        {"hero_hand": "KQs", "hero_position": "UTG", "game_format": "5max-50a"},
+    ]
+    source_file.write_text("".join(json.dumps(item) + "\n" for item in observations), encoding="utf-8")
+
+    cli_main([
+        "--auto",
+        "--auto-source-jsonl",
+        str(source_file),
+        "--auto-max-hands",
+        "2",
+        "--auto-poll-seconds",
+        "0",
+        "--strategy-dir",
+        str(packs),
+    ])
+
+    output = capsys.readouterr().out
+    assert "Data recommendation: fold (confidence: high)" in output
+
+
+
+def test_cli_auto_mode_logs_strategy_revision_when_reloading(tmp_path, capsys):
+    chart = tmp_path / "chart.json"
+    chart.write_text(
+        json.dumps({"scenarios": {"open:UTG_rfi": {"hand_actions": {"KQs": "fold"}, "default_recommendation": "TBD"}}}),
+        encoding="utf-8",
+    )
+    source_file = tmp_path / "obs.jsonl"
+    source_file.write_text(json.dumps({"hero_hand": "KQs", "hero_position": "UTG"}) + "\n", encoding="utf-8")
+
+    cli_main([
+        "--auto",
+        "--auto-source-jsonl",
+        str(source_file),
+        "--auto-max-hands",
+        "1",
+        "--auto-poll-seconds",
+        "0",
+        "--strategy-reload",
+        str(chart),
+    ])
+
+    output = capsys.readouterr().out
+    assert "Strategy revision: 1" in output
+    assert "Data recommendation: fold (confidence: high)" in output
+
+
+def test_cli_strategy_reload_watches_the_strategy_json_by_default(tmp_path, monkeypatch, capsys):
+    chart = tmp_path / "preflop_scenarios.json"
+    chart.write_text(
+        json.dumps({"scenarios": {"open:UTG_rfi": {"hand_actions": {"KQs": "fold"}, "default_recommendation": "TBD"}}}),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr("shortdeck_cli.cli.strategy_source_path", lambda: chart)
+    source_file = tmp_path / "obs.jsonl"
+    source_file.write_text(json.dumps({"hero_hand": "KQs", "hero_position": "UTG"}) + "\n", encoding="utf-8")
+
+    cli_main(["--auto", "--auto-source-jsonl", str(source_file), "--auto-max-hands", "1", "--auto-poll-seconds", "0", "--strategy-reload"])
+
+    output = capsys.readouterr().out
+    assert f"Reloading the strategy when this file changes: {chart}" in output
+    assert "Data recommendation: fold (confidence: high)" in output
+
+
+def test_cli_auto_mode_omits_revision_when_a_registry_chart_served(tmp_path, capsys):
+    data = {"format": "6max-100a", "scenarios": {"open:UTG_rfi": {"hand_actions": {"KQs": "all-in"}, "default_recommendation": "TBD"}}}
+    compile_strategy_pack(data, tmp_path / "packs" / "6max.sdpack")
+    chart = tmp_path / "chart.json"
+    chart.write_text(
+        json.dumps({"scenarios": {"open:UTG_rfi": {"hand_actions": {"KQs": "fold"}, "default_recommendation": "TBD"}}}),
+        encoding="utf-8",
+    )
+    source_file = tmp_path / "obs.jsonl"
+    source_file.write_text(
+        json.dumps({"hero_hand": "KQs", "hero_position": "UTG", "game_format": "6max-100a"}) + "\n", encoding="utf-8"
+    )
+
+    cli_main([
+        "--auto",
+        "--auto-source-jsonl",
+        str(source_file),
+        "--auto-max-hands",
+        "1",
+        "--auto-poll-seconds",
+        "0",
+        "--strategy-dir",
+        str(tmp_path / "packs"),
+        "--strategy-reload",
+        str(chart),
+    ])
+
+    output = capsys.readouterr().out
+    assert "Data recommendation: all-in (confidence: high)" in output
+    assert "Strategy revision" not in output
+
+
+def test_cli_auto_mode_reports_latency(tmp_path, capsys):
+    source_file = tmp_path / "obs.jsonl"
+    source_file.write_text(json.dumps({"hero_hand": "KQs", "hero_position": "UTG"}) + "\n", encoding="utf-8")
+
+    cli_main([
+        "--auto",
+        "--auto-source-jsonl",
+        str(source_file),
+        "--auto-max-hands",
+        "1",
+        "--auto-poll-seconds",
+        "0",
+        "--auto-latency",
+    ])
+
+    output = capsys.readouterr().out
+    assert "Latency: " in output
+    assert "Latency over 1 observations: p50" in output
+
+
+def test_cli_auto_mode_multiplexes_tables_and_tags_output(tmp_path, capsys):
+    first = tmp_path / "t1.jsonl"
+    second = tmp_path / "t2.jsonl"
+    first.write_text(json.dumps({"hero_hand": "KQs", "hero_position": "UTG"}) + "\n", encoding="utf-8")
+    second.write_text(
+        json.dumps({"hero_hand": "AsAd", "hero_position": "CO", "villain_position": "UTG", "villain_action": "limp"}) + "\n",
+        encoding="utf-8",
+    )
+
+    cli_main([
+        "--auto",
+        "--auto-table",
+        f"t1={first}",
+        "--auto-table",
+        f"t2={second}",
+        "--auto-max-hands",
+        "2",
+        "--auto-poll-seconds",
+        "0.01",
+    ])
+
+    output = capsys.readouterr().out
+    assert "Following 2 tables: t1, t2" in output
+    assert "[t1] Hero: KQs @ UTG" in output
+    assert "[t2] Hero: AsAd @ CO" in output
+    assert "[t2] Scenario key: vs_limp:CO_vs_UTG_limp" in output
+    assert "Auto mode finished." in output
+
+
+def test_cli_auto_table_accepts_per_table_source_specs(tmp_path, monkeypatch, capsys):
+    jsonl_table = tmp_path / "t1.jsonl"
+    jsonl_table.write_text(json.dumps({"hero_hand": "KQs", "hero_position": "UTG"}) + "\n", encoding="utf-8")
+    frames = tmp_path / "frames"
+    frames.mkdir()
+    (frames / "000000.png").write_bytes(b"")
+    (frames / "000000.hand.txt").write_text("Hole cards: As Ad", encoding="utf-8")
+    (frames / "000000.action.txt").write_text("UTG limp", encoding="utf-8")
+    windows = []
+
+    class _Window:
+        def __init__(self, **kwargs):
+            windows.append(kwargs)
+
+        def next_observation(self):
+            return None
+
+    monkeypatch.setattr("shortdeck_cli.cli.PokerStarsWindowOcrSource", _Window)
+
+    cli_main([
+        "--auto",
+        "--auto-table",
+        f"t1=jsonl:{jsonl_table}",
+        "--auto-table",
+        f"t2=replay:CO:{frames}",
+        "--auto-table",
+        "t3=pokerstars:BTN:Table 3 - No Limit",
+        "--auto-debug-dir",
+        str(tmp_path / "debug"),
+        "--auto-max-hands",
+        "2",
+        "--auto-poll-seconds",
+        "0.01",
+    ])
+
+    output = capsys.readouterr().out
+    assert "[t1] Hero: KQs @ UTG" in output
+    assert "[t2] Scenario key: vs_limp:CO_vs_UTG_limp" in output
+    assert [(window["hero_position"], window["window_title_contains"]) for window in windows] == [("BTN", "Table 3 - No Limit")]
+    assert windows[0]["debug_dir"] == str(tmp_path / "debug" / "t3")
+
+
+def test_cli_auto_table_rejects_incomplete_ocr_spec(capsys):
+    with pytest.raises(SystemExit):
+        cli_main(["--auto", "--auto-table", "t1=pokerstars:BTN"])
+
+    assert "--auto-table expects pokerstars:POSITION:WINDOW_TITLE" in capsys.readouterr().err
+
+
+def test_cli_batch_mode_writes_csv_results(tmp_path, capsys):
+    source_file = tmp_path / "archive.jsonl"
+    source_file.write_text(
+        json.dumps({"hero_hand": "QJo", "hero_position": "HJ", "villain_position": "UTG", "villain_action": "fold"}) + "\n",
+        encoding="utf-8",
+    )
+    output_file = tmp_path / "scored.csv"
+
+    cli_main(["--batch", str(source_file), "--batch-output", str(output_file)])
+
+    lines = output_file.read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("line,hero_hand,")
+    assert "Data recommendation: 61.8% call, 38.2% all-in (confidence: medium)" in lines[1]
+    assert "Scored 1 observations (0 skipped)." in capsys.readouterr().err
+
+
+def test_cli_query_mode_runs_strategy_queries(capsys):
+    pytest.importorskip("numpy")
+
+    cli_main(["--query", "freq", "vs_limp:CO_vs_HJ_limp", "--hands", "AA"])
+
+    assert capsys.readouterr().out.startswith("vs_limp:CO_vs_HJ_limp: 6 combos, ")
+
+
+def test_cli_serve_rejects_bad_address(capsys):
+    with pytest.raises(SystemExit):
+        cli_main(["--serve", "localhost"])
+
+    assert "Serve address must be HOST:PORT or unix:PATH" in capsys.readouterr().err
+
+
+def test_cli_auto_mode_replays_saved_debug_frames(tmp_path, capsys):
+    (tmp_path / "000000.png").write_bytes(b"")
+    (tmp_path / "000000.hand.txt").write_text("Hole cards: As Ad", encoding="utf-8")
+    (tmp_path / "000000.action.txt").write_text("UTG limp", encoding="utf-8")
+
+    cli_main([
+        "--auto",
+        "--auto-source",
+        "replay",
+        "--auto-replay-dir",
+        str(tmp_path),
+        "--auto-hero-position",
+        "CO",
+        "--auto-max-hands",
+        "1",
+    ])
+
+    output = capsys.readouterr().out
+    assert "Hero: AsAd @ CO" in output
+    assert "Scenario key: vs_limp:CO_vs_UTG_limp" in output
@@ -0,0 +1,70 @@
+import pytest
+
+from shortdeck_cli.equity import equity_vs_range, hand_class_combos, parse_range, range_from_scenario
+
+
+def test_hand_class_combos_counts():
+    assert len(hand_class_combos("AA")) == 6
+    assert len(hand_class_combos("AKs")) == 4
+    assert len(hand_class_combos("T9o")) == 12
+
+
+def test_parse_range_reads_weights_and_percentages():
+    assert parse_range("AA, aks:0.5 T9o:25%") == {"AA": 1.0, "AKs": 0.5, "T9o": 0.25}
+
+
+def test_parse_range_always_scales_percent_weights():
+    assert parse_range("AA:1%, KK:0.5%, QQ:100%") == {"AA": 0.01, "KK": 0.005, "QQ": 1.0}
+
+
+def test_parse_range_rejects_bare_weights_above_one():
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        parse_range("AA:1.5")
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        parse_range("AA:50")
+
+
+def test_parse_range_rejects_unknown_class():
+    with pytest.raises(ValueError):
+        parse_range("A5s")
+
+
+def test_range_from_scenario_uses_action_weights():
+    villain_range = range_from_scenario("open:UTG_rfi", actions=("all-in",))
+    assert villain_range["AKo"] == pytest.approx(0.994)
+    assert "AA" not in villain_range
+
+
+def test_river_equity_against_single_combo_is_exact_win():
+    result = equity_vs_range(["As", "Ad"], parse_range("KK"), ["Ah", "7c", "8d", "Th", "6s"])
+    assert result.exact is True
+    assert result.equity == 1.0
+    assert result.samples == 6
+
+
+def test_turn_equity_splits_chopped_runouts():
+    result = equity_vs_range(["Ks", "Qd"], parse_range("KQo"), ["Ah", "Jc", "Td", "7s"])
+    assert result.exact is True
+    assert result.tie == pytest.approx(1.0)
+    assert result.equity == pytest.approx(0.5)
+
+
+def test_card_removal_drops_blocked_combos():
+    with pytest.raises(ValueError, match="no combos left"):
+        equity_vs_range(["As", "Ad"], parse_range("AA"), ["Ah", "Ac", "7d"])
+
+
+def test_preflop_monte_carlo_is_reproducible_with_seed():
+    first = equity_vs_range(["As", "Ad"], parse_range("KK"), trials=2000, seed=7)
+    second = equity_vs_range(["As", "Ad"], parse_range("KK"), trials=2000, seed=7)
+    assert first == second
+    assert first.exact is False
+    assert 0.65 < first.equity < 0.85
+
+
+def test_flop_sampling_converges_to_exact_enumeration():
+    villain_range = parse_range("KK, QJs, T9s")
+    exact = equity_vs_range(["As", "Ks"], villain_range, ["Qs", "Jh", "6d"])
+    sampled = equity_vs_range(["As", "Ks"], villain_range, ["Qs", "Jh", "6d"], trials=4000, seed=1)
+    assert exact.exact is True
+    assert sampled.equity == pytest.approx(exact.equity, abs=0.03)
@@ -0,0 +1,42 @@
+import pytest
+
+from shortdeck_cli.equity import parse_range
+from shortdeck_cli.equity_runner import batch_seed, run_monte_carlo_equity
+
+
+def test_batch_seed_is_stable_and_distinct_per_batch():
+    assert batch_seed(0, 0) == batch_seed(0, 0)
+    assert batch_seed(0, 0) != batch_seed(0, 1)
+    assert batch_seed(0, 1) != batch_seed(1, 1)
+
+
+def test_runner_stops_once_standard_error_is_below_tolerance():
+    result = run_monte_carlo_equity(
+        ["As", "Ad"],
+        parse_range("KK"),
+        batch_trials=500,
+        max_trials=50000,
+        tolerance=0.01,
+    )
+    assert result.exact is False
+    assert result.std_error <= 0.01
+    assert result.samples < 50000
+    assert result.samples % 500 == 0
+
+
+def test_runner_respects_max_trials():
+    result = run_monte_carlo_equity(["As", "Ad"], parse_range("KK"), batch_trials=300, max_trials=600, tolerance=1e-9)
+    assert result.samples == 600
+    assert result.std_error > 0
+
+
+def test_runner_result_does_not_depend_on_worker_count():
+    kwargs = {"batch_trials": 400, "max_trials": 2000, "tolerance": 0.012, "seed": 11}
+    single = run_monte_carlo_equity(["Ks", "Qs"], parse_range("AA, JTs"), workers=1, **kwargs)
+    pooled = run_monte_carlo_equity(["Ks", "Qs"], parse_range("AA, JTs"), workers=2, **kwargs)
+    assert pooled == single
+
+
+def test_runner_rejects_non_positive_tolerance():
+    with pytest.raises(ValueError):
+        run_monte_carlo_equity(["As", "Ad"], parse_range("KK"), tolerance=0)
@@ -1,4 +1,9 @@
-from shortdeck_cli.evaluator import build_scenario_key, recommend_action
+import json
+import os
+
+from shortdeck_cli import evaluator
+from shortdeck_cli.evaluator import build_scenario_key, index_from_data, recommend_action, recommend_line
+from shortdeck_cli.strategy_pack import compile_strategy_pack, source_digest, source_stamp
 
 
 def test_recommend_action_all_in_returns_fold():
@@ -56,7 +61,7 @@ def test_recommend_action_mixed_strategy_percentages(monkeypatch):
             }
         }
 
-    monkeypatch.setattr("shortdeck_cli.evaluator.load_strategy_data", fake_data)
+    monkeypatch.setattr("shortdeck_cli.evaluator.load_strategy_index", lambda: index_from_data(fake_data()))
     scenario_key, result = recommend_action("AQo", "UTG", "CO", "fold")
     assert scenario_key == "open:UTG_rfi"
     assert result == "Data recommendation: 60% all-in, 40% call (confidence: medium)"
@@ -76,7 +81,72 @@ def test_recommend_action_mixed_strategy_decimal_weights(monkeypatch):
             }
         }
 
-    monkeypatch.setattr("shortdeck_cli.evaluator.load_strategy_data", fake_data)
+    monkeypatch.setattr("shortdeck_cli.evaluator.load_strategy_index", lambda: index_from_data(fake_data()))
     scenario_key, result = recommend_action("AQo", "UTG", "CO", "fold")
     assert scenario_key == "open:UTG_rfi"
     assert result == "Data recommendation: 60% all-in, 40% call (confidence: medium)"
+
+
+def test_recommend_line_reads_single_villain_scenarios():
+    assert recommend_line("QJo", "HJ", []) == recommend_action("QJo", "HJ", "UTG", "fold")
+    assert recommend_line("AA", "CO", [("MP2", "limp")]) == recommend_action("AA", "CO", "MP2", "limp")
+
+
+def test_recommend_line_prefers_exact_sequence_scenarios():
+    data = {
+        "scenarios": {
+            "vs_limp:HJ_vs_MP_limp": {"default_recommendation": {"call": 1}},
+            "line:HJ_vs_MP2_limp": {"default_recommendation": {"raise": 1}},
+        }
+    }
+    index = index_from_data(data)
+
+    assert recommend_line("T9o", "HJ", [("MP2", "limp")], strategy=index) == (
+        "line:HJ_vs_MP2_limp",
+        "Data recommendation: raise (confidence: high)",
+    )
+    assert recommend_line("T9o", "HJ", [("MP1", "limp")], strategy=index) == (
+        "vs_limp:HJ_vs_MP_limp",
+        "Data recommendation: call (confidence: high)",
+    )
+
+
+def test_recommend_line_falls_back_for_multiway_spots():
+    scenario_key, result = recommend_line("AKs", "HJ", [("UTG", "limp"), ("HJ", "raise"), ("UTG", "all-in")])
+
+    assert scenario_key == "line:HJ_vs_UTG_limp-HJ_raise-UTG_all_in"
+    assert result == "Dummy recommendation: Fold"
+
+
+def test_default_strategy_path_skips_a_pack_older_than_its_json(tmp_path, monkeypatch, capsys):
+    data = {"scenarios": {"open:UTG_rfi": {"default_recommendation": "fold"}}}
+    source = tmp_path / evaluator.STRATEGY_JSON_NAME
+    source.write_text(json.dumps(data), encoding="utf-8")
+    pack = compile_strategy_pack(data, tmp_path / evaluator.STRATEGY_PACK_NAME, source_digest(source))
+    monkeypatch.setattr(evaluator, "_data_file_candidates", lambda file_name: [tmp_path / file_name])
+
+    # No stamp recorded: the digests decide.
+    assert evaluator.default_strategy_path() == pack
+
+    data["scenarios"]["open:UTG_rfi"]["default_recommendation"] = "all-in"
+    source.write_text(json.dumps(data), encoding="utf-8")
+    assert evaluator.default_strategy_path() == source
+    assert "Rebuild the pack" in capsys.readouterr().err
+
+
+def test_default_strategy_path_trusts_a_matching_source_stamp_without_reading_the_json(tmp_path, monkeypatch):
+    data = {"scenarios": {"open:UTG_rfi": {"default_recommendation": "fold"}}}
+    source = tmp_path / evaluator.STRATEGY_JSON_NAME
+    source.write_text(json.dumps(data), encoding="utf-8")
+    pack = compile_strategy_pack(data, tmp_path / evaluator.STRATEGY_PACK_NAME, source_digest(source), source_stamp(source))
+    monkeypatch.setattr(evaluator, "_data_file_candidates", lambda file_name: [tmp_path / file_name])
+    hashed = []
+    monkeypatch.setattr(evaluator, "source_digest", lambda path: hashed.append(path) or source_digest(path))
+
+    assert evaluator.default_strategy_path() == pack
+    assert hashed == []
+
+    # A checkout gives the same content a new modification time.
+    os.utime(source, ns=(0, 0))
+    assert evaluator.default_strategy_path() == pack
+    assert hashed == [source]
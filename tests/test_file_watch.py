@@ -0,0 +1,61 @@
+import sys
+import threading
+import time
+
+import pytest
+
+from shortdeck_cli.file_watch import InotifyWaiter, StatPollWaiter, file_waiter
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+
+
+def _append_later(path, text, delay=0.05):
+    def append():
+        time.sleep(delay)
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write(text)
+
+    thread = threading.Thread(target=append)
+    thread.start()
+    return thread
+
+
+@linux_only
+def test_inotify_waiter_wakes_on_append(tmp_path):
+    path = tmp_path / "obs.jsonl"
+    path.write_text("", encoding="utf-8")
+    waiter = InotifyWaiter(path)
+
+    started = time.monotonic()
+    writer = _append_later(path, "{}\n")
+    assert waiter.wait(5.0) is True
+    assert time.monotonic() - started < 1.0
+    writer.join()
+    waiter.close()
+
+
+@linux_only
+def test_inotify_waiter_ignores_other_files_and_times_out(tmp_path):
+    path = tmp_path / "obs.jsonl"
+    waiter = InotifyWaiter(path)
+
+    (tmp_path / "other.txt").write_text("noise", encoding="utf-8")
+    assert waiter.wait(0.1) is False
+
+    path.write_text("{}\n", encoding="utf-8")
+    assert waiter.wait(1.0) is True
+    waiter.close()
+
+
+def test_stat_poll_waiter_detects_changes(tmp_path):
+    path = tmp_path / "obs.jsonl"
+    waiter = StatPollWaiter(path, interval=0.01)
+    assert waiter.wait(0.05) is False
+
+    writer = _append_later(path, "{}\n")
+    assert waiter.wait(5.0) is True
+    writer.join()
+
+
+def test_file_waiter_falls_back_when_directory_is_missing(tmp_path):
+    assert isinstance(file_waiter(tmp_path / "missing" / "obs.jsonl"), StatPollWaiter)
@@ -0,0 +1,90 @@
+import pytest
+
+from shortdeck_cli.frame_diff import FrameDiffGate, region_thumbnail, thumbnails_differ
+from shortdeck_cli.pokerstars_capture import FrameOcr, RoiRect
+
+Image = pytest.importorskip("PIL.Image")
+ImageDraw = pytest.importorskip("PIL.ImageDraw")
+
+HAND_ROI = RoiRect(left=0.0, top=0.0, right=0.5, bottom=1.0, normalized=True)
+ACTION_ROI = RoiRect(left=0.5, top=0.0, right=1.0, bottom=1.0, normalized=True)
+
+
+def _frame(hand: str, action: str, noise: int = 0):
+    image = Image.new("RGB", (200, 40), (20 + noise, 90, 40))
+    draw = ImageDraw.Draw(image)
+    draw.text((5, 12), hand, fill=(255, 255, 255))
+    draw.text((105, 12), action, fill=(255, 255, 255))
+    return image
+
+
+def _saved_sequence(directory, frames):
+    # Same layout as --auto-debug-dir: zero-padded frame ids.
+    paths = []
+    for index, frame in enumerate(frames):
+        path = directory / f"{index:06d}.png"
+        frame.save(path)
+        paths.append(path)
+    return [Image.open(path) for path in paths]
+
+
+class CountingOcr:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, image, config=""):
+        self.calls.append((image.size, config))
+        return f"text-{len(self.calls)}"
+
+
+def test_thumbnails_ignore_small_noise_but_not_new_text():
+    base = region_thumbnail(_frame("As Ad", "UTG limp"))
+
+    assert not thumbnails_differ(base, region_thumbnail(_frame("As Ad", "UTG limp", noise=6)))
+    assert thumbnails_differ(base, region_thumbnail(_frame("As Kd", "UTG limp")))
+    assert thumbnails_differ(base, b"\0" * 3)
+
+
+def test_gate_reuses_text_until_region_changes():
+    gate = FrameDiffGate()
+    ocr = CountingOcr()
+
+    assert gate.read("hand", _frame("As Ad", ""), ocr) == ("text-1", True)
+    assert gate.read("hand", _frame("As Ad", "", noise=4), ocr) == ("text-1", False)
+    assert gate.read("hand", _frame("Ks Kd", ""), ocr) == ("text-2", True)
+    assert (gate.ocr_runs, gate.reused) == (2, 1)
+
+    gate.reset()
+    assert gate.read("hand", _frame("Ks Kd", ""), ocr) == ("text-3", True)
+
+
+def test_frame_ocr_only_reads_changed_regions_of_saved_frames(tmp_path):
+    frames = _saved_sequence(
+        tmp_path,
+        [
+            _frame("As Ad", "UTG limp"),
+            _frame("As Ad", "UTG limp", noise=3),
+            _frame("As Ad", "UTG limp"),
+            _frame("As Ad", "MP1 all-in"),
+            _frame("Kc Qc", "MP1 all-in"),
+        ],
+    )
+    ocr = CountingOcr()
+    reader = FrameOcr(ocr, {"hero_hand": HAND_ROI, "action_log": ACTION_ROI}, gate=FrameDiffGate())
+
+    changed = [reader.read(frame).changed for frame in frames]
+
+    assert changed == [True, False, False, True, True]
+    assert [config for _, config in ocr.calls] == ["--psm 7", "--psm 6", "--psm 6", "--psm 7"]
+
+
+def test_frame_ocr_without_rois_reads_the_window_once_per_change():
+    ocr = CountingOcr()
+    reader = FrameOcr(ocr, gate=FrameDiffGate())
+
+    first = reader.read(_frame("As Ad", "UTG limp"))
+    second = reader.read(_frame("As Ad", "UTG limp"))
+
+    assert (first.hand_text, first.action_text, first.changed) == ("text-1", "text-1", True)
+    assert (second.hand_text, second.action_text, second.changed) == ("text-1", "text-1", False)
+    assert len(ocr.calls) == 1
@@ -0,0 +1,58 @@
+import random
+from itertools import combinations
+
+import pytest
+
+from shortdeck_cli.hand_evaluator import (
+    CARD_NAMES,
+    card_index,
+    card_name,
+    evaluate_cards,
+    strength_category,
+    strength_from_tuple,
+)
+from shortdeck_cli.postflop import _evaluate_five, full_shortdeck_deck
+
+
+def _legacy_best(cards: list[str]) -> int:
+    return max(strength_from_tuple(_evaluate_five(list(combo))) for combo in combinations(cards, 5))
+
+
+def test_card_encoding_round_trips_full_deck():
+    assert list(CARD_NAMES) == full_shortdeck_deck()
+    for card in full_shortdeck_deck():
+        assert card_name(card_index(card)) == card
+
+
+def test_card_index_rejects_long_deck_cards():
+    with pytest.raises(ValueError):
+        card_index("5s")
+
+
+@pytest.mark.parametrize("hand_size", [5, 6, 7])
+def test_evaluate_cards_matches_legacy_combination_scoring(hand_size):
+    rng = random.Random(hand_size)
+    deck = full_shortdeck_deck()
+    for _ in range(400):
+        cards = rng.sample(deck, hand_size)
+        assert evaluate_cards(cards) == _legacy_best(cards)
+
+
+def test_flush_beats_full_house():
+    flush = evaluate_cards(["As", "Js", "9s", "7s", "6s"])
+    full_house = evaluate_cards(["Ah", "Ad", "Ac", "Kh", "Kd"])
+    assert strength_category(flush) == 6
+    assert strength_category(full_house) == 5
+    assert flush > full_house
+
+
+def test_wheel_straight_ranks_below_six_high_straight():
+    wheel = evaluate_cards(["Ah", "6d", "7c", "8s", "9h"])
+    six_high = evaluate_cards(["6h", "7d", "8c", "9s", "Th"])
+    assert strength_category(wheel) == 4
+    assert six_high > wheel
+
+
+def test_seven_cards_pick_straight_flush_over_plain_flush():
+    score = evaluate_cards(["As", "6s", "7s", "8s", "9s", "Ks", "Qh"])
+    assert strength_category(score) == 8
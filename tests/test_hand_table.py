@@ -0,0 +1,55 @@
+import random
+import struct
+from itertools import combinations
+
+import pytest
+
+from shortdeck_cli import hand_table
+from shortdeck_cli.hand_evaluator import evaluate_cards
+from shortdeck_cli.hand_table import HandRankTable, build_hand_table, colex_index
+from shortdeck_cli.postflop import best_hand_strength, full_shortdeck_deck
+
+
+@pytest.fixture(scope="module")
+def five_card_table_path(tmp_path_factory):
+    return build_hand_table(tmp_path_factory.mktemp("hand_table") / "hand_ranks.bin", hand_sizes=(5,))
+
+
+def test_colex_index_is_dense_and_ordered():
+    indexes = [colex_index(combo) for combo in combinations(range(8), 3)]
+    assert sorted(indexes) == list(range(len(indexes)))
+
+
+def test_table_lookup_matches_evaluator(five_card_table_path):
+    table = HandRankTable(five_card_table_path)
+    assert table.supports(5)
+    assert not table.supports(7)
+
+    rng = random.Random(5)
+    deck = full_shortdeck_deck()
+    for _ in range(2000):
+        cards = rng.sample(deck, 5)
+        assert table.score_indexes(deck.index(card) for card in cards) == evaluate_cards(cards)
+
+
+def test_table_with_other_rules_version_is_rejected(tmp_path, five_card_table_path):
+    stale_path = tmp_path / "stale.bin"
+    payload = bytearray(five_card_table_path.read_bytes())
+    struct.pack_into("<H", payload, 6, 999)
+    stale_path.write_bytes(bytes(payload))
+
+    with pytest.raises(ValueError, match="different rule set"):
+        HandRankTable(stale_path)
+
+
+def test_best_hand_strength_uses_table_when_configured(monkeypatch, five_card_table_path):
+    monkeypatch.setenv(hand_table.TABLE_PATH_ENV, str(five_card_table_path))
+    hand_table.load_hand_table.cache_clear()
+    try:
+        assert hand_table.load_hand_table() is not None
+        cards = ["As", "Ks", "Qs", "Js", "Ts"]
+        assert best_hand_strength(cards) == evaluate_cards(cards)
+        seven = cards + ["9h", "9d"]
+        assert best_hand_strength(seven) == evaluate_cards(seven)
+    finally:
+        hand_table.load_hand_table.cache_clear()
@@ -0,0 +1,109 @@
+import asyncio
+import time
+
+from shortdeck_cli.auto_ingest import Observation
+from shortdeck_cli.multi_source import MultiSourceEngine
+
+
+class _ListSource:
+    def __init__(self, hands, delay=0.0):
+        self._hands = list(hands)
+        self.delay = delay
+
+    def next_observation(self):
+        time.sleep(self.delay)
+        if not self._hands:
+            return None
+        return Observation(hero_hand=self._hands.pop(0), hero_position="UTG")
+
+
+class _EndlessSource:
+    def __init__(self):
+        self.reads = 0
+
+    def next_observation(self):
+        self.reads += 1
+        return Observation(hero_hand="AA", hero_position="UTG")
+
+
+def test_engine_tags_observations_and_does_not_wait_for_slow_sources():
+    handled = []
+
+    def handle(source_id, observation):
+        handled.append((source_id, observation.hero_hand, time.monotonic()))
+        return True
+
+    engine = MultiSourceEngine(
+        {"slow": _ListSource(["KK"], delay=0.5), "fast": _ListSource(["AA", "QQ"])},
+        handle=handle,
+        poll_seconds=0.01,
+        max_handled=3,
+    )
+    started = time.monotonic()
+    assert asyncio.run(engine.run()) == 3
+
+    assert [(source_id, hand) for source_id, hand, _ in handled] == [("fast", "AA"), ("fast", "QQ"), ("slow", "KK")]
+    assert handled[1][2] - started < 0.4
+
+
+def test_engine_applies_backpressure_per_source():
+    source = _EndlessSource()
+    engine = MultiSourceEngine({"table": source}, handle=lambda source_id, observation: True, poll_seconds=0.01, queue_size=2, max_handled=5)
+    asyncio.run(engine.run())
+
+    # Handled items plus at most a full queue and one pending put.
+    assert source.reads <= 5 + 2 + 2
+
+
+class _BlockingSource:
+    def __init__(self):
+        self.in_call = False
+
+    def next_observation(self):
+        self.in_call = True
+        time.sleep(0.3)
+        self.in_call = False
+        return None
+
+
+def test_engine_returns_only_after_source_calls_finished():
+    blocking = _BlockingSource()
+    engine = MultiSourceEngine(
+        {"blocking": blocking, "table": _ListSource(["AA"], delay=0.05)},
+        handle=lambda source_id, observation: True,
+        poll_seconds=0.01,
+        max_handled=1,
+    )
+    asyncio.run(engine.run())
+
+    # The caller may close the sources right away.
+    assert not blocking.in_call
+
+
+class _FailingSource:
+    def __init__(self, failures):
+        self.failures = failures
+
+    def next_observation(self):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("window closed")
+        return Observation(hero_hand="KK", hero_position="UTG")
+
+
+def test_engine_keeps_other_tables_running_when_a_source_fails():
+    handled = []
+    errors = []
+    engine = MultiSourceEngine(
+        {"broken": _FailingSource(failures=1), "table": _ListSource(["AA", "QQ"])},
+        handle=lambda source_id, observation: handled.append((source_id, observation.hero_hand)) or True,
+        poll_seconds=0.01,
+        max_handled=3,
+        on_error=lambda source_id, error, retry_seconds: errors.append((source_id, str(error), retry_seconds)),
+    )
+    asyncio.run(engine.run())
+
+    assert ("table", "AA") in handled and ("table", "QQ") in handled
+    # The failed source was retried after a delay and recovered.
+    assert ("broken", "KK") in handled
+    assert errors == [("broken", "window closed", 0.1)]
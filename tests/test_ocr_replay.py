@@ -0,0 +1,177 @@
+import json
+import threading
+import time
+
+import pytest
+
+from shortdeck_cli.ocr_replay import (
+    DebugFrameReplaySource,
+    format_benchmark_report,
+    load_debug_frames,
+    load_labels,
+    main,
+    run_ocr_benchmark,
+)
+from shortdeck_cli.pokerstars_capture import FrameOcr, FramePrefetcher, RoiRect
+
+RECORDED = [
+    ("Hole cards: As Ad", "UTG limp"),
+    ("Hole cards: Kc Qc", "MP1 all-in"),
+    ("nothing readable", ""),
+    ("Hole cards: 9s 9h", "UTG fold MP1 llmp"),
+]
+
+
+def _debug_dir(tmp_path, recorded=RECORDED):
+    # Same layout PokerStarsWindowOcrSource writes to --auto-debug-dir.
+    for index, (hand_text, action_text) in enumerate(recorded):
+        frame_id = f"{index:06d}"
+        (tmp_path / f"{frame_id}.png").write_bytes(b"")
+        (tmp_path / f"{frame_id}.hand.txt").write_text(hand_text, encoding="utf-8")
+        (tmp_path / f"{frame_id}.action.txt").write_text(action_text, encoding="utf-8")
+    return tmp_path
+
+
+def _labels(tmp_path):
+    path = tmp_path / "labels.jsonl"
+    rows = [
+        {"frame": "000000", "hero_hand": "AsAd", "villain_position": "UTG", "villain_action": "limp"},
+        {"frame": "000001", "hero_hand": "KcQc", "villain_position": "MP1", "villain_action": "all-in"},
+        {"frame": "000002", "hero_hand": None},
+        {"frame": "000003", "hero_hand": "9s9h", "villain_position": "MP1", "villain_action": "limp"},
+    ]
+    path.write_text("\n".join(json.dumps(row) for row in rows) + "\n", encoding="utf-8")
+    return path
+
+
+def test_replay_source_parses_recorded_ocr_text(tmp_path):
+    source = DebugFrameReplaySource(_debug_dir(tmp_path), hero_position="CO")
+
+    first = source.next_observation()
+    second = source.next_observation()
+    third = source.next_observation()
+
+    assert (first.hero_hand, first.villain_position, first.villain_action) == ("AsAd", "UTG", "limp")
+    assert (second.hero_hand, second.villain_action) == ("KcQc", "all-in")
+    # The unreadable frame is skipped; the last one misreads "limp".
+    assert (third.hero_hand, third.villain_position, third.villain_action) == ("9s9h", "UTG", "fold")
+    assert first.source == "pokerstars-replay"
+    assert source.next_observation() is None
+
+
+def test_benchmark_scores_recorded_frames_against_labels(tmp_path):
+    frames = load_debug_frames(_debug_dir(tmp_path))
+
+    report = run_ocr_benchmark(frames, "CO", labels=load_labels(_labels(tmp_path)))
+
+    assert report.frames == 4
+    assert (report.labeled, report.correct) == (4, 3)
+    assert report.mismatches == ["000003"]
+    assert report.field_correct == {"hero_hand": 4, "villain_position": 2, "villain_action": 2}
+    assert len(report.stage_seconds["parse"]) == 4
+    assert report.stage_seconds["ocr"] == []
+
+    text = format_benchmark_report(report)
+    assert "frames/sec" in text
+    assert "Accuracy: 3/4 frames (75.0%)" in text
+    assert "Mismatched frames: 000003" in text
+
+
+def test_load_debug_frames_and_labels_reject_bad_input(tmp_path):
+    with pytest.raises(ValueError, match="No saved frames"):
+        load_debug_frames(tmp_path)
+
+    labels = tmp_path / "labels.jsonl"
+    labels.write_text('{"hero_hand": "AA"}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="'frame' id"):
+        load_labels(labels)
+
+
+def test_bench_command_prints_report(tmp_path, capsys):
+    main(["bench", "--frames", str(_debug_dir(tmp_path)), "--hero-position", "CO", "--labels", str(_labels(tmp_path))])
+
+    output = capsys.readouterr().out
+    assert "Frames: 4 in" in output
+    assert "parse" in output
+    assert "Accuracy: 3/4 frames" in output
+
+
+def test_frame_ocr_recognizes_regions_concurrently():
+    Image = pytest.importorskip("PIL.Image")
+    both_running = threading.Barrier(2, timeout=5)
+
+    def image_to_string(crop, config=""):
+        # Only returns when the other region is being recognized at the same time.
+        both_running.wait()
+        return "hand" if config == "--psm 7" else "log"
+
+    regions = {
+        "hero_hand": RoiRect(0.0, 0.0, 0.5, 1.0, normalized=True),
+        "action_log": RoiRect(0.5, 0.0, 1.0, 1.0, normalized=True),
+    }
+    reader = FrameOcr(image_to_string, regions, workers=2)
+    try:
+        text = reader.read(Image.new("RGB", (100, 20)))
+    finally:
+        reader.close()
+
+    assert (text.hand_text, text.action_text, text.changed) == ("hand", "log", True)
+
+
+def test_benchmark_ocrs_saved_images(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    colors = [(200, 0, 0), (0, 200, 0)]
+    for index, color in enumerate(colors):
+        Image.new("RGB", (60, 20), color).save(tmp_path / f"{index:06d}.png")
+    texts = {(200, 0, 0): ("As Ad", "UTG limp"), (0, 200, 0): ("Kc Kd", "MP1 all-in")}
+
+    def image_to_string(image):
+        hand_text, action_text = texts[image.convert("RGB").getpixel((0, 0))]
+        return f"{hand_text} {action_text}"
+
+    reader = FrameOcr(image_to_string)
+    labels = {"000001": {"hero_hand": "KcKd", "villain_position": "MP1", "villain_action": "all-in"}}
+
+    report = run_ocr_benchmark(load_debug_frames(tmp_path), "CO", frame_ocr=reader, labels=labels)
+
+    assert report.frames == 2
+    assert report.correct == 1
+    assert len(report.stage_seconds["load"]) == 2
+    assert len(report.stage_seconds["ocr"]) == 2
+    assert report.stage_seconds["diff"] == []
+
+
+def test_frame_prefetcher_grabs_ahead_only_when_asked_and_drops_stale_frames():
+    grabs = []
+
+    def grab():
+        grabs.append(len(grabs))
+        return grabs[-1]
+
+    prefetcher = FramePrefetcher(grab, max_age=0.2)
+    try:
+        assert prefetcher.next()[1] == 0
+        assert prefetcher.next()[1] == 1
+        prefetcher.prefetch()
+        time.sleep(0.01)
+        assert prefetcher.next()[1] == 2
+        prefetcher.prefetch()
+        time.sleep(0.3)
+        # Frame 3 was grabbed ahead but is too old by now; a fresh one is taken.
+        assert prefetcher.next()[1] == 4
+        assert grabs == [0, 1, 2, 3, 4]
+    finally:
+        prefetcher.close()
+
+
+def test_text_only_debug_frames_replay_recorded_text(tmp_path):
+    _debug_dir(tmp_path)
+    for png in tmp_path.glob("*.png"):
+        png.unlink()
+
+    frames = load_debug_frames(tmp_path)
+
+    assert [frame.frame_id for frame in frames] == ["000000", "000001", "000002", "000003"]
+    assert run_ocr_benchmark(frames, "CO").frames == 4
+    with pytest.raises(ValueError, match="--auto-debug-sample"):
+        run_ocr_benchmark(frames, "CO", frame_ocr=FrameOcr(lambda image: ""))
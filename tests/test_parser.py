@@ -1,6 +1,16 @@
 import pytest
 
-from shortdeck_cli.parser import parse_action, parse_flop_cards, parse_hand, parse_position, parse_turn_card
+from shortdeck_cli.auto_ingest import Observation
+from shortdeck_cli.parser import (
+    normalize_observation,
+    parse_action,
+    parse_action_line,
+    parse_flop_cards,
+    parse_hand,
+    parse_position,
+    parse_turn_card,
+    strategy_hand,
+)
 
 
 @pytest.mark.parametrize(
@@ -63,3 +73,31 @@ def test_parse_flop_cards_valid():
 def test_parse_turn_card_blocked_invalid():
     with pytest.raises(ValueError):
         parse_turn_card("As", blocked_cards=["As", "Ad", "Ks", "Qh", "Td"])
+
+
+@pytest.mark.parametrize(
+    "hero_hand,expected",
+    [("AsKd", "AKo"), ("KhAh", "AKs"), ("7c7d", "77"), ("T9o", "T9o"), ("QQ", "QQ")],
+)
+def test_strategy_hand_maps_explicit_hole_cards_to_classes(hero_hand, expected):
+    assert strategy_hand(hero_hand) == expected
+
+
+def test_normalize_observation_resolves_utg_and_validates_villain():
+    utg = normalize_observation(Observation(hero_hand="ksqs", hero_position="utg"))
+    assert (utg.strategy_hand, utg.hero_hand, utg.villain_position, utg.villain_action) == ("KQs", "KsQs", "UTG", "fold")
+
+    spot = normalize_observation(Observation(hero_hand="AKo", hero_position="CO", villain_position="hj", villain_action="Limp"))
+    assert (spot.villain_position, spot.villain_action) == ("HJ", "limp")
+
+    with pytest.raises(ValueError):
+        normalize_observation(Observation(hero_hand="AKo", hero_position="CO"))
+    with pytest.raises(ValueError):
+        normalize_observation(Observation(hero_hand="AKo", hero_position="HJ", villain_position="BTN", villain_action="limp"))
+
+
+def test_parse_action_line():
+    assert parse_action_line("utg limp, MP1: raise; UTG all in") == [("UTG", "limp"), ("MP1", "raise"), ("UTG", "all-in")]
+    assert parse_action_line("") == []
+    with pytest.raises(ValueError):
+        parse_action_line("UTG shove")
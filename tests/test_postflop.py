@@ -1,4 +1,14 @@
-from shortdeck_cli.postflop import analyze_flop, analyze_turn
+import pytest
+
+from shortdeck_cli.postflop import (
+    _analyze_flop_canonical,
+    _analyze_flop_uncached,
+    _analyze_turn_canonical,
+    _analyze_turn_uncached,
+    analyze_flop,
+    analyze_turn,
+    clear_analysis_cache,
+)
 
 
 def test_analyze_flop_returns_expected_fields():
@@ -30,3 +40,70 @@ def test_analyze_turn_returns_expected_fields():
     if result["river_out_details"]:
         assert {"card", "made_hand"}.issubset(result["river_out_details"][0].keys())
     assert result["river_total"] > 0
+
+
+def test_analyze_flop_serves_suit_isomorphic_spots_from_cache():
+    clear_analysis_cache()
+    original = analyze_flop(["As", "Ks"], ["Qs", "Jh", "Td"])
+    relabelled = analyze_flop(["Ah", "Kh"], ["Qh", "Js", "Tc"])
+
+    assert _analyze_flop_canonical.cache_info().hits == 1
+    assert relabelled == _analyze_flop_uncached(["Ah", "Kh"], ["Qh", "Js", "Tc"])
+    assert original == _analyze_flop_uncached(["As", "Ks"], ["Qs", "Jh", "Td"])
+
+
+def test_analyze_turn_translates_cached_cards_back_to_caller_suits():
+    clear_analysis_cache()
+    analyze_turn(["9s", "8s"], ["6s", "Kh", "Td"], "Ac")
+    result = analyze_turn(["9d", "8d"], ["6d", "Kc", "Th"], "As")
+
+    assert _analyze_turn_canonical.cache_info().hits == 1
+    assert result == _analyze_turn_uncached(["9d", "8d"], ["6d", "Kc", "Th"], "As")
+    assert any(item["card"] == "Qd" for item in result["river_out_details"])
+
+
+def test_mutating_a_result_does_not_corrupt_the_cache():
+    clear_analysis_cache()
+    first = analyze_flop(["As", "Ks"], ["Qs", "Jh", "Td"])
+    expected = _analyze_flop_uncached(["As", "Ks"], ["Qs", "Jh", "Td"])
+
+    first["river_by_turn_card"][0]["made_hands"].clear()
+    first["river_category_pct"]["straight"] = -1.0
+    first["river_at_least_pct"].clear()
+
+    assert analyze_flop(["Ah", "Kh"], ["Qh", "Js", "Tc"]) == _analyze_flop_uncached(["Ah", "Kh"], ["Qh", "Js", "Tc"])
+    assert analyze_flop(["As", "Ks"], ["Qs", "Jh", "Td"]) == expected
+
+
+def test_analyze_flop_reports_river_improvement_per_turn_card():
+    result = _analyze_flop_uncached(["9h", "8h"], ["Th", "Jc", "6s"])
+    per_turn = result["river_by_turn_card"]
+
+    assert len(per_turn) == result["turn_total"]
+    assert all(item["river_total"] == result["turn_total"] - 1 for item in per_turn)
+    assert all(sum(item["made_hands"].values()) == item["improve_count"] for item in per_turn)
+
+    # Each improving runout is credited to both of its cards.
+    runouts = result["turn_total"] * (result["turn_total"] - 1) // 2
+    improved_runouts = sum(item["improve_count"] for item in per_turn) / 2
+    assert improved_runouts * 100.0 / runouts == pytest.approx(result["improve_by_river_pct"])
+
+    queen = next(item for item in per_turn if item["card"] == "Qd")
+    assert queen["improve_pct"] == 100.0
+
+
+def test_analyze_flop_returns_final_category_distribution():
+    result = _analyze_flop_uncached(["As", "Ad"], ["Ks", "Qh", "Td"])
+
+    distribution = result["river_category_pct"]
+    assert sum(distribution.values()) == pytest.approx(100.0)
+    assert distribution["High Card"] == 0.0
+
+    better = result["river_better_category_pct"]
+    assert set(better) == {"Two Pair", "Three of a Kind", "Straight", "Full House", "Flush", "Four of a Kind", "Straight Flush"}
+    assert better["Straight"] == distribution["Straight"]
+
+    at_least = result["river_at_least_pct"]
+    assert at_least["High Card"] == pytest.approx(100.0)
+    assert at_least["Straight Flush"] == distribution["Straight Flush"]
+    assert at_least["Straight"] >= at_least["Full House"] >= at_least["Flush"]
@@ -0,0 +1,53 @@
+import pytest
+
+from shortdeck_cli.preflop_equity import DEFAULT_EQUITY_PATH, PreflopEquityMatrix, all_in_equity, load_preflop_equity
+from shortdeck_cli.rules import HAND_CLASSES
+
+
+@pytest.fixture(scope="module")
+def matrix():
+    return PreflopEquityMatrix.load(DEFAULT_EQUITY_PATH)
+
+
+def test_shipped_matrix_loads_and_is_complementary(matrix):
+    assert load_preflop_equity() is not None
+    for hero_class in HAND_CLASSES[::7]:
+        assert matrix.class_equity(hero_class, hero_class) == pytest.approx(0.5, abs=1e-4)
+        for villain_class in HAND_CLASSES[::5]:
+            forward = matrix.class_equity(hero_class, villain_class)
+            backward = matrix.class_equity(villain_class, hero_class)
+            assert forward + backward == pytest.approx(1.0, abs=1e-4)
+
+
+def test_combo_pairs_account_for_card_removal(matrix):
+    assert matrix.combo_pairs("AA", "KK") == 36
+    assert matrix.combo_pairs("AA", "AA") == 6
+    assert matrix.combo_pairs("AKs", "AKs") == 12
+    assert matrix.combo_pairs("AKo", "AA") == 36
+
+
+def test_pairs_dominate_lower_pairs(matrix):
+    assert 0.7 < matrix.class_equity("AA", "KK") < 0.8
+    assert matrix.class_equity("AKs", "AKo") > 0.5
+
+
+def test_range_equity_weights_classes_by_compatible_combos(matrix):
+    assert matrix.range_equity({"AA": 1.0}, {"KK": 1.0}) == pytest.approx(matrix.class_equity("AA", "KK"))
+    mixed = matrix.class_vs_range_equity("QQ", {"AA": 1.0, "76o": 1.0})
+    expected = (36 * matrix.class_equity("QQ", "AA") + 72 * matrix.class_equity("QQ", "76o")) / 108
+    assert mixed == pytest.approx(expected)
+
+
+def test_matrix_cell_matches_exact_enumeration(matrix):
+    pytest.importorskip("numpy")
+    from shortdeck_cli.preflop_equity import _BoardEnumerator, _exact_class_equity
+
+    equity, pair_count = _exact_class_equity(_BoardEnumerator(), "AKs", "T9s")
+    assert pair_count == matrix.combo_pairs("AKs", "T9s")
+    assert matrix.class_equity("AKs", "T9s") == pytest.approx(equity, abs=1e-4)
+
+
+def test_all_in_equity_uses_villain_opening_shove_range():
+    equity = all_in_equity("AA", "UTG")
+    assert equity is not None
+    assert 0.5 < equity < 1.0
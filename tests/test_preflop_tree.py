@@ -0,0 +1,66 @@
+import pytest
+
+from shortdeck_cli.preflop_tree import CLOSED, ROOT, preflop_tree
+
+
+def test_tree_numbers_every_decision_with_a_unique_line_key():
+    tree = preflop_tree()
+
+    keys = {tree.line_key(node_id) for node_id in range(tree.node_count)}
+
+    assert tree.node_count > 1000
+    assert len(keys) == tree.node_count
+    assert tree.line_key(ROOT) == "line:UTG_unopened"
+
+
+def test_child_follows_one_action_per_step():
+    tree = preflop_tree()
+
+    node = tree.child(tree.child(ROOT, "limp"), "limp")
+
+    assert tree.to_act(node) == "MP2"
+    assert tree.facing(node) == "limp"
+    assert tree.legal_actions(node) == ("fold", "limp", "raise", "all-in")
+    assert tree.line_key(node) == "line:MP2_vs_UTG_limp-MP1_limp"
+
+
+def test_mp1_and_mp2_are_distinct_spots():
+    tree = preflop_tree()
+
+    after_mp1 = tree.hero_node("HJ", [("MP1", "limp")])
+    after_mp2 = tree.hero_node("HJ", [("MP2", "limp")])
+
+    assert after_mp1 != after_mp2
+    assert tree.line_key(after_mp1) == "line:HJ_vs_MP1_limp"
+    assert tree.line_key(after_mp2) == "line:HJ_vs_MP2_limp"
+
+
+def test_limp_then_shove_returns_to_the_iso_raiser():
+    tree = preflop_tree()
+
+    node = tree.hero_node("HJ", [("UTG", "limp"), ("HJ", "raise"), ("UTG", "all-in")])
+
+    assert tree.to_act(node) == "HJ"
+    assert tree.legal_actions(node) == ("fold", "call")
+    assert tree.line_key(node) == "line:HJ_vs_UTG_limp-HJ_raise-UTG_all_in"
+    assert tree.history(node) == (
+        ("UTG", "limp"),
+        ("MP1", "fold"),
+        ("MP2", "fold"),
+        ("HJ", "raise"),
+        ("CO", "fold"),
+        ("BTN", "fold"),
+        ("UTG", "all-in"),
+    )
+    assert tree.child(node, "call") == CLOSED
+
+
+def test_walk_rejects_illegal_lines():
+    tree = preflop_tree()
+
+    with pytest.raises(ValueError, match="cannot limp"):
+        tree.walk([("UTG", "raise"), ("MP1", "limp")])
+    with pytest.raises(ValueError, match="no longer in the hand"):
+        tree.hero_node("UTG", [("UTG", "all-in")])
+    with pytest.raises(ValueError, match="closed"):
+        tree.walk([("BTN", "fold")])
@@ -0,0 +1,162 @@
+import json
+import socket
+import threading
+
+import pytest
+
+from shortdeck_cli.evaluator import recommend_action, recommend_line
+from shortdeck_cli.server import RecommendationService, create_server, server_address_label
+from shortdeck_cli.strategy_pack import compile_strategy_pack
+from shortdeck_cli.strategy_registry import StrategyRegistry
+from shortdeck_cli.strategy_reload import StrategyReloader
+
+
+@pytest.fixture
+def running_server():
+    servers = []
+
+    def start(address="127.0.0.1:0"):
+        server = create_server(address, RecommendationService())
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _connect(server):
+    address = server.server_address
+    family = socket.AF_INET if isinstance(address, tuple) else socket.AF_UNIX
+    client = socket.socket(family, socket.SOCK_STREAM)
+    client.connect(address)
+    client.settimeout(5)
+    return client, client.makefile("rb")
+
+
+def test_service_recommend_matches_evaluator():
+    service = RecommendationService()
+
+    result = service.handle({"id": 7, "method": "recommend", "params": {"hero_hand": "AsKd", "hero_position": "UTG"}})
+
+    assert result["id"] == 7
+    assert result["result"]["strategy_hand"] == "AKo"
+    assert (result["result"]["scenario_key"], result["result"]["recommendation"]) == recommend_action("AKo", "UTG", "UTG", "fold")
+
+
+def test_service_line_matches_evaluator():
+    service = RecommendationService()
+
+    result = service.handle(
+        {"id": 1, "method": "line", "params": {"hero_hand": "AsKd", "hero_position": "CO", "line": "UTG limp, MP1 limp"}}
+    )["result"]
+
+    assert result["line"] == [["UTG", "limp"], ["MP1", "limp"]]
+    assert (result["scenario_key"], result["recommendation"]) == recommend_line("AKo", "CO", [("UTG", "limp"), ("MP1", "limp")])
+
+
+def _chart(action, game_format=None):
+    data = {"scenarios": {"open:UTG_rfi": {"hand_actions": {"AA": action}, "default_recommendation": "TBD"}}}
+    if game_format is not None:
+        data["format"] = game_format
+    return data
+
+
+def test_service_reports_revision_only_when_the_reloaded_chart_served(tmp_path):
+    compile_strategy_pack(_chart("fold", "6max-100a"), tmp_path / "packs" / "6max.sdpack")
+    chart = tmp_path / "chart.json"
+    chart.write_text(json.dumps(_chart("call")), encoding="utf-8")
+    service = RecommendationService(
+        registry=StrategyRegistry.from_directory(tmp_path / "packs"), reloader=StrategyReloader(chart)
+    )
+
+    from_registry = service.recommend({"hero_hand": "AA", "hero_position": "UTG", "game_format": "6max-100a"})
+    from_reloader = service.recommend({"hero_hand": "AA", "hero_position": "UTG", "game_format": "5max-50a"})
+
+    assert from_registry["recommendation"] == "Data recommendation: fold (confidence: high)"
+    assert "strategy_revision" not in from_registry
+    assert from_reloader["recommendation"] == "Data recommendation: call (confidence: high)"
+    assert from_reloader["strategy_revision"] == 1
+
+
+def test_service_line_reads_the_registry_chart_for_the_table(tmp_path):
+    data = {
+        "format": "6max-100a",
+        "stack_depth": 60,
+        "scenarios": {"line:CO_vs_UTG_limp-MP1_limp": {"hand_actions": {"AKo": "all-in"}, "default_recommendation": "TBD"}},
+    }
+    compile_strategy_pack(data, tmp_path / "6max.sdpack")
+    service = RecommendationService(registry=StrategyRegistry.from_directory(tmp_path))
+    params = {"hero_hand": "AsKd", "hero_position": "CO", "line": "UTG limp, MP1 limp"}
+
+    from_registry = service.line({**params, "game_format": "6max-100a", "stack_depth": 50})
+    default = service.line({**params, "game_format": "5max-50a"})
+
+    assert (from_registry["scenario_key"], from_registry["recommendation"]) == (
+        "line:CO_vs_UTG_limp-MP1_limp",
+        "Data recommendation: all-in (confidence: high)",
+    )
+    assert (default["scenario_key"], default["recommendation"]) == recommend_line("AKo", "CO", [("UTG", "limp"), ("MP1", "limp")])
+
+
+def test_service_reports_errors_without_raising():
+    service = RecommendationService()
+
+    assert "required" in service.handle({"id": 1, "method": "recommend", "params": {"hero_hand": "AA", "hero_position": "CO"}})["error"]
+    assert service.handle({"id": 2, "method": "nope"})["error"] == "Unknown method: 'nope'"
+    assert "explicit hole cards" in service.handle({"id": 3, "method": "flop", "params": {"hole": "AKo", "flop": "QhJcTs"}})["error"]
+    assert json.loads(service.handle_line("{broken")) == {"id": None, "error": "Invalid JSON."}
+
+
+def test_server_answers_pipelined_requests_in_order(running_server):
+    server = running_server()
+    client, reader = _connect(server)
+    requests = [
+        {"id": 1, "method": "recommend", "params": {"hero_hand": "AA", "hero_position": "CO", "villain_position": "UTG", "villain_action": "limp"}},
+        {"id": 2, "method": "flop", "params": {"hole": "AsKd", "flop": "KsQhTd"}},
+        {"id": 3, "method": "turn", "params": {"hole": "AsKd", "flop": "KsQhTd", "turn": "9c"}},
+        [{"id": 4, "method": "ping"}, {"id": 5, "method": "ping"}],
+    ]
+    client.sendall(b"".join(json.dumps(request).encode() + b"\n" for request in requests))
+
+    responses = [json.loads(reader.readline()) for _ in requests]
+    client.close()
+
+    assert [response["id"] for response in responses[:3]] == [1, 2, 3]
+    assert responses[0]["result"]["scenario_key"] == "vs_limp:CO_vs_UTG_limp"
+    assert responses[1]["result"]["made_hand"] == "One Pair"
+    assert "made_hand" in responses[2]["result"]
+    assert responses[3] == [{"id": 4, "result": "pong"}, {"id": 5, "result": "pong"}]
+
+
+def test_server_handles_concurrent_clients(running_server):
+    server = running_server()
+    first, first_reader = _connect(server)
+    second, second_reader = _connect(server)
+
+    # The first connection stays open and idle while the second is served.
+    first.sendall(b'{"id": "a", "method": "ping"}\n')
+    second.sendall(b'{"id": "b", "method": "ping"}\n')
+
+    assert json.loads(second_reader.readline()) == {"id": "b", "result": "pong"}
+    assert json.loads(first_reader.readline()) == {"id": "a", "result": "pong"}
+    first.close()
+    second.close()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets not available")
+def test_server_listens_on_unix_socket(running_server, tmp_path):
+    server = running_server(f"unix:{tmp_path / 'shortdeck.sock'}")
+    client, reader = _connect(server)
+    client.sendall(b'{"id": 1, "method": "ping"}\n')
+
+    assert json.loads(reader.readline()) == {"id": 1, "result": "pong"}
+    assert server_address_label(server) == f"unix:{tmp_path / 'shortdeck.sock'}"
+    client.close()
+
+
+def test_create_server_rejects_bad_addresses():
+    with pytest.raises(ValueError, match="HOST:PORT"):
+        create_server("localhost", RecommendationService())
@@ -0,0 +1,64 @@
+from shortdeck_cli.evaluator import build_scenario_key, load_strategy_data, load_strategy_index
+from shortdeck_cli.rules import ACTIONS, HAND_CLASSES, POSITIONS
+from shortdeck_cli.strategy_index import action_weights, compile_strategy_index, format_data_recommendation
+
+
+def test_index_matches_direct_json_lookup_for_every_spot_and_hand():
+    index = load_strategy_index()
+    scenarios = load_strategy_data()["scenarios"]
+
+    for hero in POSITIONS:
+        for villain in POSITIONS:
+            for action in ACTIONS:
+                key = build_scenario_key(hero, villain, action)
+                scenario_key, scenario_id = index.spot(hero, villain, action)
+                assert scenario_key == key
+                scenario = scenarios.get(key)
+                for hand_class in HAND_CLASSES:
+                    if scenario and hand_class in scenario["hand_actions"]:
+                        expected = format_data_recommendation(scenario["hand_actions"][hand_class])
+                    elif scenario and scenario["default_recommendation"] != "TBD":
+                        expected = format_data_recommendation(scenario["default_recommendation"])
+                    else:
+                        expected = None
+                    assert index.recommendation(scenario_id, hand_class) == expected
+
+
+def test_index_is_reused_until_strategy_data_changes():
+    assert load_strategy_index() is load_strategy_index()
+
+
+def test_index_stores_sorted_distributions_and_defaults():
+    data = {
+        "scenarios": {
+            "open:UTG_rfi": {
+                "hand_actions": {"AQo": {"call": 0.25, "all-in": 0.75}},
+                "default_recommendation": "fold",
+            }
+        }
+    }
+    index = compile_strategy_index(data, {("UTG", "CO", "fold"): "open:UTG_rfi", ("UTG", "CO", "limp"): "vs_limp:UTG_vs_CO_limp"})
+
+    _, scenario_id = index.spot("UTG", "CO", "fold")
+    assert index.distribution(scenario_id, "AQo") == tuple(action_weights({"call": 0.25, "all-in": 0.75}))
+    assert index.distribution(scenario_id, "AQo")[0] == ("all-in", 75.0)
+    assert index.recommendation(scenario_id, "72o") is None
+    assert index.recommendation(scenario_id, "KQs") == "Data recommendation: fold (confidence: high)"
+    assert index.spot("UTG", "CO", "limp") == ("vs_limp:UTG_vs_CO_limp", -1)
+    assert index.recommendation(-1, "AA") is None
+
+
+def test_index_builds_node_keys_on_first_node_lookup():
+    data = {"scenarios": {"open:UTG_rfi": {"hand_actions": {}, "default_recommendation": "fold"}}}
+    calls = []
+
+    def nodes():
+        calls.append(1)
+        return [("line:UTG_unopened", "open:UTG_rfi"), ("line:MP1_unopened",)]
+
+    index = compile_strategy_index(data, {}, nodes)
+    assert calls == []
+
+    assert index.node(0) == ("open:UTG_rfi", 0)
+    assert index.node(1) == ("line:MP1_unopened", -1)
+    assert calls == [1]
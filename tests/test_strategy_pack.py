@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+from shortdeck_cli.evaluator import load_strategy_data, strategy_spots
+from shortdeck_cli.strategy_index import scenario_row
+from shortdeck_cli.strategy_pack import (
+    DEFAULT_PACK_PATH,
+    DEFAULT_SOURCE_PATH,
+    StrategyPack,
+    compile_strategy_pack,
+    main,
+    pack_source_digest,
+    pack_source_stamp,
+    read_pack_metadata,
+    source_digest,
+    source_stamp,
+)
+
+
+def _sample_data():
+    return {
+        "format": "5max-50a",
+        "scenarios": {
+            "open:UTG_rfi": {
+                "label": "1 - UTG RFI",
+                "hand_actions": {"AA": "call", "AQo": {"fold": 50, "all-in": 50}, "72o": {"call": 0}},
+                "default_recommendation": "TBD",
+            },
+            "vs_limp:CO_vs_HJ_limp": {
+                "label": "CO vs HJ limp",
+                "hand_actions": {"KK": {"call": 0.25, "all-in": 0.75}},
+                "default_recommendation": "fold",
+            },
+        },
+    }
+
+
+def test_pack_round_trips_scenario_rows(tmp_path):
+    data = _sample_data()
+    pack = StrategyPack(compile_strategy_pack(data, tmp_path / "sample.sdpack"))
+
+    assert pack.scenario_keys == ("open:UTG_rfi", "vs_limp:CO_vs_HJ_limp")
+    assert pack.metadata == {"format": "5max-50a"}
+    assert pack.label(1) == "CO vs HJ limp"
+    for scenario_id, scenario in enumerate(data["scenarios"].values()):
+        assert pack.scenario_row(scenario_id) == scenario_row(scenario)
+
+
+def test_pack_index_keeps_tie_order_and_defaults(tmp_path):
+    index = StrategyPack(compile_strategy_pack(_sample_data(), tmp_path / "sample.sdpack")).index(strategy_spots())
+
+    _, open_id = index.spot("UTG", "CO", "fold")
+    assert index.recommendation(open_id, "AQo") == "Data recommendation: 50% fold, 50% all-in (confidence: low)"
+    assert index.recommendation(open_id, "AA") == "Data recommendation: call (confidence: high)"
+    assert index.recommendation(open_id, "KK") is None
+
+    _, limp_id = index.spot("CO", "HJ", "limp")
+    assert index.recommendation(limp_id, "QQ") == "Data recommendation: fold (confidence: high)"
+
+
+def test_shipped_pack_matches_strategy_json():
+    scenarios = load_strategy_data()["scenarios"]
+    pack = StrategyPack(DEFAULT_PACK_PATH)
+
+    assert pack.scenario_keys == tuple(scenarios)
+    for scenario_id, scenario in enumerate(scenarios.values()):
+        assert pack.scenario_row(scenario_id) == scenario_row(scenario)
+
+
+def test_shipped_pack_was_built_from_the_shipped_json():
+    assert pack_source_digest(DEFAULT_PACK_PATH) == source_digest(DEFAULT_SOURCE_PATH)
+
+
+def test_pack_records_source_digest_outside_metadata(tmp_path):
+    source = tmp_path / "sample.json"
+    source.write_bytes(json.dumps(_sample_data()).replace(", ", ",\r\n").encode("utf-8"))
+    path = compile_strategy_pack(_sample_data(), tmp_path / "sample.sdpack", source_digest(source))
+
+    assert StrategyPack(path).source_digest == source_digest(source)
+    assert StrategyPack(path).metadata == read_pack_metadata(path) == {"format": "5max-50a"}
+    source.write_bytes(source.read_bytes().replace(b"\r\n", b"\n"))
+    assert pack_source_digest(path) == source_digest(source)
+    assert pack_source_digest(compile_strategy_pack(_sample_data(), tmp_path / "bare.sdpack")) is None
+
+
+def test_pack_records_source_stamp_and_check_compares_digests(tmp_path, capsys):
+    source = tmp_path / "sample.json"
+    source.write_text(json.dumps(_sample_data()), encoding="utf-8")
+    main(["build", "--source", str(source)])
+    path = source.with_suffix(".sdpack")
+
+    assert pack_source_stamp(path) == source_stamp(source)
+    assert read_pack_metadata(path) == {"format": "5max-50a"}
+    main(["check", "--source", str(source)])
+    assert "is up to date" in capsys.readouterr().out
+
+    source.write_text(json.dumps({**_sample_data(), "format": "6max"}), encoding="utf-8")
+    with pytest.raises(SystemExit) as stale:
+        main(["check", "--source", str(source)])
+    assert stale.value.code == 1
+
+
+def test_pack_rejects_corrupt_files(tmp_path):
+    path = compile_strategy_pack(_sample_data(), tmp_path / "sample.sdpack")
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        StrategyPack(path)
+
+    path.write_bytes(json.dumps(_sample_data()).encode("utf-8"))
+    with pytest.raises(ValueError):
+        StrategyPack(path)
@@ -0,0 +1,114 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from shortdeck_cli.equity import parse_range  # noqa: E402
+from shortdeck_cli.strategy_pack import StrategyPack, compile_strategy_pack  # noqa: E402
+from shortdeck_cli.strategy_query import (  # noqa: E402
+    load_action_matrix,
+    main,
+    matrix_from_data,
+    matrix_from_pack,
+    mixed_hands,
+    pooled_frequencies,
+    scenario_frequencies,
+)
+
+
+def _sample_data():
+    return {
+        "scenarios": {
+            "vs_all_in:CO_vs_HJ_all_in": {
+                "hand_actions": {"AA": "call", "AKs": {"call": 50, "fold": 50}, "AKo": {"fold": 1}},
+                "default_recommendation": "TBD",
+            },
+            "vs_all_in:BTN_vs_CO_all_in": {
+                "hand_actions": {"AKs": {"call": 0.25, "all-in": 0.75}},
+                "default_recommendation": "fold",
+            },
+            "vs_limp:CO_vs_HJ_limp": {"hand_actions": {"KK": "all-in"}, "default_recommendation": "TBD"},
+        }
+    }
+
+
+def test_frequencies_weight_hand_classes_by_combos():
+    matrix = matrix_from_data(_sample_data())
+
+    result = scenario_frequencies(matrix, "vs_all_in:CO_vs_HJ_all_in")[0]
+
+    # AA 6 combos call, AKs 4 combos half call, AKo 12 combos fold.
+    assert result.combos == 22
+    assert result.frequencies == pytest.approx({"fold": 14 / 22, "call": 8 / 22})
+
+
+def test_default_recommendation_covers_unlisted_hands():
+    matrix = matrix_from_data(_sample_data())
+
+    result = scenario_frequencies(matrix, "vs_all_in:BTN_vs_CO_all_in")[0]
+
+    assert result.combos == 630
+    assert result.frequencies == pytest.approx({"fold": 626 / 630, "all-in": 3 / 630, "call": 1 / 630})
+
+
+def test_pooled_frequencies_add_the_combos_of_every_matching_scenario():
+    matrix = matrix_from_data(_sample_data())
+
+    pooled = pooled_frequencies(matrix, "vs_all_in:*")
+
+    assert [result.label for result in scenario_frequencies(matrix, "vs_all_in:*")] == [
+        "vs_all_in:CO_vs_HJ_all_in",
+        "vs_all_in:BTN_vs_CO_all_in",
+    ]
+    assert pooled.combos == 652
+    assert pooled.frequencies["fold"] == pytest.approx((14 + 626) / 652)
+
+
+def test_hands_restrict_and_weight_the_range():
+    matrix = matrix_from_data(_sample_data())
+
+    result = scenario_frequencies(matrix, "vs_all_in:CO_vs_HJ_all_in", hands=parse_range("AKs, AKo:0.5"))[0]
+
+    assert result.combos == 10
+    assert result.frequencies == pytest.approx({"fold": 8 / 10, "call": 2 / 10})
+
+
+def test_percent_hand_weights_scale_combos():
+    matrix = matrix_from_data(_sample_data())
+
+    result = scenario_frequencies(matrix, "vs_all_in:CO_vs_HJ_all_in", hands=parse_range("AA:1%"))[0]
+
+    assert result.combos == pytest.approx(0.06)
+
+
+def test_mixed_hands_lists_the_scenarios_where_a_hand_mixes():
+    matrix = matrix_from_data(_sample_data())
+
+    assert mixed_hands(matrix, ["call", "fold"]) == {"AKs": ("vs_all_in:CO_vs_HJ_all_in",)}
+    assert mixed_hands(matrix, ["all-in", "call"], "vs_all_in:*") == {"AKs": ("vs_all_in:BTN_vs_CO_all_in",)}
+    assert mixed_hands(matrix, ["call", "fold"], min_frequency=0.5) == {}
+    with pytest.raises(ValueError, match="does not occur"):
+        mixed_hands(matrix, ["raise"])
+    with pytest.raises(ValueError, match="No scenario matches"):
+        mixed_hands(matrix, ["call"], "open:*")
+
+
+def test_pack_matrix_matches_json_matrix(tmp_path):
+    data = _sample_data()
+    from_json = matrix_from_data(data)
+    from_pack = matrix_from_pack(StrategyPack(compile_strategy_pack(data, tmp_path / "sample.sdpack")))
+
+    assert from_pack.scenario_keys == from_json.scenario_keys
+    assert np.array_equal(from_pack.covered, from_json.covered)
+    order = [from_pack.actions.index(action) for action in from_json.actions]
+    assert np.allclose(from_pack.frequencies[:, :, order], from_json.frequencies)
+
+
+def test_shipped_strategy_loads_and_main_prints_frequencies(capsys):
+    matrix = load_action_matrix()
+    assert matrix.covered.all()
+
+    main(["freq", "vs_limp:CO_vs_HJ_limp"])
+
+    output = capsys.readouterr().out
+    assert output.startswith("vs_limp:CO_vs_HJ_limp: 630 combos, ")
+    assert output.count("\n") == 1
@@ -0,0 +1,62 @@
+import pytest
+
+from shortdeck_cli.evaluator import load_strategy_index, recommend_action
+from shortdeck_cli.strategy_pack import compile_strategy_pack
+from shortdeck_cli.strategy_registry import StrategyRegistry
+
+
+def _write_pack(directory, name, game_format, stack_depth, action):
+    data = {
+        "format": game_format,
+        "stack_depth": stack_depth,
+        "scenarios": {
+            "open:UTG_rfi": {"label": name, "hand_actions": {"AA": action}, "default_recommendation": "TBD"},
+        },
+    }
+    return compile_strategy_pack(data, directory / f"{name}.sdpack")
+
+
+def _registry(tmp_path, capacity=4):
+    _write_pack(tmp_path, "ante50_100bb", "5max-50a", 100, "call")
+    _write_pack(tmp_path, "ante50_40bb", "5max-50a", 40, "all-in")
+    _write_pack(tmp_path, "ante100", "6max-100a", None, "fold")
+    return StrategyRegistry.from_directory(tmp_path, capacity=capacity)
+
+
+def _aa_open(registry, game_format, stack_depth=None):
+    return recommend_action("AA", "UTG", "UTG", "fold", strategy=registry.select(game_format, stack_depth))[1]
+
+
+def test_registry_picks_pack_by_format_and_closest_stack_depth(tmp_path):
+    registry = _registry(tmp_path)
+
+    assert sorted(registry.keys(), key=str) == [("5max-50a", 100), ("5max-50a", 40), ("6max-100a", None)]
+    assert _aa_open(registry, "5max-50a", 100) == "Data recommendation: call (confidence: high)"
+    assert _aa_open(registry, "5max-50a", 30) == "Data recommendation: all-in (confidence: high)"
+    assert _aa_open(registry, "6max-100a", 60) == "Data recommendation: fold (confidence: high)"
+
+
+def test_registry_falls_back_to_shipped_strategy_for_unknown_tables(tmp_path):
+    registry = _registry(tmp_path)
+
+    assert registry.select("9max", 100) is load_strategy_index()
+    assert registry.select() is load_strategy_index()
+
+
+def test_registry_keeps_a_bounded_lru_of_loaded_packs(tmp_path):
+    registry = _registry(tmp_path, capacity=2)
+
+    first = registry.select("5max-50a", 100)
+    registry.select("5max-50a", 40)
+    assert registry.select("5max-50a", 100) is first
+    registry.select("6max-100a")
+
+    assert registry.loaded_keys() == [("5max-50a", 100), ("6max-100a", None)]
+
+
+def test_registry_rejects_duplicate_packs(tmp_path):
+    _write_pack(tmp_path, "a", "5max-50a", 100, "call")
+    _write_pack(tmp_path, "b", "5max-50a", 100, "fold")
+
+    with pytest.raises(ValueError):
+        StrategyRegistry.from_directory(tmp_path)
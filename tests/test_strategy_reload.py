@@ -0,0 +1,72 @@
+import json
+
+from shortdeck_cli.evaluator import recommend_action
+from shortdeck_cli.strategy_pack import StrategyPack, compile_strategy_pack
+from shortdeck_cli.strategy_reload import StrategyReloader
+
+
+def _chart(action):
+    return {
+        "format": "5max-50a",
+        "scenarios": {
+            "open:UTG_rfi": {"label": "UTG RFI", "hand_actions": {"AA": action}, "default_recommendation": "TBD"},
+        },
+    }
+
+
+def _aa_open(reloader):
+    revision, index = reloader.current()
+    return revision, recommend_action("AA", "UTG", "UTG", "fold", strategy=index)[1]
+
+
+def test_reloader_swaps_in_new_revision_when_json_changes(tmp_path):
+    path = tmp_path / "chart.json"
+    path.write_text(json.dumps(_chart("call")), encoding="utf-8")
+    reloader = StrategyReloader(path)
+
+    assert reloader.check() is False
+    assert _aa_open(reloader) == (1, "Data recommendation: call (confidence: high)")
+
+    path.write_text(json.dumps(_chart("all-in")), encoding="utf-8")
+    assert reloader.check() is True
+    assert _aa_open(reloader) == (2, "Data recommendation: all-in (confidence: high)")
+
+
+def test_reloader_keeps_previous_revision_when_file_is_broken(tmp_path):
+    path = tmp_path / "chart.json"
+    path.write_text(json.dumps(_chart("call")), encoding="utf-8")
+    reloader = StrategyReloader(path)
+
+    path.write_text('{"scenarios": {', encoding="utf-8")
+    assert reloader.check() is False
+    assert reloader.last_error
+    assert _aa_open(reloader) == (1, "Data recommendation: call (confidence: high)")
+
+    path.write_text(json.dumps(_chart("fold")), encoding="utf-8")
+    assert reloader.check() is True
+    assert reloader.last_error is None
+    assert _aa_open(reloader)[0] == 2
+
+
+def test_recompiling_a_mapped_pack_leaves_the_old_index_readable(tmp_path):
+    path = compile_strategy_pack(_chart("call"), tmp_path / "chart.sdpack")
+    old_pack = StrategyPack(path)
+    reloader = StrategyReloader(path)
+
+    compile_strategy_pack(_chart("all-in"), path)
+
+    assert old_pack.scenario_row(0)[0] == (("call", 100.0),)
+    assert reloader.check() is True
+    assert _aa_open(reloader) == (2, "Data recommendation: all-in (confidence: high)")
+
+
+def test_reloaded_packs_do_not_keep_the_file_mapped(tmp_path):
+    path = compile_strategy_pack(_chart("call"), tmp_path / "chart.sdpack")
+    reloader = StrategyReloader(path)
+    pack = StrategyPack(path, in_memory=True)
+
+    # Overwriting in place (same inode) would tear a mapped pack.
+    path.write_bytes(b"\0" * path.stat().st_size)
+
+    assert pack.scenario_row(0)[0] == (("call", 100.0),)
+    assert _aa_open(reloader) == (1, "Data recommendation: call (confidence: high)")
@@ -0,0 +1,20 @@
+from shortdeck_cli.suit_isomorphism import canonicalize, invert_suit_map, translate_card
+
+
+def test_suit_relabelled_spots_share_a_canonical_key():
+    first, _ = canonicalize((["As", "Ks"], ["Qs", "Jh", "Td"]))
+    second, _ = canonicalize((["Kh", "Ah"], ["Tc", "Qh", "Js"]))
+    assert first == second
+
+
+def test_different_spots_keep_different_keys():
+    suited, _ = canonicalize((["As", "Ks"], ["Qs", "Jh", "Td"]))
+    offsuit, _ = canonicalize((["As", "Kh"], ["Qs", "Jh", "Td"]))
+    assert suited != offsuit
+
+
+def test_suit_map_round_trips_cards():
+    (hole, board), to_canonical = canonicalize((["Ad", "Kd"], ["Qd", "Jc", "Ts"]))
+    back = invert_suit_map(to_canonical)
+    assert sorted(translate_card(card, back) for card in hole) == sorted(["Ad", "Kd"])
+    assert sorted(translate_card(card, back) for card in board) == sorted(["Qd", "Jc", "Ts"])